@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Optional build step: compile the extractor post-processing modules with Cython.
+
+The modules are built in place, so the compiled extension sits next to its
+source and is picked up by the normal import system; when no extension has been
+built, the plain Python source is imported as before. Nothing else in the
+application depends on this step.
+
+Python imports a built extension in preference to the .py source next to it, so
+after editing one of COMPILED_MODULES the extensions must be rebuilt, or removed
+with the clean command, before the edit takes effect.
+
+Usage:
+    pip install cython
+    python compile_extensions.py build_ext --inplace
+    python compile_extensions.py clean
+"""
+
+import glob
+import logging
+import os
+import shutil
+import sys
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Modules whose post-processing loops (dict .get() chains, isinstance checks) run per entry
+COMPILED_MODULES = [
+    "matchai/base_plugins/education_extractor/__init__.py",
+    "matchai/base_plugins/experience_extractor/__init__.py",
+]
+
+def clean():
+    """Remove the extensions, generated C sources and build directory of COMPILED_MODULES."""
+    for module in COMPILED_MODULES:
+        base = os.path.splitext(module)[0]
+        for path in glob.glob(base + ".c") + glob.glob(base + ".*.so") + glob.glob(base + ".*.pyd"):
+            os.remove(path)
+            logger.info(f"Removed {path}")
+    shutil.rmtree("build", ignore_errors=True)
+    return 0
+
+def main():
+    """Cythonize COMPILED_MODULES in place."""
+    if sys.argv[1:] == ["clean"]:
+        return clean()
+    try:
+        from Cython.Build import cythonize
+        from setuptools import setup
+    except ImportError:
+        logger.warning("Cython is not installed; the pure-Python modules will be used.")
+        return 0
+
+    setup(
+        name="matchai-compiled-extractors",
+        ext_modules=cythonize(
+            COMPILED_MODULES,
+            compiler_directives={"language_level": 3, "boundscheck": False},
+        ),
+        script_args=sys.argv[1:] or ["build_ext", "--inplace"],
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,87 +15,12 @@ class ResourceRepository:
     def __init__(self):
         logger.info("ResourceRepository initialized.")
 
-    def get_resources_by_type1(self, resource_type: str, organization_id: Optional[str] = None, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """
-        Retrieves a list of resources filtered by type and optionally by organization_id and user_id.
-        This method implements the full RBAC query for menus accessible by a specific user.
-        """
-        session = get_db_session()
-        try:
-            if user_id is None: 
-                logger.warning("Attempted to get menu items without user_id. Returning empty list.")
-                return []
-
-            sql_query = """
-            SELECT
-                r.id,
-                r.name,
-                r.display_name,
-                r.path,
-                r.icon,
-                r.parent_id,
-                r.order_index,
-                r.orgid,
-                r.is_active
-            FROM
-                resources r
-            JOIN
-                role_permissions rp ON rp.resource_id = r.id     
-            JOIN
-                permissions p ON rp.permission_id = p.id         
-            JOIN
-                user_roles ur ON ur.role_id = rp.roleid          
-            JOIN
-                users u ON u.id = ur.user_id                     
-            WHERE
-                u.id = :user_id_param                            
-                AND p.name = :permission_name_filter             
-                AND r.resource_type = :resource_type_filter      
-                AND r.is_active = TRUE                           
-                AND (
-                    r.orgid IS NULL                              
-                    OR r.orgid = u.organization_id               
-                )
-            ORDER BY
-                r.parent_id NULLS FIRST, r.order_index ASC;
-            """
-            
-            params = {
-                'user_id_param': user_id,
-                'permission_name_filter': 'execute', # Default permission for menu viewing
-                'resource_type_filter': resource_type # e.g., 'MENU'
-            }
-
-            # logger.debug(f"Executing SQL query for menu items:\n{sql_query}\nWith params: {params}")
-            results = session.execute(text(sql_query), params).fetchall()
-            
-            resources = []
-            for row in results:
-                resources.append({
-                    "id": row.id,
-                    "resourceType": resource_type, # Use input param for consistency
-                    "name": row.name,
-                    "displayName": row.display_name,
-                    "path": row.path,
-                    "icon": row.icon,
-                    "parentId": row.parent_id,
-                    "orderIndex": row.order_index,
-                    "isActive": row.is_active,
-                    "orgId": row.orgid # Access by attribute
-                })
-            # logger.info(f"Retrieved {len(resources)} resources of type '{resource_type}' for user {user_id} in org '{organization_id if organization_id else 'global'}'.")
-            return resources
-        except Exception as e:
-            logger.error(f"Error getting resources by type '{resource_type}' for user {user_id} in org '{organization_id if organization_id else 'global'}': {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
-            
-
     def get_resources_by_type(self, resource_type: str, organization_id: Optional[str] = None, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieves a list of resources filtered by type and optionally by organization_id and user_id.
         This method implements the full RBAC query for menus accessible by a specific user.
+        The JSON objects are assembled by Postgres (json_agg/json_build_object), so the driver
+        hands back a ready-made list instead of one row per resource.
         """
         session = get_db_session()
         try:
@@ -105,15 +30,24 @@ class ResourceRepository:
 
             sql_query = """
             SELECT
-                r.id,
-                r.name,
-                r.display_name,
-                r.path,
-                r.icon,
-                r.parent_id,
-                r.order_index,
-                r.orgid,
-                r.is_active
+                COALESCE(
+                    json_agg(
+                        json_build_object(
+                            'id', r.id,
+                            'resourceType', CAST(:resource_type_filter AS TEXT),
+                            'name', r.name,
+                            'displayName', r.display_name,
+                            'path', r.path,
+                            'icon', r.icon,
+                            'parentId', r.parent_id,
+                            'orderIndex', r.order_index,
+                            'isActive', r.is_active,
+                            'orgId', r.orgid
+                        )
+                        ORDER BY r.order_index ASC
+                    ),
+                    '[]'::json
+                ) AS resources
             FROM
                 resources r
             JOIN
@@ -128,11 +62,8 @@ class ResourceRepository:
                 u.id = :user_id_param                            
                 AND p.name = :permission_name_filter             
                 AND r.resource_type = :resource_type_filter      
-                AND r.is_active = TRUE                           
-            ORDER BY
-                r.order_index ASC;
+                AND r.is_active = TRUE;
             """
-            # r.parent_id NULLS FIRST, r.order_index ASC;
             params = {
                 'user_id_param': user_id,
                 'permission_name_filter': 'execute', # Default permission for menu viewing
@@ -140,22 +71,8 @@ class ResourceRepository:
             }
 
             # logger.debug(f"Executing SQL query for menu items:\n{sql_query}\nWith params: {params}")
-            results = session.execute(text(sql_query), params).fetchall()
-            
-            resources = []
-            for row in results:
-                resources.append({
-                    "id": row.id,
-                    "resourceType": resource_type, # Use input param for consistency
-                    "name": row.name,
-                    "displayName": row.display_name,
-                    "path": row.path,
-                    "icon": row.icon,
-                    "parentId": row.parent_id,
-                    "orderIndex": row.order_index,
-                    "isActive": row.is_active,
-                    "orgId": row.orgid # Access by attribute
-                })
+            # psycopg2 decodes the json column, so this is already a list of dicts
+            resources = session.execute(text(sql_query), params).scalar() or []
             # logger.info(f"Retrieved {len(resources)} resources of type '{resource_type}' for user {user_id} in org '{organization_id if organization_id else 'global'}'.")
             return resources
         except Exception as e:
@@ -164,65 +81,52 @@ class ResourceRepository:
         finally:
             session.close()            
 
-    def get_resources_by_typev1(self, resource_type: str, organization_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def add_resources_bulk(self, resources: List[Dict[str, Any]]) -> List[int]:
         """
-        Retrieves a list of resources filtered by type and optionally by organization_id.
-        If organization_id is provided, it retrieves resources global to all (orgId IS NULL)
-        and resources specific to that organization.
-        """
-        session = get_db_session()
-        try:
-            where_clauses = ["resource_type = :resource_type", "is_active = TRUE"]
-            params = {'resource_type': resource_type}
-
-            if organization_id:
-                where_clauses.append("(orgid IS NULL OR orgid = :organization_id)") # CRITICAL FIX: Use orgid
-                params['organization_id'] = organization_id
-            else:
-                where_clauses.append("orgid IS NULL") # CRITICAL FIX: Use orgid
+        Adds (or updates, on name conflict) many resources with a single multi-row
+        INSERT ... ON CONFLICT ... RETURNING statement, i.e. one round-trip.
 
-            query = text(f"""
-                SELECT id, resource_type, name, display_name, path, icon, parent_id, order_index, is_active, orgid -- CRITICAL FIX: Use orgid (lowercase, no quotes needed, or "orgid")
-                FROM resources
-                WHERE {' AND '.join(where_clauses)}
-                ORDER BY parent_id NULLS FIRST, order_index ASC;
-            """)
-            
-            results = session.execute(query, params).fetchall()
-            
-            resources = []
-            for row in results:
-                resources.append({
-                    "id": row.id,
-                    "resourceType": row.resource_type,
-                    "name": row.name,
-                    "displayName": row.display_name,
-                    "path": row.path,
-                    "icon": row.icon,
-                    "orgId": row.orgid, # CRITICAL FIX: Access by row.orgid
-                    "parentId": row.parent_id,
-                    "orderIndex": row.order_index,
-                    "isActive": row.is_active
-                })
-            logger.info(f"Retrieved {len(resources)} resources of type '{resource_type}' for org '{organization_id if organization_id else 'global'}'.")
-            return resources
-        except Exception as e:
-            logger.error(f"Error getting resources by type '{resource_type}' for org '{organization_id if organization_id else 'global'}': {e}", exc_info=True)
-            raise
-        finally:
-            session.close()
+        Args:
+            resources (List[Dict[str, Any]]): Dicts with keys resource_type, name, display_name and
+                optionally path, icon, parent_id, order_index, is_active (default True), org_id.
+        Returns:
+            List[int]: The resource IDs, in the order of the de-duplicated input
+            (a repeated name keeps its last definition, as sequential upserts would).
+        """
+        if not resources:
+            return []
 
+        # Postgres rejects an upsert that touches the same row twice in one statement
+        by_name = {}
+        for resource in resources:
+            by_name.pop(resource['name'], None)
+            by_name[resource['name']] = resource
+        rows = list(by_name.values())
 
-    def add_resource(self, resource_type: str, name: str, display_name: str, path: Optional[str] = None, icon: Optional[str] = None, parent_id: Optional[int] = None, order_index: Optional[int] = None, is_active: bool = True, org_id: Optional[str] = None) -> int:
-        """
-        Adds a new resource to the database, including orgId.
-        Updates existing resource if name conflicts.
-        """
         session = get_db_session()
         try:
-            query = text("""
-                INSERT INTO resources (resource_type, name, display_name, path, icon, parent_id, order_index, is_active, orgid) -- CRITICAL FIX: Use orgid here too
-                VALUES (:resource_type, :name, :display_name, :path, :icon, :parent_id, :order_index, :is_active, :org_id)
+            values_clauses = []
+            params = {}
+            for i, resource in enumerate(rows):
+                values_clauses.append(
+                    f"(:resource_type_{i}, :name_{i}, :display_name_{i}, :path_{i}, :icon_{i}, "
+                    f":parent_id_{i}, :order_index_{i}, :is_active_{i}, :org_id_{i})"
+                )
+                params.update({
+                    f'resource_type_{i}': resource['resource_type'],
+                    f'name_{i}': resource['name'],
+                    f'display_name_{i}': resource['display_name'],
+                    f'path_{i}': resource.get('path'),
+                    f'icon_{i}': resource.get('icon'),
+                    f'parent_id_{i}': resource.get('parent_id'),
+                    f'order_index_{i}': resource.get('order_index'),
+                    f'is_active_{i}': resource.get('is_active', True),
+                    f'org_id_{i}': resource.get('org_id')
+                })
+
+            query = text(f"""
+                INSERT INTO resources (resource_type, name, display_name, path, icon, parent_id, order_index, is_active, orgid)
+                VALUES {', '.join(values_clauses)}
                 ON CONFLICT (name) DO UPDATE SET
                     display_name = EXCLUDED.display_name,
                     path = EXCLUDED.path,
@@ -230,22 +134,33 @@ class ResourceRepository:
                     parent_id = EXCLUDED.parent_id,
                     order_index = EXCLUDED.order_index,
                     is_active = EXCLUDED.is_active,
-                    orgid = EXCLUDED.orgid, -- CRITICAL FIX: Use orgid here too
+                    orgid = EXCLUDED.orgid,
                     updated_at = CURRENT_TIMESTAMP
-                RETURNING id;
+                RETURNING id, name;
             """)
-            result = session.execute(query, {
-                'resource_type': resource_type, 'name': name, 'display_name': display_name,
-                'path': path, 'icon': icon, 'parent_id': parent_id,
-                'order_index': order_index, 'is_active': is_active, 'org_id': org_id
-            })
+            returned = session.execute(query, params).fetchall()
             session.commit()
-            resource_id = result.scalar_one()
-            logger.info(f"Resource '{name}' (ID: {resource_id}, Org: {org_id if org_id else 'Global'}) added/updated successfully.")
-            return resource_id
+            # RETURNING order is not guaranteed, so map back by the unique name
+            ids_by_name = {row.name: row.id for row in returned}
+            resource_ids = [ids_by_name[resource['name']] for resource in rows]
+            logger.info(f"{len(resource_ids)} resources added/updated successfully.")
+            return resource_ids
         except Exception as e:
             session.rollback()
-            logger.error(f"Error adding resource '{name}' (Org: {org_id if org_id else 'Global'}): {e}", exc_info=True)
+            logger.error(f"Error bulk adding {len(rows)} resources: {e}", exc_info=True)
             raise
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+
+    def add_resource(self, resource_type: str, name: str, display_name: str, path: Optional[str] = None, icon: Optional[str] = None, parent_id: Optional[int] = None, order_index: Optional[int] = None, is_active: bool = True, org_id: Optional[str] = None) -> int:
+        """
+        Adds a new resource to the database, including orgId.
+        Updates existing resource if name conflicts.
+        """
+        resource_id = self.add_resources_bulk([{
+            'resource_type': resource_type, 'name': name, 'display_name': display_name,
+            'path': path, 'icon': icon, 'parent_id': parent_id,
+            'order_index': order_index, 'is_active': is_active, 'org_id': org_id
+        }])[0]
+        logger.info(f"Resource '{name}' (ID: {resource_id}, Org: {org_id if org_id else 'Global'}) added/updated successfully.")
+        return resource_id
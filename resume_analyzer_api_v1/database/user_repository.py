@@ -3,11 +3,14 @@
 import logging
 from sqlalchemy import text
 from database.postgres_manager import get_db_session
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 # logger.setLevel(logging.INFO) # Inherit from root or set explicitly
 
+# Firebase UIDs (including custom-token / Admin SDK ones) are 1-128 ASCII chars.
+FIREBASE_UID_MAX_LENGTH = 128
+
 class UserRepository:
     """
     Data Access Layer for User entities.
@@ -15,8 +18,24 @@ class UserRepository:
     def __init__(self):
         logger.info("UserRepository initialized.")
 
+    @staticmethod
+    def _is_plausible_firebase_uid(firebase_uid: str) -> bool:
+        """Cheap shape check for a Firebase UID, done before touching the DB."""
+        return (
+            isinstance(firebase_uid, str)
+            and 0 < len(firebase_uid) <= FIREBASE_UID_MAX_LENGTH
+            and firebase_uid.isascii()
+        )
+
     def get_user_by_firebase_uid(self, firebase_uid: str) -> Optional[Dict[str, Any]]:
-        """Retrieves a user by their Firebase UID."""
+        """
+        Retrieves a user by their Firebase UID.
+        Malformed UIDs return None without a DB query.
+        """
+        if not self._is_plausible_firebase_uid(firebase_uid):
+            logger.warning("Rejected malformed Firebase UID without querying the database.")
+            return None
+
         session = get_db_session()
         try:
             query = text("SELECT id, firebase_uid, email, organization_id, is_active FROM users WHERE firebase_uid = :firebase_uid;")
@@ -85,38 +104,59 @@ class UserRepository:
         finally:
             session.close()
             
-    def assign_role_to_user(self, user_id: int, role_id: str, assigned_by: str) -> bool: # NEW METHOD
+    def assign_roles_bulk(self, assignments: List[Tuple[int, str]], assigned_by: str) -> List[Tuple[int, str]]:
         """
-        Assigns a role to a user.
+        Assigns many (user_id, role_id) pairs with a single multi-row INSERT, i.e. one round-trip.
         Args:
-            user_id (int): The internal database ID of the user.
-            role_id (str): The ID of the role (e.g., 'RECRUITER', 'ADMIN').
-            assigned_by (str): The identifier of the user/system assigning the role.
+            assignments (List[Tuple[int, str]]): (user_id, role_id) pairs to assign.
+            assigned_by (str): The identifier of the user/system assigning the roles.
         Returns:
-            bool: True if role assigned, False if already assigned.
+            List[Tuple[int, str]]: The pairs that were newly assigned (already-assigned pairs are skipped).
         """
+        # ON CONFLICT DO NOTHING still rejects duplicates within one statement's VALUES list
+        unique_assignments = list(dict.fromkeys(assignments))
+        if not unique_assignments:
+            return []
+
         session = get_db_session()
         try:
-            query = text("""
+            values_clauses = []
+            params = {'created_by': assigned_by}
+            for i, (user_id, role_id) in enumerate(unique_assignments):
+                values_clauses.append(f"(:user_id_{i}, :role_id_{i}, :created_by)")
+                params[f'user_id_{i}'] = user_id
+                params[f'role_id_{i}'] = role_id
+
+            query = text(f"""
                 INSERT INTO user_roles (user_id, role_id, created_by)
-                VALUES (:user_id, :role_id, :created_by)
-                ON CONFLICT (user_id, role_id) DO NOTHING;
+                VALUES {', '.join(values_clauses)}
+                ON CONFLICT (user_id, role_id) DO NOTHING
+                RETURNING user_id, role_id;
             """)
-            result = session.execute(query, {
-                'user_id': user_id,
-                'role_id': role_id,
-                'created_by': assigned_by
-            })
+            inserted = [(row.user_id, row.role_id) for row in session.execute(query, params).fetchall()]
             session.commit()
-            is_assigned = result.rowcount > 0
-            if is_assigned:
-                logger.info(f"Role '{role_id}' assigned to user ID {user_id} by {assigned_by}.")
-            else:
-                logger.info(f"Role '{role_id}' already assigned to user ID {user_id}.")
-            return is_assigned
+            logger.info(f"{len(inserted)} of {len(unique_assignments)} role assignments made by {assigned_by}.")
+            return inserted
         except Exception as e:
             session.rollback()
-            logger.error(f"Error assigning role '{role_id}' to user {user_id}: {e}", exc_info=True)
+            logger.error(f"Error bulk assigning {len(unique_assignments)} roles: {e}", exc_info=True)
             raise
         finally:
-            session.close()            
\ No newline at end of file
+            session.close()
+
+    def assign_role_to_user(self, user_id: int, role_id: str, assigned_by: str) -> bool: # NEW METHOD
+        """
+        Assigns a role to a user.
+        Args:
+            user_id (int): The internal database ID of the user.
+            role_id (str): The ID of the role (e.g., 'RECRUITER', 'ADMIN').
+            assigned_by (str): The identifier of the user/system assigning the role.
+        Returns:
+            bool: True if role assigned, False if already assigned.
+        """
+        is_assigned = bool(self.assign_roles_bulk([(user_id, role_id)], assigned_by))
+        if is_assigned:
+            logger.info(f"Role '{role_id}' assigned to user ID {user_id} by {assigned_by}.")
+        else:
+            logger.info(f"Role '{role_id}' already assigned to user ID {user_id}.")
+        return is_assigned
@@ -345,3 +345,11 @@ ADD CONSTRAINT fk_bulk_upload_job_id
 FOREIGN KEY (job_id)
 REFERENCES job_descriptions(id)
 ON DELETE SET NULL;
+
+
+-- Covering index for the RBAC menu query (ResourceRepository.get_resources_by_type).
+-- Lets Postgres answer the resources side of the join with an index-only scan.
+-- user_roles and role_permissions need no extra index: their primary keys
+-- (user_id, role_id) and (roleid, permission_id, resource_id) already cover the join.
+CREATE INDEX IF NOT EXISTS idx_resources_rbac ON resources (resource_type, is_active, orgid)
+    INCLUDE (id, name, display_name, path, icon, parent_id, order_index);
@@ -3,21 +3,27 @@ MatchAI - AI-powered resume analysis and parsing
 
 A powerful tool for extracting structured information from resumes using Google's Gemini LLM.
 """
+from ._lazy import lazy_exports
 
 __version__ = "0.1.0"
 
-# Export the client class
-from .client import MatchAIClient
+# Exported name -> submodule, imported on first attribute access. The client and the
+# high-level functions pull in LangChain and the models, so importing the package
+# (e.g. for the CLI's --help) stays cheap until one of them is used.
+_LAZY_EXPORTS = {
+    # Client class
+    'MatchAIClient': '.client',
+    # High-level functions for direct use
+    'extract_all': '.api',
+    'extract_profile': '.api',
+    'extract_education': '.api',
+    'extract_experience': '.api',
+    'extract_skills': '.api',
+    'extract_years_of_experience': '.api',
+    'analyze_resume': '.api',
+    'list_all_plugins': '.api',
+    'list_plugins_by_category': '.api'
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(globals(), _LAZY_EXPORTS)
 
-# Import high-level functions for direct use
-from .api import (
-    extract_all,
-    extract_profile,
-    extract_education,
-    extract_experience,
-    extract_skills,
-    extract_years_of_experience,
-    analyze_resume,
-    list_all_plugins,
-    list_plugins_by_category
-) 
\ No newline at end of file
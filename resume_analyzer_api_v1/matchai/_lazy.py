@@ -0,0 +1,40 @@
+"""Lazily imported package exports (PEP 562), shared by the matchai packages."""
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def lazy_exports(module_globals: Dict[str, Any], exports: Dict[str, str],
+                 renamed: Optional[Dict[str, str]] = None,
+                 eager: Sequence[str] = ()) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Build the module-level __getattr__, __dir__ and __all__ of a package whose exports
+    are imported from their submodules on first access.
+
+    This module imports nothing heavy, so packages can use it without losing the
+    cheap import the lazy exports are there for.
+
+    Args:
+        module_globals: The package's globals(); each export is cached there once imported.
+        exports: Exported name -> relative submodule defining it.
+        renamed: Exported name -> its name in the submodule, for names that differ.
+        eager: Public names the package defines itself, listed first in __all__.
+
+    Returns:
+        A tuple of (__getattr__, __dir__, __all__) for the package.
+    """
+    package = module_globals["__name__"]
+    renamed = renamed or {}
+    public_names = [*eager, *exports]
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), renamed.get(name, name))
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*module_globals, *public_names})
+
+    return __getattr__, __dir__, public_names
@@ -2,18 +2,21 @@
 import os
 import asyncio
 import pathlib
+from datetime import datetime
 from typing import Union, Dict, List, Any, Optional, Tuple
 
 # Import internal modules
 from .core.resume_processor import PluginResumeProcessor as ResumeProcessor
 from .core.llm_service import LLMService
 from .base_plugins.plugin_manager import PluginManager
+from .core.utils.json_utils import write_json_background
 from .models.resume_models import (
     ResumeProfile as Profile,
     Education,
     Experience,
     Skills,
-    Resume as ResumeData
+    Resume as ResumeData,
+    dump_model_list
 )
 
 # Global instances for reuse
@@ -64,25 +67,23 @@ def _get_processor():
         _processor = ResumeProcessor(plugin_manager=_get_plugin_manager())
     return _processor
 
-def extract_all(file_path: str, log_token_usage: bool = True) -> Dict[str, Any]:
+def extract_all(file_path: str, log_token_usage: bool = True, fused: Optional[bool] = None) -> Dict[str, Any]:
     """
     Extract all information from a resume.
     
     Args:
         file_path: Path to the resume file.
         log_token_usage: Whether to log token usage to a separate file (default: True)
+        fused: Whether to extract every facet with a single LLM call instead of one
+            call per extractor. Defaults to config.FUSED_EXTRACTION.
         
     Returns:
         Dictionary containing all extracted information (without token usage data).
     """
-    resume = _get_processor().process_resume(file_path)
+    resume = _get_processor().process_resume(file_path, fused)
     
     # Create a logs directory if it doesn't exist and we need to log token usage
     if log_token_usage and hasattr(resume, 'token_usage') and resume.token_usage:
-        import json
-        import os
-        from datetime import datetime
-        
         logs_dir = os.path.join(os.getcwd(), 'logs')
         os.makedirs(logs_dir, exist_ok=True)
         
@@ -92,18 +93,14 @@ def extract_all(file_path: str, log_token_usage: bool = True) -> Dict[str, Any]:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file_path = os.path.join(logs_dir, f"{file_name}_token_usage_{timestamp}.json")
         
-        # Save token usage to a separate JSON file
-        with open(log_file_path, 'w') as f:
-            json.dump({"token_usage": resume.token_usage}, f, indent=2)
+        # Save token usage to a separate JSON file, off the request path
+        write_json_background(log_file_path, {"token_usage": resume.token_usage})
     
     # Return the resume as a dictionary but exclude token_usage and file_path
-    if hasattr(resume, 'model_dump'):
-        return resume.model_dump(exclude={'token_usage', 'file_path'})
+    if isinstance(resume, ResumeData):
+        return resume.to_dict()
     elif isinstance(resume, dict):
-        result = resume.copy()
-        result.pop('token_usage', None)
-        result.pop('file_path', None)
-        return result
+        return {key: value for key, value in resume.items() if key not in ResumeData.INTERNAL_FIELDS}
     
     return resume
 
@@ -134,7 +131,7 @@ def extract_profile(file_path: str) -> Dict[str, Any]:
             email=result.email if hasattr(result, 'email') else None,
             phone=result.contact_number if hasattr(result, 'contact_number') else None
         )
-        return profile.model_dump() if hasattr(profile, 'model_dump') else profile.__dict__
+        return profile.model_dump()
     return {}
 
 def extract_education(file_path: str) -> List[Dict[str, Any]]:
@@ -149,10 +146,7 @@ def extract_education(file_path: str) -> List[Dict[str, Any]]:
     """
     result = _get_processor().process_resume(file_path)
     if result and hasattr(result, 'educations'):
-        return [
-            edu.model_dump() if hasattr(edu, 'model_dump') else edu.__dict__
-            for edu in result.educations
-        ]
+        return dump_model_list(Education, result.educations)
     return []
 
 def extract_experience(file_path: str) -> List[Dict[str, Any]]:
@@ -167,10 +161,7 @@ def extract_experience(file_path: str) -> List[Dict[str, Any]]:
     """
     result = _get_processor().process_resume(file_path)
     if result and hasattr(result, 'work_experiences'):
-        return [
-            exp.model_dump() if hasattr(exp, 'model_dump') else exp.__dict__
-            for exp in result.work_experiences
-        ]
+        return dump_model_list(Experience, result.work_experiences)
     return []
 
 def extract_skills(file_path: str) -> Dict[str, Any]:
@@ -189,7 +180,7 @@ def extract_skills(file_path: str) -> Dict[str, Any]:
     
     # Create a Skills object and return as dictionary
     skills = Skills(skills=[])
-    return skills.model_dump() if hasattr(skills, 'model_dump') else skills.__dict__
+    return skills.model_dump()
 
 def extract_years_of_experience(file_path: str) -> Optional[str]:
     """
@@ -291,10 +282,6 @@ def analyze_resume(resume_path: Union[str, pathlib.Path],
     
     # Create a logs directory if it doesn't exist and we need to log token usage
     if log_token_usage and resume.get('token_usage'):
-        import json
-        import os
-        from datetime import datetime
-        
         logs_dir = os.path.join(os.getcwd(), 'logs/token_usage')
         os.makedirs(logs_dir, exist_ok=True)
         
@@ -304,9 +291,8 @@ def analyze_resume(resume_path: Union[str, pathlib.Path],
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file_path = os.path.join(logs_dir, f"{file_name}_token_usage_{timestamp}.json")
         
-        # Save token usage to a separate JSON file
-        with open(log_file_path, 'w') as f:
-            json.dump({"token_usage": resume.get('token_usage', {})}, f, indent=2)
+        # Save token usage to a separate JSON file, off the request path
+        write_json_background(log_file_path, {"token_usage": resume.get('token_usage', {})})
     
     # Remove token_usage and file_path from the result
     result = resume.copy() if isinstance(resume, dict) else {}
@@ -1,16 +1,25 @@
 """Base plugins package for MatchAI."""
-from .base import BasePlugin
-from .profile_extractor import ProfileExtractorPlugin
-from .skills_extractor import SkillsExtractorPlugin
-from .education_extractor import EducationExtractorPlugin
-from .experience_extractor import ExperienceExtractorPlugin
-from .yoe_extractor import YoeExtractorPlugin
+from .._lazy import lazy_exports
+
+# Built-in plugin classes, as dotted paths. PluginManager imports each module only
+# when it loads the plugin, so importing this package stays cheap.
+PLUGIN_CLASSES = (
+    'matchai.base_plugins.profile_extractor.ProfileExtractorPlugin',
+    'matchai.base_plugins.skills_extractor.SkillsExtractorPlugin',
+    'matchai.base_plugins.education_extractor.EducationExtractorPlugin',
+    'matchai.base_plugins.experience_extractor.ExperienceExtractorPlugin',
+    'matchai.base_plugins.yoe_extractor.YoeExtractorPlugin'
+)
+
+# Exported name -> submodule, imported on first attribute access
+_LAZY_EXPORTS = {
+    'BasePlugin': '.base',
+    'ProfileExtractorPlugin': '.profile_extractor',
+    'SkillsExtractorPlugin': '.skills_extractor',
+    'EducationExtractorPlugin': '.education_extractor',
+    'ExperienceExtractorPlugin': '.experience_extractor',
+    'YoeExtractorPlugin': '.yoe_extractor'
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(globals(), _LAZY_EXPORTS)
 
-__all__ = [
-    'BasePlugin',
-    'ProfileExtractorPlugin',
-    'SkillsExtractorPlugin',
-    'EducationExtractorPlugin',
-    'ExperienceExtractorPlugin',
-    'YoeExtractorPlugin'
-]
\ No newline at end of file
@@ -136,26 +136,22 @@ class BasePlugin(ABC):
             Tuple containing:
             - Dictionary with extracted information
             - Optional dictionary with token usage information
-        """
-        try:
-            # Get the model and prompt template
-            model = self.get_model()
-            prompt_template = self.get_prompt_template()
-            input_variables = self.get_input_variables()
-            
-            # Prepare input data
-            input_data = self.prepare_input_data(extracted_text)
-            
-            # Extract information using LLM
-            result, token_usage = self.llm_service.extract_with_llm(
-                model,
-                prompt_template,
-                input_variables,
-                input_data
-            )
-            
-            return result, token_usage
             
-        except Exception as e:
-            print(f"Error extracting information: {e}")
-            return {}, None 
\ No newline at end of file
+        Raises:
+            Exception: Errors propagate; use PluginManager.safe_extract to contain them.
+        """
+        # Get the model and prompt template
+        model = self.get_model()
+        prompt_template = self.get_prompt_template()
+        input_variables = self.get_input_variables()
+        
+        # Prepare input data
+        input_data = self.prepare_input_data(extracted_text)
+        
+        # Extract information using LLM
+        return self.llm_service.extract_with_llm(
+            model,
+            prompt_template,
+            input_variables,
+            input_data
+        )
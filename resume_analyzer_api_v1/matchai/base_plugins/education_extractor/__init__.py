@@ -1,13 +1,31 @@
-from typing import Dict, Any, Type, List, Tuple
+from typing import Dict, Any, Type, List, Tuple, Optional
 from pydantic import BaseModel
-from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory, DATED_EXTRACTION_PROMPT_SUFFIX, get_today
+from ...core import config
+from ...core.utils.token_budget import clip_text
+from ...core.utils.section_splitter import extract_section, EDUCATION_HEADINGS
 from ...models import ResumeEducation
-from datetime import date
 import logging
 
 class EducationExtractorPlugin(ExtractorPlugin):
     """Extractor plugin for education information."""
     
+    # Well-structured section with a flat schema: a lite model usually gets it right
+    CASCADE_MODELS = tuple(filter(None, [config.CASCADE_LLM_MODEL]))
+    
+    PROMPT_INSTRUCTIONS = """
+You are an expert resume parser. Your task is to extract education details from the resume text provided below. For each education entry, extract the following details:
+- College/School (output as "institution")
+- Start Date: If mentioned, convert it into the dd/mm/yyyy format. If the day is missing, default it to "01". If the month is missing, default it to "06". If no start date is mentioned, return null. If you encounter Present then use today's date, given below the schema.
+- End Date: If mentioned, convert it into the dd/mm/yyyy format. If the day is missing, default it to "01". If the month is missing, default it to "06". If no end date is mentioned, return null. If you encounter Present then use today's date, given below the schema.
+- Location
+- Degree
+Only focus on Education section of the below text. If you cannot find anything, return null.
+"""
+    PROMPT_TEMPLATE = PROMPT_INSTRUCTIONS + DATED_EXTRACTION_PROMPT_SUFFIX
+    INPUT_VARIABLES = ("text", "today")
+    MODEL = ResumeEducation
+    
     def __init__(self, llm_service):
         """Initialize the plugin with an LLM service."""
         self.llm_service = llm_service
@@ -25,67 +43,79 @@ class EducationExtractorPlugin(ExtractorPlugin):
     def initialize(self) -> None:
         """Initialize the plugin."""
         logging.info(f"Initializing {self.metadata.name}")
+        self.build_cached_prompt()
     
     def get_model(self) -> Type[BaseModel]:
         """Get the Pydantic model for the extractor."""
-        return ResumeEducation
+        return self.MODEL
     
     def get_prompt_template(self) -> str:
         """Get the prompt template for the extractor."""
-        return """
-You are an expert resume parser. Your task is to extract education details from the resume text provided below. For each education entry, extract the following details:
-- College/School (output as "institution")
-- Start Date: If mentioned, convert it into the dd/mm/yyyy format. If the day is missing, default it to "01". If the month is missing, default it to "06". If no start date is mentioned, return null. If you encounter Present then use the current date, i.e. {today}.
-- End Date: If mentioned, convert it into the dd/mm/yyyy format. If the day is missing, default it to "01". If the month is missing, default it to "06". If no end date is mentioned, return null. If you encounter Present then use the current date, i.e. {today}.
-- Location
-- Degree
-Only focus on Education section of the below text. If you cannot find anything, return null.
-
-Return your output as a JSON object with the below schema.
-{format_instructions}
-
-Text:
-{text}
-"""
+        return self.PROMPT_TEMPLATE
     
     def get_input_variables(self) -> List[str]:
         """Get the input variables for the prompt template."""
-        return ["text", "today"]
+        return list(self.INPUT_VARIABLES)
     
-    def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
+    def prepare_input_data(self, extracted_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         return {
-            "text": extracted_text,
-            "today": date.today().strftime("%d/%m/%Y")
+            "text": clip_text(extracted_text),
+            "today": (context or {}).get("today") or get_today()
         }
     
-    def extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def extract(self, text: str, context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Extract education information from text.
         
         Args:
             text: The text to extract information from.
+            context: Run-wide values from build_extraction_context().
             
         Returns:
             A tuple of (extracted_data, token_usage)
         """
-        # Prepare prompt from template
-        prompt_template = self.get_prompt_template()
-        input_data = self.prepare_input_data(text)
-        input_variables = self.get_input_variables()
-        model = self.get_model()
+        input_data = self.prepare_input_data(text, context)
+        model = self.MODEL
         
-        # Call LLM service
-        result, token_usage = self.llm_service.extract_with_llm(
+        # Call LLM service, starting with the cheaper model tier
+        result, token_usage = self.llm_service.extract_with_cascade(
+            self.CASCADE_MODELS,
             model,
-            prompt_template,
-            input_variables,
-            input_data
+            self.PROMPT_TEMPLATE,
+            self.INPUT_VARIABLES,
+            input_data,
+            prompt=self.get_cached_prompt(),
+            validate=lambda raw: self.validate_result(raw, text),
+            json_loader=self.JSON_LOADER
         )
         
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
+        return self.postprocess(result), token_usage
+    
+    def validate_result(self, result: Any, text: str) -> None:
+        """
+        Raise if a cascade tier's result should be retried with the next model.
+        
+        Besides failing the schema, a result is rejected when it has no entry naming an
+        institution or degree although the resume has an education section.
+        """
+        educations = self.MODEL.model_validate(self.postprocess(result)).educations
+        if not any(edu.institution or edu.degree for edu in educations) and extract_section(text, EDUCATION_HEADINGS):
+            raise ValueError("no education entries found although the resume has an education section")
+    
+    def postprocess(self, result: Any) -> Dict[str, Any]:
+        """
+        Normalize the raw LLM result into the education output dictionary.
+        
+        Args:
+            result: The parsed LLM output (dict or Pydantic model).
+            
+        Returns:
+            Dictionary with an "educations" list whose entries have all expected fields.
+        """
         # Process the result to ensure it's a dict with the expected keys
         if isinstance(result, dict):
             processed_result = {
@@ -97,14 +127,21 @@ Text:
                 "educations": getattr(result, "educations", [])
             }
         
-        # Ensure each education entry has expected fields
-        for edu in processed_result["educations"]:
-            if isinstance(edu, dict):
-                # Set default values for missing fields
-                edu["institution"] = edu.get("institution") or ""
-                edu["start_date"] = edu.get("start_date") or ""
-                edu["end_date"] = edu.get("end_date") or ""
-                edu["location"] = edu.get("location")  # Can be None
-                edu["degree"] = edu.get("degree") or ""
+        # Ensure each education entry has expected fields, in one pass. Entries stay
+        # plain dicts: the parsed JSON is not schema-checked, so Resume still
+        # validates them once when it is built.
+        processed_result["educations"] = [
+            {
+                "institution": edu.get("institution") or "",
+                "start_date": edu.get("start_date") or "",
+                "end_date": edu.get("end_date") or "",
+                "location": edu.get("location"),  # Can be None
+                "degree": edu.get("degree") or ""
+            } if isinstance(edu, dict) else edu
+            for edu in processed_result["educations"] or []
+        ]
         
-        return processed_result, token_usage 
\ No newline at end of file
+        return processed_result
+
+
+PLUGIN_CLASSES = (EducationExtractorPlugin,)
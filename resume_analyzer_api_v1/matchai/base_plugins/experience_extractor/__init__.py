@@ -1,13 +1,36 @@
-from typing import Dict, Any, Type, List, Tuple
+from typing import Dict, Any, Type, List, Tuple, Optional
 from pydantic import BaseModel
-from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory, DATED_EXTRACTION_PROMPT_SUFFIX, get_today
+from ...core import config
+from ...core.utils.token_budget import clip_text
+from ...core.utils.section_splitter import extract_section, EXPERIENCE_HEADINGS
 from ...models import ResumeWorkExperience
-from datetime import date
 import logging
 
 class ExperienceExtractorPlugin(ExtractorPlugin):
     """Extractor plugin for work experience information."""
     
+    # Well-structured section with a flat schema: a lite model usually gets it right
+    CASCADE_MODELS = tuple(filter(None, [config.CASCADE_LLM_MODEL]))
+    
+    PROMPT_INSTRUCTIONS = """
+You are an expert resume parser. Your task is to extract work experience details from the resume text provided below. For each work experience entry, extract the following details:
+- Company
+- Start Date: in dd/mm/yyyy format. If the resume does not provide the day or month, default the missing parts to "01". If you encounter Present then use today's date, given below the schema.
+- End Date: in dd/mm/yyyy format. If the resume does not provide the day or month, default the missing parts to "01". If you encounter Present then use today's date, given below the schema.
+- Location
+- Role: Extract ONLY the job title (e.g., "Data Engineer", "Software Developer", "Project Manager"). Do NOT include project information or descriptions in this field - just the official job title.
+
+Also extract Total Experience Years: the candidate's total years of experience as a number, ONLY if the resume states it explicitly (e.g. "12+ years of experience"). Otherwise return null for it.
+
+IMPORTANT: Create only ONE entry per company, even if the person worked on multiple projects or had multiple roles at the same company. If there were multiple positions at the same company, use the most senior or most recent role in the Role field. The earliest start date and the latest end date should be used for the company's overall employment period.
+
+Only focus on Work Experience section of the below text. If you cannot find anything, return null.
+"""
+    PROMPT_TEMPLATE = PROMPT_INSTRUCTIONS + DATED_EXTRACTION_PROMPT_SUFFIX
+    INPUT_VARIABLES = ("text", "today")
+    MODEL = ResumeWorkExperience
+    
     def __init__(self, llm_service):
         """Initialize the plugin with an LLM service."""
         self.llm_service = llm_service
@@ -25,70 +48,79 @@ class ExperienceExtractorPlugin(ExtractorPlugin):
     def initialize(self) -> None:
         """Initialize the plugin."""
         logging.info(f"Initializing {self.metadata.name}")
+        self.build_cached_prompt()
     
     def get_model(self) -> Type[BaseModel]:
         """Get the Pydantic model for the extractor."""
-        return ResumeWorkExperience
+        return self.MODEL
     
     def get_prompt_template(self) -> str:
         """Get the prompt template for the extractor."""
-        return """
-You are an expert resume parser. Your task is to extract work experience details from the resume text provided below. For each work experience entry, extract the following details:
-- Company
-- Start Date: in dd/mm/yyyy format. If the resume does not provide the day or month, default the missing parts to "01". If you encounter Present then use the current date, i.e. {today}.
-- End Date: in dd/mm/yyyy format. If the resume does not provide the day or month, default the missing parts to "01". If you encounter Present then use the current date, i.e. {today}.
-- Location
-- Role: Extract ONLY the job title (e.g., "Data Engineer", "Software Developer", "Project Manager"). Do NOT include project information or descriptions in this field - just the official job title.
-
-IMPORTANT: Create only ONE entry per company, even if the person worked on multiple projects or had multiple roles at the same company. If there were multiple positions at the same company, use the most senior or most recent role in the Role field. The earliest start date and the latest end date should be used for the company's overall employment period.
-
-Only focus on Work Experience section of the below text. If you cannot find anything, return null.
-
-Return your output as a JSON object with the below schema.
-{format_instructions}
-
-Text:
-{text}
-"""
+        return self.PROMPT_TEMPLATE
     
     def get_input_variables(self) -> List[str]:
         """Get the input variables for the prompt template."""
-        return ["text", "today"]
+        return list(self.INPUT_VARIABLES)
     
-    def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
+    def prepare_input_data(self, extracted_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         return {
-            "text": extracted_text,
-            "today": date.today().strftime("%d/%m/%Y")
+            "text": clip_text(extracted_text),
+            "today": (context or {}).get("today") or get_today()
         }
     
-    def extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def extract(self, text: str, context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Extract work experience information from text.
         
         Args:
             text: The text to extract information from.
+            context: Run-wide values from build_extraction_context().
             
         Returns:
             A tuple of (extracted_data, token_usage)
         """
-        # Prepare prompt from template
-        prompt_template = self.get_prompt_template()
-        input_data = self.prepare_input_data(text)
-        input_variables = self.get_input_variables()
-        model = self.get_model()
+        input_data = self.prepare_input_data(text, context)
+        model = self.MODEL
         
-        # Call LLM service
-        result, token_usage = self.llm_service.extract_with_llm(
+        # Call LLM service, starting with the cheaper model tier
+        result, token_usage = self.llm_service.extract_with_cascade(
+            self.CASCADE_MODELS,
             model,
-            prompt_template,
-            input_variables,
-            input_data
+            self.PROMPT_TEMPLATE,
+            self.INPUT_VARIABLES,
+            input_data,
+            prompt=self.get_cached_prompt(),
+            validate=lambda raw: self.validate_result(raw, text),
+            json_loader=self.JSON_LOADER
         )
         
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
+        return self.postprocess(result), token_usage
+    
+    def validate_result(self, result: Any, text: str) -> None:
+        """
+        Raise if a cascade tier's result should be retried with the next model.
+        
+        Besides failing the schema, a result is rejected when it has no entry naming a
+        company or role although the resume has a work experience section.
+        """
+        experiences = self.MODEL.model_validate(self.postprocess(result)).work_experiences
+        if not any(exp.company or exp.role for exp in experiences) and extract_section(text, EXPERIENCE_HEADINGS):
+            raise ValueError("no work experience entries found although the resume has a work experience section")
+    
+    def postprocess(self, result: Any) -> Dict[str, Any]:
+        """
+        Normalize the raw LLM result into the work experience output dictionary.
+        
+        Args:
+            result: The parsed LLM output (dict or Pydantic model).
+            
+        Returns:
+            Dictionary with a "work_experiences" list whose entries have all expected fields.
+        """
         # Process the result to ensure it's a dict with the expected keys
         if isinstance(result, dict):
             processed_result = {
@@ -100,14 +132,26 @@ Text:
                 "work_experiences": getattr(result, "work_experiences", [])
             }
         
-        # Ensure each work experience entry has expected fields
-        for exp in processed_result["work_experiences"]:
-            if isinstance(exp, dict):
-                # Set default values for missing fields
-                exp["company"] = exp.get("company") or ""
-                exp["start_date"] = exp.get("start_date") or ""
-                exp["end_date"] = exp.get("end_date") or ""
-                exp["location"] = exp.get("location")  # Can be None
-                exp["role"] = exp.get("role") or ""
+        # Ensure each work experience entry has expected fields, in one pass. Entries
+        # stay plain dicts: the parsed JSON is not schema-checked, so Resume still
+        # validates them once when it is built.
+        processed_result["work_experiences"] = [
+            {
+                "company": exp.get("company") or "",
+                "start_date": exp.get("start_date") or "",
+                "end_date": exp.get("end_date") or "",
+                "location": exp.get("location"),  # Can be None
+                "role": exp.get("role") or ""
+            } if isinstance(exp, dict) else exp
+            for exp in processed_result["work_experiences"] or []
+        ]
+        
+        # Stated total experience, if any; lets the YoE extractor skip the date scan
+        stated_years = result.get("total_experience_years") if isinstance(result, dict) else getattr(result, "total_experience_years", None)
+        if isinstance(stated_years, (int, float)) and not isinstance(stated_years, bool) and stated_years > 0:
+            processed_result["total_experience_years"] = stated_years
         
-        return processed_result, token_usage 
\ No newline at end of file
+        return processed_result
+
+
+PLUGIN_CLASSES = (ExperienceExtractorPlugin,)
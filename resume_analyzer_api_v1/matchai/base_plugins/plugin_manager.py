@@ -4,12 +4,90 @@ Plugin Manager for Resume Analysis.
 This module provides functionality to discover, load and manage plugins.
 """
 import os
+import asyncio
 import inspect
 import importlib
 import logging
-import re
-from typing import Dict, Type, List, Any, Optional
-from ..plugins.base import BasePlugin, ExtractorPlugin
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Type, List, Any, Optional, Tuple, NamedTuple, Union
+from pydantic import BaseModel, create_model
+from ..plugins.base import (
+    BasePlugin, ExtractorPlugin, EXTRACTION_PROMPT_SUFFIX, DATED_EXTRACTION_PROMPT_SUFFIX, build_extraction_context
+)
+from ..core.utils.token_budget import clip_text
+from . import PLUGIN_CLASSES as BUILTIN_PLUGIN_CLASSES
+
+BATCHED_PROMPT_HEADER = """
+You are an expert resume parser. Perform each of the numbered extraction tasks below on the same resume text.
+Return a single JSON object with one key per task, named exactly as in the task heading, holding that task's result.
+"""
+
+class PluginRef(NamedTuple):
+    """Import location of a plugin class; the module is imported only when the plugin is loaded."""
+    name: str
+    module_path: str
+    class_name: str
+    
+    @classmethod
+    def from_dotted_path(cls, dotted_path: str) -> "PluginRef":
+        """Build a reference from a 'package.module.ClassName' path."""
+        module_path, _, class_name = dotted_path.rpartition(".")
+        return cls(class_name, module_path, class_name)
+    
+    def resolve(self) -> Type[BasePlugin]:
+        """Import the module and return the plugin class."""
+        return getattr(importlib.import_module(self.module_path), self.class_name)
+
+def _plugin_module_name(plugin_name: str) -> str:
+    """
+    Convert a plugin class name to its package name.
+    Example: KeywordMatcherPlugin -> keyword_matcher
+    """
+    return ''.join(
+        '_' + char.lower() if char.isupper() and index > 0 else char.lower()
+        for index, char in enumerate(plugin_name)
+    ).removesuffix('_plugin')
+
+def _get_plugin_classes(module: Any) -> Tuple[Type[BasePlugin], ...]:
+    """
+    Return the plugin classes a module exports.
+    
+    Modules list their plugins in ``PLUGIN_CLASSES``; modules without it are
+    scanned for BasePlugin subclasses defined in them.
+    """
+    plugin_classes = getattr(module, "PLUGIN_CLASSES", None)
+    if plugin_classes is not None:
+        return tuple(plugin_classes)
+    return tuple(
+        attr for attr in vars(module).values()
+        if inspect.isclass(attr) and
+        issubclass(attr, BasePlugin) and
+        attr != BasePlugin and
+        attr.__module__ == module.__name__
+    )
+
+@dataclass
+class PluginEntry:
+    """A loaded plugin, with the attributes looked up on every access resolved once."""
+    __slots__ = ("name", "cls", "instance", "is_extractor", "category")
+    name: str
+    cls: Type[BasePlugin]
+    instance: BasePlugin
+    is_extractor: bool
+    category: str
+    
+    @classmethod
+    def from_instance(cls, instance: BasePlugin) -> "PluginEntry":
+        """Build an entry from an initialized plugin instance."""
+        metadata = instance.metadata
+        return cls(
+            metadata.name,
+            type(instance),
+            instance,
+            isinstance(instance, ExtractorPlugin),
+            metadata.category.name
+        )
 
 class PluginManager:
     """
@@ -24,100 +102,157 @@ class PluginManager:
             llm_service: The LLM service to use for extractors.
         """
         self.llm_service = llm_service
-        self.plugins: Dict[str, BasePlugin] = {}
-        self.plugin_classes: Dict[str, Type[BasePlugin]] = {}
-        self.extractors: Dict[str, ExtractorPlugin] = {}
+        # Loaded plugins in load order, and plugin name -> index into the list
+        self._entries: List[PluginEntry] = []
+        self._by_name: Dict[str, int] = {}
+        # Incremented whenever the loaded plugins change, so callers can cache lookups
+        self.revision = 0
+        self._discovered_plugins: Optional[List[PluginRef]] = None
+        self._all_plugins_cache: Optional[List[Dict[str, Any]]] = None
+        self._by_category: Dict[str, List[Dict[str, Any]]] = {}
+        self._batched_schema: Optional[Type[BaseModel]] = None
+        self._batched_template: Optional[str] = None
+        self._batched_input_variables: List[str] = []
+        self._batched_prompt: Any = None
+    
+    @property
+    def plugins(self) -> Dict[str, BasePlugin]:
+        """Dictionary of plugin name to plugin instance, built on access."""
+        return {entry.name: entry.instance for entry in self._entries}
+    
+    @plugins.setter
+    def plugins(self, plugins: Dict[str, BasePlugin]) -> None:
+        self._entries = []
+        self._by_name = {}
+        self._entries_changed()
+        for instance in plugins.values():
+            self._add_entry(PluginEntry.from_instance(instance))
+    
+    @property
+    def extractors(self) -> Dict[str, ExtractorPlugin]:
+        """Dictionary of extractor name to extractor plugin, built on access."""
+        return {entry.name: entry.instance for entry in self._entries if entry.is_extractor}
+    
+    @property
+    def plugin_classes(self) -> Dict[str, Type[BasePlugin]]:
+        """Dictionary of class name to class for the loaded plugins."""
+        return {entry.cls.__name__: entry.cls for entry in self._entries}
     
-    def discover_plugins(self) -> List[Type[BasePlugin]]:
+    def _add_entry(self, entry: PluginEntry) -> None:
+        """Add a loaded plugin, replacing any plugin already loaded under the same name."""
+        index = self._by_name.get(entry.name)
+        if index is None:
+            self._by_name[entry.name] = len(self._entries)
+            self._entries.append(entry)
+        else:
+            self._entries[index] = entry
+        self._entries_changed()
+    
+    def _entries_changed(self) -> None:
+        """Drop the listings and the batched extraction built from the previous plugins."""
+        self._all_plugins_cache = None
+        self._batched_schema = None
+        self._batched_template = None
+        self._batched_input_variables = []
+        self._batched_prompt = None
+        self.revision += 1
+    
+    def discover_plugins(self) -> List[PluginRef]:
         """
         Discover all available plugins in the configured directories.
         
+        Only the import location of each plugin is recorded; plugin modules (and their
+        heavy dependencies) are imported by load_plugin. Discovery runs once per
+        manager; later calls return the cached result.
+        
+        A plugin module lists the plugin classes it exports in a module-level
+        ``PLUGIN_CLASSES`` tuple; modules without one are scanned for the BasePlugin
+        subclasses they define (see _get_plugin_classes).
+        
         Returns:
-            A list of plugin classes.
+            A list of plugin references.
         """
-        discovered_plugins = []
+        if self._discovered_plugins is not None:
+            return list(self._discovered_plugins)
         
-        # First load all built-in plugins from base_plugins
-        try:
-            from . import __all__ as builtin_plugins
-            
-            logging.debug(f"Found built-in plugins: {builtin_plugins}")
-            
-            for plugin_name in builtin_plugins:
-                try:
-                    # Convert CamelCase to snake_case for module name
-                    # Example: ProfileExtractorPlugin -> profile_extractor
-                    module_base_name = re.sub(r'(?<!^)(?=[A-Z])', '_', plugin_name).lower().replace('_plugin', '')
-                    
-                    # Import the plugin
-                    module_name = f".{module_base_name}"
-                    module = importlib.import_module(module_name, package="matchai.base_plugins")
-                    
-                    # Find plugin class
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (inspect.isclass(attr) and 
-                            issubclass(attr, BasePlugin) and 
-                            attr != BasePlugin and
-                            attr.__module__ == module.__name__):
-                            discovered_plugins.append(attr)
-                            self.plugin_classes[attr.__name__] = attr
-                            logging.debug(f"Discovered built-in plugin: {attr.__name__}")
-                except Exception as e:
-                    logging.error(f"Error loading built-in plugin {plugin_name}: {e}")
-        except Exception as e:
-            logging.error(f"Error importing built-in plugins: {e}")
+        # First the built-in plugins listed in base_plugins
+        discovered_plugins = [PluginRef.from_dotted_path(path) for path in BUILTIN_PLUGIN_CLASSES]
+        logging.debug(f"Found built-in plugins: {[ref.name for ref in discovered_plugins]}")
         
         # Check for custom plugins
         custom_plugins_dir = os.path.join(os.getcwd(), 'matchai/custom_plugins')
         logging.debug(f"Looking for custom plugins in {custom_plugins_dir}")
         if os.path.exists(custom_plugins_dir) and os.path.isdir(custom_plugins_dir):
-            logging.debug(f"Looking for custom plugins in {custom_plugins_dir}")
             
             # First get the list of enabled custom plugins from __all__
             try:
                 from ..custom_plugins import __all__ as enabled_custom_plugins
                 logging.debug(f"Enabled custom plugins from __all__: {enabled_custom_plugins}")
                 
-                for item in os.listdir(custom_plugins_dir):
-                    plugin_path = os.path.join(custom_plugins_dir, item)
-                    if os.path.isdir(plugin_path) and os.path.exists(os.path.join(plugin_path, '__init__.py')):
-                        try:
-                            # Import the plugin module
-                            module_name = f"..custom_plugins.{item}"
-                            module = importlib.import_module(module_name, package="matchai.base_plugins")
-                            logging.debug(f"Imported custom plugin module: {module_name}")
-                            
-                            # Find plugin classes in the module that are listed in __all__
-                            for attr_name in dir(module):
-                                attr = getattr(module, attr_name)
-                                if (inspect.isclass(attr) and 
-                                    issubclass(attr, BasePlugin) and 
-                                    attr != BasePlugin and
-                                    attr.__module__ == module.__name__ and
-                                    attr.__name__ in enabled_custom_plugins):  # Only load if in __all__
-                                    discovered_plugins.append(attr)
-                                    self.plugin_classes[attr.__name__] = attr
-                                    logging.debug(f"Discovered custom plugin: {attr.__name__}")
-                        except Exception as e:
-                            logging.error(f"Error loading custom plugin from {item}: {e}")
+                # A plugin lives in the package named after its class,
+                # e.g. KeywordMatcherPlugin -> custom_plugins/keyword_matcher
+                unresolved = []
+                for plugin_name in enabled_custom_plugins:
+                    module_base_name = _plugin_module_name(plugin_name)
+                    if os.path.exists(os.path.join(custom_plugins_dir, module_base_name, '__init__.py')):
+                        discovered_plugins.append(PluginRef(plugin_name, f"matchai.custom_plugins.{module_base_name}", plugin_name))
+                        logging.debug(f"Discovered custom plugin: {plugin_name}")
+                    else:
+                        unresolved.append(plugin_name)
+                
+                # Packages not named after their class have to be imported to be found
+                if unresolved:
+                    discovered_plugins.extend(self._scan_custom_plugins(custom_plugins_dir, unresolved))
             except Exception as e:
                 logging.error(f"Error loading enabled custom plugins list: {e}")
         
+        self._discovered_plugins = discovered_plugins
         logging.info(f"Discovered {len(discovered_plugins)} plugins")
-        return discovered_plugins
+        return list(discovered_plugins)
     
-    def load_plugin(self, plugin_class: Type[BasePlugin]) -> Optional[BasePlugin]:
+    def _scan_custom_plugins(self, custom_plugins_dir: str, plugin_names: List[str]) -> List[PluginRef]:
+        """
+        Import each custom plugin package to find the given plugin classes.
+        
+        Args:
+            custom_plugins_dir: Directory holding the custom plugin packages.
+            plugin_names: Enabled plugin class names to look for.
+            
+        Returns:
+            References to the plugin classes that were found.
+        """
+        found = []
+        for item in os.listdir(custom_plugins_dir):
+            plugin_path = os.path.join(custom_plugins_dir, item)
+            if os.path.isdir(plugin_path) and os.path.exists(os.path.join(plugin_path, '__init__.py')):
+                try:
+                    # Import the plugin module
+                    module_name = f"..custom_plugins.{item}"
+                    module = importlib.import_module(module_name, package="matchai.base_plugins")
+                    logging.debug(f"Imported custom plugin module: {module_name}")
+                    
+                    for attr in _get_plugin_classes(module):
+                        if attr.__name__ in plugin_names:  # Only load if in __all__
+                            found.append(PluginRef(attr.__name__, module.__name__, attr.__name__))
+                            logging.debug(f"Discovered custom plugin: {attr.__name__}")
+                except Exception as e:
+                    logging.error(f"Error loading custom plugin from {item}: {e}")
+        return found
+    
+    def load_plugin(self, plugin: Union[PluginRef, Type[BasePlugin]]) -> Optional[BasePlugin]:
         """
         Load a plugin by instantiating the plugin class.
         
         Args:
-            plugin_class: The plugin class to instantiate.
+            plugin: The plugin class, or a reference to it; a reference's module is imported here.
             
         Returns:
             An instance of the plugin.
         """
+        plugin_label = plugin.name if isinstance(plugin, PluginRef) else plugin.__name__
         try:
+            plugin_class = plugin.resolve() if isinstance(plugin, PluginRef) else plugin
+            
             # Create an instance of the plugin, passing llm_service if needed
             plugin_init_signature = inspect.signature(plugin_class.__init__)
             if 'llm_service' in plugin_init_signature.parameters:
@@ -129,17 +264,14 @@ class PluginManager:
             plugin_instance.initialize()
             
             # Store the plugin instance
-            plugin_name = plugin_instance.metadata.name
-            self.plugins[plugin_name] = plugin_instance
-            
-            # If it's an extractor plugin, store it separately
-            if isinstance(plugin_instance, ExtractorPlugin):
-                self.extractors[plugin_name] = plugin_instance
+            entry = PluginEntry.from_instance(plugin_instance)
+            self._add_entry(entry)
+            plugin_name = entry.name
             
             logging.debug(f"Loaded plugin: {plugin_name}")
             return plugin_instance
         except Exception as e:
-            logging.error(f"Error loading plugin {plugin_class.__name__}: {e}")
+            logging.error(f"Error loading plugin {plugin_label}: {e}")
             return None
     
     def load_all_plugins(self) -> Dict[str, BasePlugin]:
@@ -151,10 +283,12 @@ class PluginManager:
         """
         discovered_plugins = self.discover_plugins()
         
-        for plugin_class in discovered_plugins:
-            self.load_plugin(plugin_class)
+        for plugin_ref in discovered_plugins:
+            self.load_plugin(plugin_ref)
         
-        logging.info(f"Loaded {len(self.plugins)} plugins")
+        self._build_plugin_info_cache()
+        self._build_batched_extraction()
+        logging.info(f"Loaded {len(self._entries)} plugins")
         return self.plugins
     
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
@@ -167,7 +301,8 @@ class PluginManager:
         Returns:
             The plugin instance or None if not found.
         """
-        return self.plugins.get(plugin_name)
+        index = self._by_name.get(plugin_name)
+        return self._entries[index].instance if index is not None else None
     
     def get_plugins_by_category(self, category: str) -> List[BasePlugin]:
         """
@@ -179,7 +314,7 @@ class PluginManager:
         Returns:
             List of plugins in the category.
         """
-        return [p for p in self.plugins.values() if p.metadata.category.name == category]
+        return [entry.instance for entry in self._entries if entry.category == category]
     
     def get_extractor_plugins(self) -> Dict[str, ExtractorPlugin]:
         """
@@ -190,6 +325,176 @@ class PluginManager:
         """
         return self.extractors
     
+    def safe_extract(self, extractor: ExtractorPlugin, data: Any,
+                     context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Run an extractor, logging any error instead of raising it.
+        
+        Extractors let exceptions propagate; this is the single place that contains them.
+        
+        Args:
+            extractor: The extractor plugin to run.
+            data: The extractor's input (resume text, or its upstream extractor's output).
+            context: Run-wide values from build_extraction_context().
+            
+        Returns:
+            The extractor's (extracted_data, token_usage), or ({}, {}) if it failed.
+        """
+        try:
+            return extractor.extract(data, context)
+        except Exception:
+            logging.exception(f"Extractor {extractor.metadata.name} failed")
+            return {}, {}
+    
+    async def safe_extract_async(self, extractor: ExtractorPlugin, data: Any,
+                                 context: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Async counterpart of safe_extract, awaiting the extractor's extract_async()."""
+        try:
+            return await extractor.extract_async(data, context)
+        except Exception:
+            logging.exception(f"Extractor {extractor.metadata.name} failed")
+            return {}, {}
+    
+    async def extract_all_async(self, text: str, max_workers: int = 5) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Run all extractor plugins concurrently on the given text.
+        
+        Each extractor runs through its extract_async(); at most
+        ``max_workers`` run at once to respect provider rate limits. Extractors
+        that declare ``depends_on`` are run afterwards on their upstream result.
+        
+        Args:
+            text: The resume text to extract information from.
+            max_workers: Maximum number of concurrent extractor calls.
+            
+        Returns:
+            Dictionary of extractor name to its (extracted_data, token_usage) tuple.
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        context = build_extraction_context()
+        
+        async def run(extractor: ExtractorPlugin, data: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            async with semaphore:
+                return await self.safe_extract_async(extractor, data, context)
+        
+        independent = {name: ex for name, ex in self.extractors.items() if not ex.depends_on}
+        dependent = {name: ex for name, ex in self.extractors.items() if ex.depends_on}
+        
+        outputs = await asyncio.gather(*(run(ex, text) for ex in independent.values()))
+        results = dict(zip(independent.keys(), outputs))
+        
+        for name, extractor in dependent.items():
+            upstream = results.get(extractor.depends_on)
+            if upstream is None:
+                logging.warning(f"Skipping {name}: upstream extractor {extractor.depends_on} did not run")
+                continue
+            results[name] = await run(extractor, upstream[0])
+        
+        return results
+    
+    def _get_batchable_extractors(self) -> Dict[str, ExtractorPlugin]:
+        """Extractors that call the LLM directly on the resume text."""
+        return {
+            name: ex for name, ex in self.extractors.items()
+            if not ex.depends_on and ex.get_instructions()
+        }
+    
+    def _build_batched_extraction(self) -> None:
+        """
+        Compose the batchable extractors into one schema and one prompt template.
+        """
+        batchable = self._get_batchable_extractors()
+        if not batchable:
+            self._batched_schema = None
+            self._batched_template = None
+            self._batched_input_variables = []
+            self._batched_prompt = None
+            return
+        
+        self._batched_schema = create_model(
+            "BatchedSchema",
+            **{name: (Optional[ex.get_model()], None) for name, ex in batchable.items()}
+        )
+        
+        sections = [BATCHED_PROMPT_HEADER]
+        input_variables = ["text"]
+        for index, (name, extractor) in enumerate(batchable.items(), start=1):
+            sections.append(f"\n### Task {index}: {name}\n{extractor.get_instructions()}")
+            for variable in extractor.get_input_variables():
+                if variable not in input_variables:
+                    input_variables.append(variable)
+        
+        suffix = DATED_EXTRACTION_PROMPT_SUFFIX if "today" in input_variables else EXTRACTION_PROMPT_SUFFIX
+        self._batched_template = "".join(sections) + suffix
+        self._batched_input_variables = input_variables
+        if self.llm_service is not None:
+            self._batched_prompt = self.llm_service.build_prompt(
+                self._batched_schema, self._batched_template, input_variables
+            )
+    
+    def extract_batched(self, text: str, context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Run all text-based extractors with a single LLM call.
+        
+        The response is streamed, and each extractor's section is passed through
+        its ``postprocess`` as soon as the model has finished it. Extractors that
+        declare ``depends_on`` run as soon as their upstream section is processed.
+        
+        Args:
+            text: The resume text to extract information from.
+            context: Run-wide values from build_extraction_context(); built if None.
+            
+        Returns:
+            Tuple containing:
+            - Dictionary of extractor name to its processed extraction result
+            - Token usage of the batched LLM call
+        """
+        if self._batched_schema is None:
+            self._build_batched_extraction()
+        if self._batched_schema is None:
+            return {}, {}
+        
+        batchable = self._get_batchable_extractors()
+        if context is None:
+            context = build_extraction_context()
+        input_data: Dict[str, Any] = {}
+        for extractor in batchable.values():
+            input_data.update(extractor.prepare_input_data(text, context))
+        # All tasks share one prompt, so it gets the full (budget-clipped) text even where
+        # an extractor alone would send only part of it
+        input_data.update(text=clip_text(text), **context)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        def run_dependents(upstream_name: str) -> None:
+            for name, extractor in self.extractors.items():
+                if extractor.depends_on == upstream_name and name not in results:
+                    results[name], _ = self.safe_extract(extractor, results[upstream_name], context)
+        
+        def handle_section(name: str, value: Any) -> None:
+            extractor = batchable.get(name)
+            if extractor is None or name in results:
+                return
+            results[name] = extractor.postprocess(value or {})
+            run_dependents(name)
+        
+        _, token_usage = self.llm_service.extract_with_llm(
+            self._batched_schema,
+            self._batched_template,
+            self._batched_input_variables,
+            input_data,
+            prompt=self._batched_prompt,
+            on_section=handle_section
+        )
+        token_usage["extractor"] = "batched"
+        
+        # Sections the model left out (or a failed call) get the empty-result defaults
+        for name, extractor in batchable.items():
+            if name not in results:
+                handle_section(name, {})
+        
+        return results, token_usage
+    
     def get_plugin_info(self) -> List[Dict[str, str]]:
         """
         Get information about all loaded plugins.
@@ -197,17 +502,27 @@ class PluginManager:
         Returns:
             List of dictionaries with plugin information.
         """
-        return [
-            {
-                "name": plugin.metadata.name,
-                "version": plugin.metadata.version,
-                "description": plugin.metadata.description,
-                "category": plugin.metadata.category.name,
-                "author": plugin.metadata.author
-            }
-            for plugin in self.plugins.values()
-        ]
+        plugin_info = []
+        for entry in self._entries:
+            metadata = entry.instance.metadata
+            plugin_info.append({
+                "name": entry.name,
+                "version": metadata.version,
+                "description": metadata.description,
+                "category": entry.category,
+                "author": metadata.author
+            })
+        return plugin_info
 
+    def _build_plugin_info_cache(self) -> None:
+        """
+        Build the cached plugin listing and its per-category index.
+        """
+        self._all_plugins_cache = self.get_plugin_info()
+        self._by_category = defaultdict(list)
+        for info in self._all_plugins_cache:
+            self._by_category[info["category"]].append(info)
+    
     def list_plugins(self) -> List[Dict[str, Any]]:
         """
         List all available plugins.
@@ -215,7 +530,9 @@ class PluginManager:
         Returns:
             List of dictionaries containing plugin information.
         """
-        return self.get_plugin_info()
+        if self._all_plugins_cache is None:
+            self._build_plugin_info_cache()
+        return self._all_plugins_cache
 
     def list_plugins_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
@@ -227,14 +544,6 @@ class PluginManager:
         Returns:
             List of dictionaries containing plugin information.
         """
-        plugins = self.get_plugins_by_category(category)
-        return [
-            {
-                "name": plugin.metadata.name,
-                "version": plugin.metadata.version,
-                "description": plugin.metadata.description,
-                "category": plugin.metadata.category.name,
-                "author": plugin.metadata.author
-            }
-            for plugin in plugins
-        ] 
\ No newline at end of file
+        if self._all_plugins_cache is None:
+            self._build_plugin_info_cache()
+        return self._by_category.get(category, []) 
\ No newline at end of file
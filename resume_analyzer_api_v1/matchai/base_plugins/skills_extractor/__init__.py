@@ -1,12 +1,21 @@
-from typing import Dict, Any, Type, List, Tuple
+from typing import Dict, Any, Type, List, Tuple, Optional
 from pydantic import BaseModel
-from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory, EXTRACTION_PROMPT_SUFFIX
 from ...models import Skills
+from ...core.utils.section_splitter import extract_section, SKILL_HEADINGS
+from ...core.utils.token_budget import clip_text
 import logging
 
 class SkillsExtractorPlugin(ExtractorPlugin):
     """Extractor plugin for skills information."""
     
+    PROMPT_INSTRUCTIONS = """
+You are an assistant that extracts a list of skills mentioned in the text below. Only focus on Skills section of the below text.
+"""
+    PROMPT_TEMPLATE = PROMPT_INSTRUCTIONS + EXTRACTION_PROMPT_SUFFIX
+    INPUT_VARIABLES = ("text",)
+    MODEL = Skills
+    
     def __init__(self, llm_service=None):
         """
         Initialize the plugin with an LLM service.
@@ -29,68 +38,71 @@ class SkillsExtractorPlugin(ExtractorPlugin):
     def initialize(self) -> None:
         """Initialize the plugin."""
         logging.info(f"Initializing {self.metadata.name}")
+        self.build_cached_prompt()
     
     def get_model(self) -> Type[BaseModel]:
         """Get the Pydantic model for the extractor."""
-        return Skills
+        return self.MODEL
     
     def get_prompt_template(self) -> str:
         """Get the prompt template for the extractor."""
-        return """
-You are an assistant that extracts a list of skills mentioned in the text below. Only focus on Skills section of the below text.
-Return your output as a JSON object with the below schema.
-{format_instructions}
-
-Text:
-{text}
-"""
+        return self.PROMPT_TEMPLATE
     
     def get_input_variables(self) -> List[str]:
         """Get the input variables for the prompt template."""
-        return ["text"]
+        return list(self.INPUT_VARIABLES)
     
-    def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
-        """Prepare the input data for the LLM."""
-        return {"text": extracted_text}
+    def prepare_input_data(self, extracted_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Prepare the input data for the LLM.
+        
+        Only the skills section is sent when one can be found; otherwise the full text,
+        clipped to config.MAX_INPUT_TOKENS.
+        """
+        return {"text": clip_text(extract_section(extracted_text, SKILL_HEADINGS) or extracted_text)}
     
-    def extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def extract(self, text: str, context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Extract skills information from text.
         
         Args:
             text: The text to extract information from.
+            context: Run-wide values from build_extraction_context().
             
         Returns:
             A tuple of (extracted_data, token_usage)
         """
-        # Prepare prompt from template
-        prompt_template = self.get_prompt_template()
-        input_data = self.prepare_input_data(text)
-        input_variables = self.get_input_variables()
-        model = self.get_model()
+        input_data = self.prepare_input_data(text, context)
+        model = self.MODEL
         
         # Call LLM service
         result, token_usage = self.llm_service.extract_with_llm(
             model,
-            prompt_template,
-            input_variables,
-            input_data
+            self.PROMPT_TEMPLATE,
+            self.INPUT_VARIABLES,
+            input_data,
+            prompt=self.get_cached_prompt(),
+            json_loader=self.JSON_LOADER
         )
         
-        logging.debug(f"Skills extracted from llm is {result}");
+        logging.debug("Skills extracted from llm is %s", result)
         
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
-        # Process the result to ensure it's a dict with the expected keys
-        if isinstance(result, dict):
-            processed_result = {
-                "skills": result.get("skills", [])
-            }
-        else:
-            # If result is a Pydantic model, convert to dict
-            processed_result = {
-                "skills": getattr(result, "skills", [])
-            }
+        return self.postprocess(result), token_usage
+    
+    def postprocess(self, result: Any) -> Dict[str, Any]:
+        """
+        Normalize the raw LLM result into the skills output dictionary.
         
-        return processed_result, token_usage 
\ No newline at end of file
+        Args:
+            result: The parsed LLM output.
+            
+        Returns:
+            Dictionary with a "skills" list.
+        """
+        return {"skills": result.get("skills", []) if isinstance(result, dict) else []}
+
+
+PLUGIN_CLASSES = (SkillsExtractorPlugin,)
@@ -3,12 +3,29 @@ from datetime import datetime
 from pydantic import BaseModel
 from ...models.resume_models import WorkDates
 from ...plugins.base import ExtractorPlugin, PluginMetadata, PluginCategory
-from ...core.utils.date_utils import calculate_experience
+from ...core import config
+from ...core.utils.date_utils import calculate_experience, format_experience_years
 import logging
+import re
+
+# Date formats handled by YoeExtractorPlugin.convert_to_date_format
+_PRESENT_WORDS = frozenset(("present", "current", "now"))
+# Month name formats like "October 2020" or "Oct 2020" or "Oct-2020"
+_MONTH_RE = re.compile(
+    r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)[,\s\-]*(\d{4})',
+    re.IGNORECASE
+)
+_YEAR_RE = re.compile(r'(\d{4})')
+_MONTH_MAP = {
+    "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
+    "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12"
+}
 
 class YoeExtractorPlugin(ExtractorPlugin):
     """Extractor plugin for years of experience information."""
     
+    depends_on = "experience_extractor"
+    
     def __init__(self, llm_service):
         """Initialize the plugin with an LLM service."""
         self.llm_service = llm_service
@@ -45,19 +62,20 @@ class YoeExtractorPlugin(ExtractorPlugin):
         """
         return []
     
-    def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
+    def prepare_input_data(self, extracted_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Prepare the input data for the LLM.
         This is required by the abstract class but not used in our implementation.
         """
         return {}
     
-    def extract(self, experience_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def extract(self, experience_data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Calculate years of experience from experience data.
         
         Args:
             experience_data: The experience data extracted by the experience_extractor.
+            context: Run-wide values from build_extraction_context() (unused).
             
         Returns:
             A tuple of (extracted_data, token_usage)
@@ -79,6 +97,13 @@ class YoeExtractorPlugin(ExtractorPlugin):
         }
         
         try:
+            # A total stated in the resume makes the date scan unnecessary
+            stated_years = experience_data.get('total_experience_years')
+            if stated_years:
+                total_experience = format_experience_years(stated_years)
+                logging.info("Using stated YoE: %s", total_experience)
+                return {**default_result, "YoE": total_experience}, token_usage
+            
             # Extract work experiences from the data
             work_experiences = experience_data.get('work_experiences', [])
             
@@ -86,48 +111,35 @@ class YoeExtractorPlugin(ExtractorPlugin):
                 logging.warning("No work experiences found in experience data")
                 return default_result, token_usage
             
-            # Collect all valid dates
-            dates = []
+            # Find the oldest and newest parseable dates in a single pass
+            convert = self.convert_to_date_format
+            strptime = datetime.strptime
+            date_format = config.DATE_FORMAT
+            oldest_obj = newest_obj = None
+            oldest_working_date = newest_working_date = ""
             for exp in work_experiences:
-                start_date = exp.get('start_date', '')
-                end_date = exp.get('end_date', '')
-                
-                if start_date:
-                    dates.append(self.convert_to_date_format(start_date))
-                if end_date:
-                    dates.append(self.convert_to_date_format(end_date))
-            
-            # Filter out empty strings
-            dates = [date for date in dates if date]
-            
-            if not dates:
+                for raw_date in (exp.get('start_date'), exp.get('end_date')):
+                    date_str = convert(raw_date) if raw_date else ""
+                    if not date_str:
+                        continue
+                    try:
+                        date_obj = strptime(date_str, date_format)
+                    except ValueError:
+                        logging.debug("Could not parse date: %s", date_str)
+                        continue
+                    if oldest_obj is None or date_obj < oldest_obj:
+                        oldest_obj, oldest_working_date = date_obj, date_str
+                    if newest_obj is None or date_obj > newest_obj:
+                        newest_obj, newest_working_date = date_obj, date_str
+            
+            if oldest_obj is None:
                 logging.warning("No valid dates found in work experiences")
                 return default_result, token_usage
             
-            # Convert dates to datetime objects for comparison
-            date_objects = []
-            for date_str in dates:
-                try:
-                    from ...core import config
-                    date_obj = datetime.strptime(date_str, config.DATE_FORMAT)
-                    date_objects.append((date_str, date_obj))
-                except ValueError:
-                    logging.debug(f"Could not parse date: {date_str}")
-            
-            if not date_objects:
-                logging.warning("No valid date objects could be created")
-                return default_result, token_usage
-            
-            # Find oldest and newest dates
-            oldest_date = min(date_objects, key=lambda x: x[1])
-            newest_date = max(date_objects, key=lambda x: x[1])
-            
-            oldest_working_date = oldest_date[0]
-            newest_working_date = newest_date[0]
-            
             # Calculate total experience
             total_experience = calculate_experience(oldest_working_date, newest_working_date)
-            logging.info(f"Calculated YoE from dates - oldest: {oldest_working_date}, newest: {newest_working_date}, result: {total_experience}")
+            logging.info("Calculated YoE from dates - oldest: %s, newest: %s, result: %s",
+                         oldest_working_date, newest_working_date, total_experience)
             
             processed_result = {
                 "oldest_working_date": oldest_working_date,
@@ -151,45 +163,33 @@ class YoeExtractorPlugin(ExtractorPlugin):
         Returns:
             A date string in dd/mm/yyyy format
         """
-        import re
-        from datetime import datetime
-        
         if not date_str:
             return ""
             
-        # Check if already in correct format
-        date_pattern = r'^\d{1,2}/\d{1,2}/\d{4}$'
-        if re.match(date_pattern, date_str):
+        # Check if already in correct format (d/m/yyyy), the common case, without a regex
+        parts = date_str.split('/')
+        if (len(parts) == 3 and len(parts[0]) <= 2 and len(parts[1]) <= 2 and len(parts[2]) == 4
+                and all(part.isdigit() for part in parts)):
             return date_str
             
         # Handle "Present" or "Current"
-        if date_str.lower() in ["present", "current", "now"]:
+        if date_str.lower() in _PRESENT_WORDS:
             now = datetime.now()
             return now.strftime("%d/%m/%Y")
             
         # Handle month name formats like "October 2020" or "Oct 2020" or "Oct-2020"
-        month_pattern = r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)[,\s\-]*(\d{4})'
-        match = re.search(month_pattern, date_str.lower())
+        match = _MONTH_RE.search(date_str)
         if match:
-            # Extract the year
-            year = match.group(1)
-            
-            # Parse the month
-            month_map = {
-                "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
-                "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12"
-            }
-            
-            for month_key, month_num in month_map.items():
-                if month_key in date_str.lower():
-                    return f"01/{month_num}/{year}"
+            return f"01/{_MONTH_MAP[match.group(1)[:3].lower()]}/{match.group(2)}"
         
         # Try to extract just year (fallback)
-        year_pattern = r'(\d{4})'
-        match = re.search(year_pattern, date_str)
+        match = _YEAR_RE.search(date_str)
         if match:
             year = match.group(1)
             return f"01/01/{year}"
             
         logging.warning(f"Could not convert date string to standard format: {date_str}")
-        return "" 
\ No newline at end of file
+        return ""
+
+
+PLUGIN_CLASSES = (YoeExtractorPlugin,)
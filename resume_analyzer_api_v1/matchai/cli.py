@@ -1,36 +1,137 @@
 """Command-line interface for MatchAI."""
 import os
 import sys
-import json
-from typing import Optional, Dict, Any
-import click
+import glob
+import asyncio
+import argparse
+from typing import Optional, Dict, Any, List
 
-@click.command(help="MatchAI - AI-powered resume analysis")
-@click.option('--resume', type=str, help='Process a single resume file')
-@click.option('--output', type=str, help='Output directory for results')
-@click.option('--list-plugins', is_flag=True, help='List available plugins')
-@click.option('--plugins', type=str, help='Comma-separated list of plugins to use')
-@click.option('--json', 'json_output', is_flag=True, help='Output results as JSON')
-def main(resume: Optional[str], output: Optional[str], list_plugins: bool, plugins: Optional[str], json_output: bool):
+def _collect_resume_paths(resume: str) -> List[str]:
+    """Expand --resume into resume files: a single file, a directory or a glob pattern."""
+    is_dir = os.path.isdir(resume)
+    if not is_dir and not glob.has_magic(resume):
+        return [resume] if os.path.exists(resume) else []
+    from matchai.core import config
+    suffixes = tuple(config.ALLOWED_FILE_EXTENSIONS)
+    if is_dir:
+        with os.scandir(resume) as entries:
+            return sorted(entry.path for entry in entries
+                          if entry.name.lower().endswith(suffixes) and entry.is_file())
+    return [p for p in sorted(glob.glob(resume))
+            if p.lower().endswith(suffixes) and os.path.isfile(p)]
+
+def _process_resume(resume_path: str, plugin_list: Optional[List[str]]) -> Dict[str, Any]:
+    """Run the selected plugins (or all of them) on one resume."""
+    if plugin_list:
+        from matchai import analyze_resume
+        return analyze_resume(resume_path, plugin_list)
+    from matchai import extract_all
+    return extract_all(resume_path)
+
+async def _process_resumes(resume_paths: List[str], plugin_list: Optional[List[str]], max_inflight: int,
+                           on_result) -> None:
+    """Process resumes concurrently, calling on_result(path, result) as each one finishes."""
+    semaphore = asyncio.Semaphore(max_inflight)
+    
+    async def run(resume_path: str) -> None:
+        async with semaphore:
+            try:
+                result = await asyncio.to_thread(_process_resume, resume_path, plugin_list)
+            except Exception as e:
+                print(f"Error processing {resume_path}: {e}", file=sys.stderr)
+                return
+        on_result(resume_path, result)
+    
+    await asyncio.gather(*(run(path) for path in resume_paths))
+
+def _output_result(resume_path: str, result: Dict[str, Any], json_output: bool, output: Optional[str]) -> None:
+    """Print one resume's results and optionally save them to the output directory."""
+    from matchai.core.utils.json_utils import dumps_indented
+    
+    # Serialized once, for both the console and the output file
+    result_json = dumps_indented(result) if json_output or output else None
+    if json_output:
+        print(result_json.decode("utf-8"))
+    else:
+        print(f"\nResume Analysis Results ({os.path.basename(resume_path)}):")
+        if "name" in result:
+            print(f"Name: {result.get('name', 'Not found')}")
+        if "email" in result:
+            print(f"Email: {result.get('email', 'Not found')}")
+        if "skills" in result:
+            print(f"Skills: {', '.join(result.get('skills', []))}")
+        if "educations" in result:
+            print("\nEducation:")
+            for edu in result.get("educations", []):
+                print(f"- {edu.get('degree')} at {edu.get('institution')}")
+        if "work_experiences" in result:
+            print("\nExperience:")
+            for exp in result.get("work_experiences", []):
+                print(f"- {exp.get('role')} at {exp.get('company')}")
+        if "YoE" in result:
+            print(f"\nYears of Experience: {result.get('YoE', 'Not found')}")
+        elif "years_of_experience" in result:
+            print(f"\nYears of Experience: {result.get('years_of_experience', 'Not found')}")
+    
+    # Save results to file if output directory specified
+    if output:
+        os.makedirs(output, exist_ok=True)
+        output_file = os.path.join(output, f"{os.path.splitext(os.path.basename(resume_path))[0]}.json")
+        with open(output_file, 'wb') as f:
+            f.write(result_json)
+        print(f"\nResults saved to {output_file}")
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI's argument parser."""
+    parser = argparse.ArgumentParser(description="MatchAI - AI-powered resume analysis")
+    parser.add_argument('--resume', type=str, help='Process a resume file, or every resume in a directory or glob pattern')
+    parser.add_argument('--output', type=str, help='Output directory for results')
+    parser.add_argument('--list-plugins', action='store_true', help='List available plugins')
+    parser.add_argument('--plugins', type=str, help='Comma-separated list of plugins to use')
+    parser.add_argument('--json', dest='json_output', action='store_true', help='Output results as JSON')
+    parser.add_argument('--cache-dir', type=str, help='Directory for caching LLM extraction results across runs')
+    parser.add_argument('--max-inflight', type=int, default=4,
+                        help='Maximum number of resumes processed concurrently (default: 4; 1 with --plugins)')
+    parser.add_argument('--max-input-tokens', type=int,
+                        help='Approximate token budget for resume text sent to each extractor (0 disables)')
+    parser.add_argument('--strict', action='store_true',
+                        help='Validate every LLM result against its Pydantic model (for debugging)')
+    return parser
+
+def main(argv: Optional[List[str]] = None):
     """Entry point for the MatchAI CLI."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    resume, output, plugins, json_output = args.resume, args.output, args.plugins, args.json_output
+    cache_dir, max_inflight, strict = args.cache_dir, args.max_inflight, args.strict
+    
+    # Must be set before matchai (and its config) is imported below
+    if cache_dir:
+        os.environ["EXTRACTION_CACHE_DIR"] = cache_dir
+    if strict:
+        os.environ["STRICT_OUTPUT_VALIDATION"] = "true"
+    if args.max_input_tokens is not None:
+        os.environ["MAX_INPUT_TOKENS"] = str(args.max_input_tokens)
+    
     # Handle plugin listing
-    if list_plugins:
-        from MatchAI import list_all_plugins
+    if args.list_plugins:
+        from matchai import list_all_plugins
+        from matchai.core.utils.json_utils import dumps_indented
         plugins_list = list_all_plugins()
         
         if json_output:
-            click.echo(json.dumps(plugins_list, indent=2))
+            print(dumps_indented(plugins_list).decode("utf-8"))
         else:
-            click.echo("\nAvailable plugins:")
+            print("\nAvailable plugins:")
             for plugin in plugins_list:
-                click.echo(f"- {plugin['name']} (v{plugin['version']}): {plugin['description']}")
+                print(f"- {plugin['name']} (v{plugin['version']}): {plugin['description']}")
         return
     
     # Handle resume processing
     if resume:
-        resume_path = resume
-        if not os.path.exists(resume_path):
-            click.echo(f"Error: Resume file not found at {resume_path}", err=True)
+        resume_paths = _collect_resume_paths(resume)
+        if not resume_paths:
+            print(f"Error: No resume files found at {resume}", file=sys.stderr)
             sys.exit(1)
         
         # Determine which plugins to use
@@ -38,47 +139,19 @@ def main(resume: Optional[str], output: Optional[str], list_plugins: bool, plugi
         if plugins:
             plugin_list = [p.strip() for p in plugins.split(',')]
         
-        # Process the resume
-        if plugin_list:
-            from matchai import analyze_resume
-            result = analyze_resume(resume_path, plugin_list)
+        # Process the resumes; each one is output as soon as it finishes
+        if len(resume_paths) == 1:
+            _output_result(resume_paths[0], _process_resume(resume_paths[0], plugin_list), json_output, output)
         else:
-            from matchai import extract_all
-            result = extract_all(resume_path)
-        
-        # Output the results
-        if json_output:
-            click.echo(json.dumps(result, indent=2))
-        else:
-            click.echo("\nResume Analysis Results:")
-            if "name" in result:
-                click.echo(f"Name: {result.get('name', 'Not found')}")
-            if "email" in result:
-                click.echo(f"Email: {result.get('email', 'Not found')}")
-            if "skills" in result:
-                click.echo(f"Skills: {', '.join(result.get('skills', []))}")
-            if "educations" in result:
-                click.echo("\nEducation:")
-                for edu in result.get("educations", []):
-                    click.echo(f"- {edu.get('degree')} at {edu.get('institution')}")
-            if "work_experiences" in result:
-                click.echo("\nExperience:")
-                for exp in result.get("work_experiences", []):
-                    click.echo(f"- {exp.get('role')} at {exp.get('company')}")
-            if "YoE" in result:
-                click.echo(f"\nYears of Experience: {result.get('YoE', 'Not found')}")
-            elif "years_of_experience" in result:
-                click.echo(f"\nYears of Experience: {result.get('years_of_experience', 'Not found')}")
-        
-        # Save results to file if output directory specified
-        if output:
-            os.makedirs(output, exist_ok=True)
-            output_file = os.path.join(output, f"{os.path.splitext(os.path.basename(resume_path))[0]}.json")
-            with open(output_file, 'w') as f:
-                json.dump(result, f, indent=2)
-            click.echo(f"\nResults saved to {output_file}")
+            # analyze_resume swaps the plugins of the shared plugin manager for the
+            # duration of a call, so resumes with selected plugins run one at a time
+            inflight = 1 if plugin_list else max(1, max_inflight)
+            asyncio.run(_process_resumes(
+                resume_paths, plugin_list, inflight,
+                lambda path, result: _output_result(path, result, json_output, output)
+            ))
     else:
-        click.echo(click.get_current_context().get_help())
+        parser.print_help()
 
 if __name__ == "__main__":
     main()
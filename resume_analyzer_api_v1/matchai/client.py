@@ -1,24 +1,77 @@
 """Client interface for MatchAI."""
-from typing import Dict, List, Any, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
+import hashlib
 import pathlib
 import os
 
 from .core.llm_service import LLMService
+from .core.response_cache import ResponseCache
+from .core.utils.file_utils import read_bytes
+from .core.utils.json_utils import write_json_background
 from .core.resume_processor import PluginResumeProcessor as ResumeProcessor
 from .base_plugins.plugin_manager import PluginManager
 from .models.resume_models import (
     ResumeProfile,
     Education,
     Experience,
-    Skills
+    Skills,
+    Resume,
+    dump_model_list
 )
 
+# Facet extractors keyed by the type of the processed result: a Resume from the
+# processor, or a dict of facets. Any other result (None when processing failed)
+# gets the facet's default.
+_PROFILE_EXTRACTORS = {
+    Resume: lambda r: {'name': r.name, 'email': r.email, 'phone': r.contact_number},
+    dict: lambda r: ResumeProfile(**r["profile"]).model_dump() if r.get("profile") else {},
+}
+_EDUCATION_EXTRACTORS = {
+    Resume: lambda r: dump_model_list(Education, r.educations),
+    dict: lambda r: dump_model_list(Education, r.get("education") or []),
+}
+_EXPERIENCE_EXTRACTORS = {
+    Resume: lambda r: dump_model_list(Experience, r.work_experiences),
+    dict: lambda r: dump_model_list(Experience, r.get("experience") or []),
+}
+_SKILLS_EXTRACTORS = {
+    Resume: lambda r: {'skills': r.skills},
+    dict: lambda r: Skills(**r["skills"]).model_dump() if r.get("skills") else {'skills': []},
+}
+_YOE_EXTRACTORS = {
+    Resume: lambda r: r.YoE or None,
+    dict: lambda r: r.get("YoE") or r.get("years_of_experience"),
+}
+
+def _extract_facet(extractors: Dict[type, Callable[[Any], Any]], result: Any, default: Callable[[], Any]) -> Any:
+    """Apply the extractor registered for type(result), or return default() if there is none."""
+    try:
+        extractor = extractors[type(result)]
+    except KeyError:
+        return default()
+    return extractor(result)
+
+@lru_cache(maxsize=8)
+def _get_services(api_key: Optional[str], model_name: Optional[str]) -> Tuple[LLMService, PluginManager, ResumeProcessor]:
+    """
+    Build the LLM service, plugin manager (with all plugins loaded) and processor once
+    per API key and model, so clients created per request share them.
+    """
+    llm_service = LLMService(model_name=model_name)
+    plugin_manager = PluginManager(llm_service)
+    plugin_manager.load_all_plugins()
+    return llm_service, plugin_manager, ResumeProcessor(plugin_manager=plugin_manager)
+
 class MatchAIClient:
     """Client for MatchAI resume analysis.
     
     This client provides methods for analyzing resumes using Google's Gemini models.
     """
     
+    # Number of processed resumes kept by _process_resume
+    RESUME_CACHE_MAX_SIZE = 128
+    
     def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
         """
         Initialize the MatchAI client.
@@ -32,28 +85,60 @@ class MatchAIClient:
         if api_key:
             os.environ["GOOGLE_API_KEY"] = api_key
             
-        # Initialize services
-        self._llm_service = LLMService(model_name=model_name)
-        self._plugin_manager = PluginManager(self._llm_service)
-        self._plugin_manager.load_all_plugins()
-        self._processor = ResumeProcessor(plugin_manager=self._plugin_manager)
+        # Services are shared by every client with the same API key and model
+        self._llm_service, self._plugin_manager, self._processor = _get_services(api_key, model_name)
+        # Processed resumes keyed by file content, so asking for several facets of the
+        # same resume parses it and calls the LLM only once
+        self._resume_cache = ResponseCache(max_size=self.RESUME_CACHE_MAX_SIZE)
     
-    def extract_all(self, file_path: str, log_token_usage: bool = True) -> Dict[str, Any]:
+    def _process_resume(self, file_path: str, fused: Optional[bool] = None) -> Any:
+        """
+        Process a resume, reusing the previous result while the file content is unchanged.
+        
+        Args:
+            file_path: Path to the resume file.
+            fused: Whether to extract all facets with one LLM call (see
+                PluginResumeProcessor.process_resume).
+            
+        Returns:
+            The processed Resume, or None if processing failed.
+        """
+        try:
+            data = read_bytes(file_path)
+        except OSError:
+            # Let the processor report the missing or unreadable file
+            return self._processor.process_resume(file_path, fused)
+        
+        cache_key = ResponseCache.make_key(
+            os.path.abspath(file_path), hashlib.sha256(data).hexdigest(),
+            self._llm_service.model_name, fused, *sorted(self._plugin_manager.plugins)
+        )
+        resume = self._resume_cache.get(cache_key)
+        if resume is None:
+            # The bytes just hashed are parsed directly, without reading the file again
+            resume = self._processor.process_resume(file_path, fused, data)
+            if resume is not None:
+                self._resume_cache.put(cache_key, resume)
+        return resume
+    
+    def extract_all(self, file_path: str, log_token_usage: bool = True,
+                    fused: Optional[bool] = None) -> Dict[str, Any]:
         """
         Extract all information from a resume.
         
         Args:
             file_path: Path to the resume file.
             log_token_usage: Whether to log token usage to a separate file (default: True)
+            fused: Whether to extract every facet with a single LLM call instead of one
+                call per extractor. Defaults to config.FUSED_EXTRACTION.
             
         Returns:
             Dictionary containing all extracted information (without token usage data).
         """
-        resume = self._processor.process_resume(file_path)
+        resume = self._process_resume(file_path, fused)
         
         # Create a logs directory if it doesn't exist and we need to log token usage
         if log_token_usage and hasattr(resume, 'token_usage') and resume.token_usage:
-            import json
             import os
             from datetime import datetime
             
@@ -66,18 +151,14 @@ class MatchAIClient:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_file_path = os.path.join(logs_dir, f"{file_name}_token_usage_{timestamp}.json")
             
-            # Save token usage to a separate JSON file
-            with open(log_file_path, 'w') as f:
-                json.dump({"token_usage": resume.token_usage}, f, indent=2)
+            # Save token usage to a separate JSON file, off the request path
+            write_json_background(log_file_path, {"token_usage": resume.token_usage})
         
         # Return the resume as a dictionary but exclude token_usage and file_path
-        if hasattr(resume, 'model_dump'):
-            return resume.model_dump(exclude={'token_usage', 'file_path'})
+        if isinstance(resume, Resume):
+            return resume.to_dict()
         elif isinstance(resume, dict):
-            result = resume.copy()
-            result.pop('token_usage', None)
-            result.pop('file_path', None)
-            return result
+            return {key: value for key, value in resume.items() if key not in Resume.INTERNAL_FIELDS}
         
         return resume
     
@@ -91,20 +172,8 @@ class MatchAIClient:
         Returns:
             Dictionary containing profile information.
         """
-        result = self._processor.process_resume(file_path)
-        if hasattr(result, 'name'):
-            # Create dictionary from resume fields
-            profile_data = {
-                'name': result.name,
-                'email': result.email,
-                'phone': result.contact_number
-            }
-            return profile_data
-        elif result.get("profile"):
-            # Convert to dictionary if it's a Pydantic model
-            profile = ResumeProfile(**result.get("profile", {}))
-            return profile.model_dump() if hasattr(profile, 'model_dump') else profile.__dict__
-        return {}
+        result = self._process_resume(file_path)
+        return _extract_facet(_PROFILE_EXTRACTORS, result, dict)
     
     def extract_education(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -116,23 +185,8 @@ class MatchAIClient:
         Returns:
             List of dictionaries containing education information.
         """
-        result = self._processor.process_resume(file_path)
-        
-        # Handle Resume object
-        if hasattr(result, 'educations'):
-            return [
-                edu.model_dump() if hasattr(edu, 'model_dump') else edu.__dict__
-                for edu in result.educations
-            ]
-        # Handle dict result
-        elif result.get("education"):
-            return [
-                Education(**edu).model_dump() 
-                if hasattr(Education(**edu), 'model_dump')
-                else Education(**edu).__dict__
-                for edu in result.get("education", [])
-            ]
-        return []
+        result = self._process_resume(file_path)
+        return _extract_facet(_EDUCATION_EXTRACTORS, result, list)
     
     def extract_experience(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -144,23 +198,8 @@ class MatchAIClient:
         Returns:
             List of dictionaries containing experience information.
         """
-        result = self._processor.process_resume(file_path)
-        
-        # Handle Resume object
-        if hasattr(result, 'work_experiences'):
-            return [
-                exp.model_dump() if hasattr(exp, 'model_dump') else exp.__dict__
-                for exp in result.work_experiences
-            ]
-        # Handle dict result
-        elif result.get("experience"):
-            return [
-                Experience(**exp).model_dump() 
-                if hasattr(Experience(**exp), 'model_dump')
-                else Experience(**exp).__dict__
-                for exp in result.get("experience", [])
-            ]
-        return []
+        result = self._process_resume(file_path)
+        return _extract_facet(_EXPERIENCE_EXTRACTORS, result, list)
     
     def extract_skills(self, file_path: str) -> Dict[str, Any]:
         """
@@ -172,16 +211,8 @@ class MatchAIClient:
         Returns:
             Dictionary containing skills information.
         """
-        result = self._processor.process_resume(file_path)
-        
-        # Handle Resume object
-        if hasattr(result, 'skills'):
-            return {'skills': result.skills}
-        # Handle dict result
-        elif result.get("skills"):
-            skills = Skills(**result.get("skills", {}))
-            return skills.model_dump() if hasattr(skills, 'model_dump') else skills.__dict__
-        return {'skills': []}
+        result = self._process_resume(file_path)
+        return _extract_facet(_SKILLS_EXTRACTORS, result, lambda: {'skills': []})
     
     def extract_years_of_experience(self, file_path: str) -> Optional[str]:
         """
@@ -193,16 +224,8 @@ class MatchAIClient:
         Returns:
             String containing years of experience or None if not found.
         """
-        result = self._processor.process_resume(file_path)
-        
-        # Handle Resume object
-        if hasattr(result, 'YoE') and result.YoE:
-            return result.YoE
-        # Handle dictionary result
-        elif isinstance(result, dict) and (result.get("YoE") or result.get("years_of_experience")):
-            return result.get("YoE") or result.get("years_of_experience")
-        
-        return None
+        result = self._process_resume(file_path)
+        return _extract_facet(_YOE_EXTRACTORS, result, lambda: None)
     
     def analyze_resume(self, resume_path: Union[str, pathlib.Path], 
                       plugins: Optional[List[str]] = None,
@@ -2,30 +2,31 @@
 Core functionality for MatchAI.
 """
 
+from .._lazy import lazy_exports
 from . import config
 from . import constants
-from .llm_service import LLMService
-from .resume_processor import PluginResumeProcessor as ResumeProcessor
-from .utils import (
-    read_file,
-    validate_file,
-    parse_date,
-    calculate_experience,
-    setup_logging,
-    cleanup_token_usage_logs,
-    cleanup_pycache
-)
 
-__all__ = [
-    'config',
-    'constants',
-    'LLMService',
-    'ResumeProcessor',
-    'read_file',
-    'validate_file',
-    'parse_date',
-    'calculate_experience',
-    'setup_logging',
-    'cleanup_token_usage_logs',
-    'cleanup_pycache'
-] 
\ No newline at end of file
+# Exported name -> submodule, imported on first attribute access, so that importing
+# config (as every plugin does) does not load LangChain and the resume processor
+_LAZY_EXPORTS = {
+    'LLMService': '.llm_service',
+    'ResponseCache': '.response_cache',
+    'ExtractionCache': '.llm_cache',
+    'ResumeProcessor': '.resume_processor',
+    'read_file': '.utils',
+    'validate_file': '.utils',
+    'parse_date': '.utils',
+    'calculate_experience': '.utils',
+    'setup_logging': '.utils',
+    'cleanup_token_usage_logs': '.utils',
+    'cleanup_pycache': '.utils'
+}
+
+# Names exported under a different name in their module
+_RENAMED_EXPORTS = {
+    'ResumeProcessor': 'PluginResumeProcessor'
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    globals(), _LAZY_EXPORTS, renamed=_RENAMED_EXPORTS, eager=('config', 'constants')
+)
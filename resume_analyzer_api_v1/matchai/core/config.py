@@ -10,6 +10,8 @@ GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 
 # LLM Models
 DEFAULT_LLM_MODEL = os.environ.get("DEFAULT_LLM_MODEL", "gemini-2.0-flash")
+# Cheaper model tried first by extractors with simple schemas (e.g. "gemini-2.0-flash-lite"); empty disables the cascade
+CASCADE_LLM_MODEL = os.environ.get("CASCADE_LLM_MODEL", "")
 
 # Date formats
 DATE_FORMAT = constants.DEFAULT_DATE_FORMAT
@@ -43,4 +45,33 @@ ENABLE_CUSTOM_PLUGINS = True
 
 # LLM configuration for plugins
 LLM_MODEL = os.environ.get("LLM_MODEL", DEFAULT_LLM_MODEL)
-LLM_TEMPERATURE = float(os.environ.get("LLM_TEMPERATURE", str(constants.DEFAULT_MODEL_TEMPERATURE))) 
\ No newline at end of file
+LLM_TEMPERATURE = float(os.environ.get("LLM_TEMPERATURE", str(constants.DEFAULT_MODEL_TEMPERATURE))) 
+
+# LLM response cache (per process). Set RESPONSE_CACHE_MAX_SIZE=0 to disable.
+RESPONSE_CACHE_MAX_SIZE = int(os.environ.get("RESPONSE_CACHE_MAX_SIZE", "256"))
+RESPONSE_CACHE_TTL_SECONDS = int(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", "3600"))
+# Directory for the persistent extraction cache (one JSON file per result); unset disables it
+EXTRACTION_CACHE_DIR = os.environ.get("EXTRACTION_CACHE_DIR")
+# Validate every LLM result against its Pydantic model (slow; for debugging extraction output)
+STRICT_OUTPUT_VALIDATION = os.environ.get("STRICT_OUTPUT_VALIDATION", "False").lower() == "true"
+# Leading characters of the resume sent to the profile extractor; 0 (the default) sends the full text.
+# Its prompt also reads the experience section, so only set this when that section is not needed.
+PROFILE_TEXT_MAX_CHARS = int(os.environ.get("PROFILE_TEXT_MAX_CHARS", "0"))
+# Run all text-based extractors as one LLM call with a combined schema instead of one call each
+FUSED_EXTRACTION = os.environ.get("FUSED_EXTRACTION", "False").lower() == "true"
+# Corrections requested (in the same conversation) when the model returns unusable JSON
+LLM_FEEDBACK_RETRIES = int(os.environ.get("LLM_FEEDBACK_RETRIES", "2"))
+# Approximate token budget for resume text sent to an extractor (head and tail are kept); 0 disables
+MAX_INPUT_TOKENS = int(os.environ.get("MAX_INPUT_TOKENS", "16000"))
+# Describe the expected output with a minified JSON schema (no titles) instead of LangChain's verbose instructions
+COMPACT_FORMAT_INSTRUCTIONS = os.environ.get("COMPACT_FORMAT_INSTRUCTIONS", "True").lower() == "true"
+# Read LLM responses as a stream of chunks instead of one blocking response
+STREAM_LLM_RESPONSES = os.environ.get("STREAM_LLM_RESPONSES", "False").lower() == "true"
+# Resumes processed concurrently by process_all_resumes. Each one still runs its extractors in
+# parallel, so up to RESUME_BATCH_WORKERS x 4 extractor LLM calls are in flight at once.
+RESUME_BATCH_WORKERS = int(os.environ.get("RESUME_BATCH_WORKERS", "4"))
+# Skip resumes in process_all_resumes that already have a saved result from the same content,
+# file name, models, plugins and prompts (see <output_dir>/.processed)
+SKIP_PROCESSED_RESUMES = os.environ.get("SKIP_PROCESSED_RESUMES", "False").lower() == "true"
+# Pickled WordNet synonym snapshot for the keyword matcher (see build_wordnet_snapshot); unset queries NLTK directly
+WORDNET_SNAPSHOT_PATH = os.environ.get("WORDNET_SNAPSHOT_PATH")
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Persistent, content-addressed cache for LLM extraction results."""
+import logging
+import os
+import tempfile
+from typing import Optional
+
+
+class ExtractionCache:
+    """
+    Stores extraction results as JSON files named by their cache key.
+
+    Keys are hex digests (see ResponseCache.make_key), so the same resume text,
+    model and prompt always map to the same file and survive process restarts.
+    """
+
+    def __init__(self, cache_dir: str, suffix: str = ".json"):
+        """
+        Initialize the cache, creating the directory if needed.
+
+        Args:
+            cache_dir: Directory holding the cached JSON files.
+            suffix: File name suffix of the entries (e.g. ".txt" for plain text).
+        """
+        self.cache_dir = cache_dir
+        self.suffix = suffix
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self.suffix}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached JSON bytes for key, or None on a miss."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logging.warning(f"Could not read extraction cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, json_bytes: bytes) -> None:
+        """Store JSON bytes under key; the file is replaced atomically."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_bytes)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logging.warning(f"Could not write extraction cache entry {key}: {e}")
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for key, if any."""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not remove extraction cache entry {key}: {e}")
@@ -2,23 +2,170 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.messages import HumanMessage
+from langchain.callbacks.base import BaseCallbackHandler
+from langchain.schema import LLMResult
 from functools import lru_cache
 from . import config
-from typing import Type, Any, Dict, Tuple, Optional
+from .response_cache import ResponseCache
+from .llm_cache import ExtractionCache
+from .utils.token_budget import CHARS_PER_TOKEN
+from typing import Type, Any, Dict, Tuple, Optional, List, Callable, Sequence
 from pydantic import BaseModel
+import pydantic_core
+import asyncio
+import json
 import logging
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sent back to the model, after its own response, when that response could not be used
+FEEDBACK_PROMPT = """Your previous response could not be used: {error}
+Return the complete, corrected JSON object only."""
+
+def _loads_json(data: Any) -> Any:
+    """
+    Parse JSON text or bytes with orjson when it is installed, else with pydantic-core's
+    jiter-based parser (repeated keys and strings are interned across the document).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return pydantic_core.from_json(data, cache_strings="all")
+
+def _dumps_json(value: Any) -> bytes:
+    """Serialize a JSON-compatible value to UTF-8 bytes, with orjson when it is installed."""
+    return orjson.dumps(value) if orjson is not None else json.dumps(value).encode("utf-8")
+
+@lru_cache(maxsize=8)
+def _get_shared_llm(api_key: str, model_name: str) -> ChatGoogleGenerativeAI:
+    """
+    Return the chat model for this key and model, creating it on first use.
+    
+    The chat model owns the client and its connection pool, so every LLMService
+    (and every plugin) using the same key and model reuses one set of connections.
+    The cache is bounded so that callers passing many different API keys do not
+    keep a client (and its pool) alive for each of them.
+    """
+    return ChatGoogleGenerativeAI(
+        api_key=api_key,
+        model=model_name,
+        response_mime_type="application/json"
+    )
+
+# Schema-mapping keywords whose values are keyed by property or definition name
+_SCHEMA_NAME_MAPS = frozenset(("properties", "$defs", "definitions"))
+
+def _strip_schema_titles(node: Any) -> Any:
+    """Drop the "title" keywords pydantic adds to every schema node; field names are kept."""
+    if isinstance(node, list):
+        return [_strip_schema_titles(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    return {
+        key: ({name: _strip_schema_titles(sub) for name, sub in value.items()}
+              if key in _SCHEMA_NAME_MAPS and isinstance(value, dict)
+              else _strip_schema_titles(value))
+        for key, value in node.items()
+        if key != "title"
+    }
+
+@lru_cache(maxsize=None)
+def _get_format_instructions(pydantic_model: Type[BaseModel]) -> str:
+    """
+    Return the model's JSON format instructions, braces escaped for a prompt template.
+    
+    Generating them builds the model's JSON schema, so they are computed once per
+    model class and shared by every service, plugin and prompt. With
+    config.COMPACT_FORMAT_INSTRUCTIONS the schema is sent minified and without
+    titles, which cuts the prompt tokens spent on it on every call.
+    """
+    if config.COMPACT_FORMAT_INSTRUCTIONS:
+        schema = _strip_schema_titles(pydantic_model.model_json_schema())
+        instructions = ("Return only a JSON object conforming to this JSON schema:\n"
+                        + json.dumps(schema, separators=(",", ":"), ensure_ascii=False))
+    else:
+        instructions = JsonOutputParser(pydantic_object=pydantic_model).get_format_instructions()
+    return instructions.replace("{", "{{").replace("}", "}}")
+
+@lru_cache(maxsize=64)
+def _build_prompt(pydantic_model: Type[BaseModel], prompt_template: str, input_variables: Tuple[str, ...]) -> PromptTemplate:
+    """
+    Return the prompt for this model, template and variables, building it on first use.
+    
+    Prompts hold no per-call state, so one instance serves every service and call
+    that extracts the same model with the same template.
+    """
+    return PromptTemplate(
+        template=prompt_template.replace("{format_instructions}", _get_format_instructions(pydantic_model)),
+        input_variables=[name for name in input_variables if name != "format_instructions"]
+    )
+
+class TokenUsageCallbackHandler(BaseCallbackHandler):
+    """Collects the token usage reported by the LLM for one extraction call."""
+    
+    def __init__(self):
+        super().__init__()
+        self.token_usage = {
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "source": "not_set"
+        }
+
+    def _add(self, usage: Dict[str, Any], prompt_key: str, completion_key: str, source: str) -> None:
+        get = usage.get
+        token_usage = self.token_usage
+        token_usage["total_tokens"] += get("total_tokens", 0)
+        token_usage["prompt_tokens"] += get(prompt_key, 0)
+        token_usage["completion_tokens"] += get(completion_key, 0)
+        token_usage["source"] = source
+    
+    def on_llm_end(self, response: LLMResult, **kwargs) -> None:
+        """Extract token usage from the LLM response."""
+        token_found = False
+        for gen_list in getattr(response, "generations", None) or ():
+            for gen in gen_list:
+                # Gemini (via langchain_google_genai) reports usage_metadata, with
+                # input/output token names, on the generation or on its message
+                usage = getattr(gen, "usage_metadata", None)
+                if usage:
+                    self._add(usage, "input_tokens", "output_tokens", "usage_metadata")
+                    logging.info("Token usage found in usage_metadata: %s", usage)
+                    return
+                usage = getattr(getattr(gen, "message", None), "usage_metadata", None)
+                if usage:
+                    self._add(usage, "input_tokens", "output_tokens", "message_usage_metadata")
+                    logging.info("Token usage found in message usage_metadata: %s", usage)
+                    return
+                
+                # Fall back to the per-generation info, summed over generations
+                usage = (getattr(gen, "generation_info", None) or {}).get("token_usage")
+                if usage:
+                    self._add(usage, "prompt_tokens", "completion_tokens", "generation_info")
+                    token_found = True
+        
+        # Check for token usage in llm_output (standard location)
+        if not token_found:
+            usage = (getattr(response, "llm_output", None) or {}).get("token_usage")
+            if usage:
+                self._add(usage, "prompt_tokens", "completion_tokens", "llm_output")
+
 class LLMService:
     """Service for interacting with LLM API."""
     
-    def __init__(self, model_name=None, api_key=None):
+    def __init__(self, model_name=None, api_key=None, cache_dir=None):
         """
         Initialize the LLM service.
         
         Args:
             model_name: The name of the model to use. Defaults to config.DEFAULT_LLM_MODEL.
             api_key: The API key to use. If None, will use config.GOOGLE_API_KEY
+            cache_dir: Directory for the persistent extraction cache. Defaults to
+                config.EXTRACTION_CACHE_DIR; None disables it.
         """
         self.model_name = model_name or config.DEFAULT_LLM_MODEL
         self.api_key = api_key or config.GOOGLE_API_KEY or os.environ.get("GOOGLE_API_KEY")
@@ -27,17 +174,67 @@ class LLMService:
             raise ValueError("Google API key is required. Either provide it directly to LLMService or set the GOOGLE_API_KEY environment variable.")
             
         self.llm = self._get_llm()
+        # JsonOutputParser only needs the Pydantic model for format instructions,
+        # so a single instance can parse every response
+        self._json_parser = JsonOutputParser()
+        # Parsed responses for repeat extractions of the same text
+        self.response_cache = ResponseCache()
+        # Optional on-disk tier, shared across processes and restarts
+        cache_dir = cache_dir or config.EXTRACTION_CACHE_DIR
+        self.extraction_cache = ExtractionCache(cache_dir) if cache_dir else None
     
     def _get_llm(self):
         """
-        Get a LLM instance.
+        Get a LLM instance, shared by all services with the same key and model.
+        
+        The model is put in JSON mode: every chain built by this service parses a JSON
+        object, and Gemini then returns bare JSON instead of prose or fenced markdown.
         
         Returns:
             A ChatGoogleGenerativeAI instance.
         """
-        return ChatGoogleGenerativeAI(api_key=self.api_key, model=self.model_name)
+        return _get_shared_llm(self.api_key, self.model_name)
+    
+    def build_prompt(self, pydantic_model: Type[BaseModel], prompt_template: str, input_variables: List[str]) -> PromptTemplate:
+        """
+        Build a prompt with the model's format instructions already filled in.
+        
+        Plugins build this once and pass it to extract_with_llm, which avoids
+        regenerating the JSON schema instructions on every call. The instructions
+        are written into the template text itself (with their braces escaped), so
+        rendering a call only substitutes the per-call variables such as {text}.
+        Prompts are memoized by (model, template, variables), so callers that do not
+        pass a pre-built prompt reuse the same one too.
+        
+        Args:
+            pydantic_model: The Pydantic model describing the expected output.
+            prompt_template: The prompt template to use.
+            input_variables: The list of input variables for the prompt template.
+            
+        Returns:
+            A PromptTemplate whose only placeholders are input_variables.
+        """
+        return _build_prompt(pydantic_model, prompt_template, tuple(input_variables))
     
-    def create_extraction_chain(self, pydantic_model: Type[BaseModel], prompt_template: str, input_variables: list):
+    def _parse_json_response(self, message: Any, json_loader: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        Parse a complete JSON-mode response.
+        
+        The model returns bare JSON, so the content is decoded directly (with json_loader,
+        defaulting to orjson or pydantic-core's jiter parser); anything else (e.g. fenced
+        markdown) falls back to the more tolerant JsonOutputParser.
+        """
+        content = getattr(message, "content", message)
+        if isinstance(content, str):
+            try:
+                return (json_loader or _loads_json)(content)
+            except ValueError:
+                pass
+        return self._json_parser.invoke(message)
+    
+    def create_extraction_chain(self, pydantic_model: Type[BaseModel], prompt_template: str, input_variables: list,
+                                prompt: Optional[PromptTemplate] = None, model_name: Optional[str] = None,
+                                streaming: bool = False):
         """
         Create a chain for extracting information using a language model.
         
@@ -45,22 +242,153 @@ class LLMService:
             pydantic_model: The Pydantic model to use for parsing the output.
             prompt_template: The prompt template to use.
             input_variables: The list of input variables for the prompt template.
+            prompt: Optional pre-built prompt (see build_prompt); skips rebuilding it.
+            model_name: Optional model to use instead of the service's model.
+            streaming: Whether the chain will be streamed; streaming needs the
+                JsonOutputParser, which also parses partial output.
             
         Returns:
             A chain that can be used to extract information.
         """
-        parser = JsonOutputParser(pydantic_object=pydantic_model)
+        if prompt is None:
+            prompt = self.build_prompt(pydantic_model, prompt_template, input_variables)
         
-        prompt = PromptTemplate(
-            template=prompt_template,
-            input_variables=input_variables,
-            partial_variables={"format_instructions": parser.get_format_instructions()}
-        )
+        return prompt | self._llm_for(model_name) | (self._json_parser if streaming else self._parse_json_response)
+    
+    def _llm_for(self, model_name: Optional[str] = None) -> ChatGoogleGenerativeAI:
+        """Get the chat model for model_name, defaulting to the service's own model."""
+        return self.llm if model_name in (None, self.model_name) else _get_shared_llm(self.api_key, model_name)
+    
+    def _invoke_with_feedback(self, pydantic_model: Type[BaseModel], prompt_template: str, input_variables: list,
+                              input_data: dict, run_config: dict, prompt: Optional[PromptTemplate] = None,
+                              model_name: Optional[str] = None,
+                              json_loader: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+        """
+        Invoke the model, feeding unusable output back to it for a corrected answer.
+        
+        A response that is not a JSON object (or, with STRICT_OUTPUT_VALIDATION, does not
+        validate) is answered in the same conversation - the original prompt, the bad
+        response and the error - instead of re-running the extraction from scratch. Up to
+        config.LLM_FEEDBACK_RETRIES corrections are requested, each sent right away: the
+        model answered, so there is no failure to back off from.
+        With config.STREAM_LLM_RESPONSES each response is streamed (see _collect_stream).
+        
+        Returns:
+            The parsed JSON object.
+            
+        Raises:
+            ValueError: If the last attempt still produced unusable output.
+        """
+        if prompt is None:
+            prompt = self.build_prompt(pydantic_model, prompt_template, input_variables)
+        llm = self._llm_for(model_name)
+        messages = prompt.invoke(input_data).to_messages()
+        
+        retries = max(0, config.LLM_FEEDBACK_RETRIES)
+        for attempt in range(retries + 1):
+            if config.STREAM_LLM_RESPONSES:
+                response = self._collect_stream(llm, messages, run_config)
+            else:
+                response = llm.invoke(messages, config=run_config)
+            try:
+                result = self._parse_json_response(response, json_loader)
+                if not isinstance(result, dict):
+                    raise ValueError(f"expected a JSON object, got {type(result).__name__}")
+                if config.STRICT_OUTPUT_VALIDATION:
+                    pydantic_model.model_validate(result)
+                return result
+            except ValueError as e:
+                if attempt == retries:
+                    raise
+                logging.warning("Unusable %s output on attempt %d, asking the model to correct it: %s",
+                                pydantic_model.__name__, attempt + 1, e)
+                messages = [*messages, response, HumanMessage(content=FEEDBACK_PROMPT.format(error=e))]
+    
+    @staticmethod
+    def _collect_stream(llm: ChatGoogleGenerativeAI, messages: list, run_config: dict) -> Any:
+        """
+        Stream a response and merge its chunks into one message.
+        
+        Chunks are merged as they arrive rather than joined at the end, and the
+        stream is read to the end so the usage metadata sent with the final chunk
+        reaches the token usage callback.
+        """
+        response = None
+        for chunk in llm.stream(messages, config=run_config):
+            response = chunk if response is None else response + chunk
+        if response is None:
+            raise ValueError("the model returned an empty stream")
+        return response
+    
+    def _get_cached(self, cache_key: str, pydantic_model: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """
+        Look a result up in the in-memory cache, then in the persistent cache.
         
-        return prompt | self.llm | parser
+        Persistent entries outlive the process, so when pydantic_model is given they are
+        validated against it; unreadable or invalid entries are removed and treated as misses.
+        """
+        cached_result = self.response_cache.get(cache_key)
+        if cached_result is not None or self.extraction_cache is None:
+            return cached_result
+        
+        cached_bytes = self.extraction_cache.get(cache_key)
+        if cached_bytes is None:
+            return None
+        try:
+            cached_result = _loads_json(cached_bytes)
+            if not isinstance(cached_result, dict):
+                raise ValueError(f"expected a JSON object, got {type(cached_result).__name__}")
+            if pydantic_model is not None:
+                pydantic_model.model_validate(cached_result)
+        except ValueError as e:
+            logging.warning(f"Removing invalid extraction cache entry {cache_key}: {e}")
+            self.extraction_cache.delete(cache_key)
+            return None
+        self.response_cache.put(cache_key, cached_result)
+        return cached_result
+    
+    def _put_cached(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Store a result in the in-memory cache and, if enabled, the persistent cache."""
+        self.response_cache.put(cache_key, result)
+        if self.extraction_cache is not None:
+            self.extraction_cache.put(cache_key, _dumps_json(result))
+    
+    @staticmethod
+    def _stream_sections(chain: Any, input_data: dict, run_config: dict,
+                         on_section: Callable[[str, Any], None]) -> Any:
+        """
+        Stream a chain's JSON output, handing off each top-level key once it is complete.
+        
+        The parser yields the growing object after every chunk. Keys arrive in order,
+        so every key before the last one is final; the last key is final when the
+        stream ends.
+        
+        Returns:
+            The complete parsed output.
+        """
+        result: Any = {}
+        emitted = set()
+        for partial in chain.stream(input_data, config=run_config):
+            if not isinstance(partial, dict):
+                continue
+            result = partial
+            for key in list(partial)[:-1]:
+                if key not in emitted:
+                    emitted.add(key)
+                    on_section(key, partial[key])
+        
+        if isinstance(result, dict):
+            for key, value in result.items():
+                if key not in emitted:
+                    on_section(key, value)
+        return result
     
     def extract_with_llm(self, pydantic_model: Type[BaseModel], prompt_template: str, 
-                        input_variables: list, input_data: dict) -> Tuple[Any, Dict[str, int]]:
+                        input_variables: list, input_data: dict,
+                        prompt: Optional[PromptTemplate] = None,
+                        on_section: Optional[Callable[[str, Any], None]] = None,
+                        model_name: Optional[str] = None,
+                        json_loader: Optional[Callable[[str], Any]] = None) -> Tuple[Any, Dict[str, int]]:
         """
         Extract information from text using a language model.
         
@@ -69,102 +397,69 @@ class LLMService:
             prompt_template: The prompt template to use.
             input_variables: The list of input variables for the prompt template.
             input_data: The input data to pass to the prompt template.
+            prompt: Optional pre-built prompt (see build_prompt); skips rebuilding it.
+            on_section: Optional callback; when given, the response is streamed and
+                on_section(key, value) is called as soon as each top-level key is complete.
+            model_name: Optional model to use instead of the service's model.
+            json_loader: Optional function decoding the JSON response text; defaults to
+                orjson.loads when installed, else pydantic_core.from_json. Not used when streaming.
             
         Returns:
             A tuple containing:
             - The extracted information as a dictionary
             - A dictionary with token usage information
         """
-        try:
-            # Initialize token usage
-            token_usage = {
+        # Identical model, schema, template and inputs yield the same extraction, so serve
+        # repeats (re-uploads, bulk re-runs) from the response cache. The schema is part of
+        # the key so that persistent entries written before a model change are not reused.
+        cache_key = ResponseCache.make_key(
+            model_name or self.model_name, pydantic_model.__name__,
+            _get_format_instructions(pydantic_model), prompt_template,
+            *(part for name in sorted(input_data) for part in (name, input_data[name]))
+        )
+        cached_result = self._get_cached(cache_key, pydantic_model)
+        if cached_result is not None:
+            logging.info(f"Response cache hit for {pydantic_model.__name__}")
+            if on_section is not None and isinstance(cached_result, dict):
+                for key, value in cached_result.items():
+                    on_section(key, value)
+            return cached_result, {
                 "total_tokens": 0,
                 "prompt_tokens": 0,
-                "completion_tokens": 0
+                "completion_tokens": 0,
+                "source": "cache",
+                "cache_hit": True
             }
-            
-            # Create a custom callback handler to track token usage
-            from langchain.callbacks.base import BaseCallbackHandler
-            from langchain.schema import LLMResult
-            
-            class TokenUsageCallbackHandler(BaseCallbackHandler):
-                def __init__(self):
-                    super().__init__()
-                    self.token_usage = {
-                        "total_tokens": 0,
-                        "prompt_tokens": 0,
-                        "completion_tokens": 0,
-                        "source": "not_set"
-                    }
-                    
-                def on_llm_end(self, response: LLMResult, **kwargs) -> None:
-                    """Extract token usage from the LLM response."""
-                    # First check for usage_metadata in the generations (specific to Gemini via langchain_google_genai)
-                    token_found = False
-                    if hasattr(response, "generations") and response.generations:
-                        for gen_list in response.generations:
-                            for gen in gen_list:
-                                # Check for usage_metadata (Gemini's specific location for token info)
-                                if hasattr(gen, "usage_metadata") and gen.usage_metadata:
-                                    usage = gen.usage_metadata
-                                    self.token_usage["total_tokens"] = usage.get("total_tokens", 0)
-                                    self.token_usage["prompt_tokens"] = usage.get("input_tokens", 0)  # Gemini uses input_tokens
-                                    self.token_usage["completion_tokens"] = usage.get("output_tokens", 0)  # Gemini uses output_tokens
-                                    self.token_usage["source"] = "usage_metadata"
-                                    token_found = True
-                                    logging.info(f"Token usage found in usage_metadata: {usage}")
-                                    return
-                                
-                                # Check for usage_metadata in generation's message (alternate location)
-                                if hasattr(gen, "message") and hasattr(gen.message, "usage_metadata") and gen.message.usage_metadata:
-                                    usage = gen.message.usage_metadata
-                                    self.token_usage["total_tokens"] = usage.get("total_tokens", 0)
-                                    self.token_usage["prompt_tokens"] = usage.get("input_tokens", 0)
-                                    self.token_usage["completion_tokens"] = usage.get("output_tokens", 0)
-                                    self.token_usage["source"] = "message_usage_metadata"
-                                    token_found = True
-                                    logging.info(f"Token usage found in message usage_metadata: {usage}")
-                                    return
-                                    
-                                # Fall back to checking in generation_info
-                                if hasattr(gen, "generation_info") and gen.generation_info:
-                                    usage = gen.generation_info.get("token_usage", {})
-                                    if usage:
-                                        self.token_usage["total_tokens"] += usage.get("total_tokens", 0)
-                                        self.token_usage["prompt_tokens"] += usage.get("prompt_tokens", 0) 
-                                        self.token_usage["completion_tokens"] += usage.get("completion_tokens", 0)
-                                        self.token_usage["source"] = "generation_info"
-                                        token_found = True
-                    
-                    # Check for token usage in llm_output (standard location)
-                    if not token_found and hasattr(response, "llm_output") and response.llm_output:
-                        usage = response.llm_output.get("token_usage", {})
-                        if usage:
-                            self.token_usage["total_tokens"] += usage.get("total_tokens", 0)
-                            self.token_usage["prompt_tokens"] += usage.get("prompt_tokens", 0)
-                            self.token_usage["completion_tokens"] += usage.get("completion_tokens", 0)
-                            self.token_usage["source"] = "llm_output"
-            
+        
+        try:
             # Use the custom callback to track token usage
             callback_handler = TokenUsageCallbackHandler()
             
-            # Create the chain and include our callback
-            chain = self.create_extraction_chain(pydantic_model, prompt_template, input_variables)
-            
-            # Invoke the chain with our custom callback
-            from langchain.callbacks.manager import CallbackManager
-            result = chain.invoke(input_data, config={"callbacks": [callback_handler]})
+            # Invoke the model with our custom callback
+            run_config = {"callbacks": [callback_handler]}
+            if on_section is None:
+                result = self._invoke_with_feedback(pydantic_model, prompt_template, input_variables, input_data,
+                                                    run_config, prompt=prompt, model_name=model_name,
+                                                    json_loader=json_loader)
+            else:
+                chain = self.create_extraction_chain(pydantic_model, prompt_template, input_variables,
+                                                     prompt=prompt, model_name=model_name, streaming=True)
+                result = self._stream_sections(chain, input_data, run_config, on_section)
             
             # Get token usage from callback
             token_usage = callback_handler.token_usage
             
             # Estimate tokens if we couldn't get accurate counts
             if token_usage["total_tokens"] == 0:
-                # Estimate based on text length
-                prompt_text = prompt_template.format(**input_data)
-                # Rough estimate: 4 chars per token
-                estimated_prompt_tokens = len(prompt_text) // 4
-                estimated_completion_tokens = len(str(result)) // 4
+                # Estimate from character counts (CHARS_PER_TOKEN chars per token) without
+                # rendering the prompt or the result
+                prompt_chars = len(prompt_template) + sum(len(str(value)) for value in input_data.values())
+                if isinstance(result, dict):
+                    completion_chars = sum(len(str(value)) for value in result.values())
+                else:
+                    completion_chars = len(str(result))
+                estimated_prompt_tokens = prompt_chars // CHARS_PER_TOKEN
+                estimated_completion_tokens = completion_chars // CHARS_PER_TOKEN
                 
                 token_usage["prompt_tokens"] = estimated_prompt_tokens
                 token_usage["completion_tokens"] = estimated_completion_tokens
@@ -173,19 +468,95 @@ class LLMService:
                 token_usage["source"] = "estimation"
                 logging.info(f"Token counts are estimated. No token information provided by API.")
             
+            token_usage["cache_hit"] = False
+            
             # Convert Pydantic model to dictionary (for consistency)
             if isinstance(result, pydantic_model):
-                return result.model_dump(), token_usage
+                extracted = result.model_dump()
             elif isinstance(result, dict):
-                return result, token_usage
+                extracted = result
             elif hasattr(result, "__dict__"):
-                return result.__dict__, token_usage
-                
-            # If we got here, something unexpected happened. Return an empty dict.
-            return {}, token_usage
+                extracted = result.__dict__
+            else:
+                # If we got here, something unexpected happened. Return an empty dict.
+                return {}, token_usage
+            
+            # Results are consumed as plain dicts; full model validation is for debugging only
+            # (invoked results were already validated by _invoke_with_feedback)
+            if config.STRICT_OUTPUT_VALIDATION and on_section is not None:
+                pydantic_model.model_validate(extracted)
+            
+            if extracted:
+                self._put_cached(cache_key, extracted)
+            return extracted, token_usage
             
         except Exception as e:
-            print(f"Error extracting information with LLM: {e}")
+            logging.exception("Error extracting information with LLM: %s", e)
             # Return an empty dictionary and empty token usage
             empty_token_usage = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "source": "error"}
-            return {}, empty_token_usage 
\ No newline at end of file
+            return {}, empty_token_usage
+    
+    async def aextract_with_llm(self, *args: Any, **kwargs: Any) -> Tuple[Any, Dict[str, int]]:
+        """
+        Async variant of extract_with_llm, taking the same arguments.
+        
+        The call runs in a worker thread, so several extractions awaited together
+        (e.g. with asyncio.gather) overlap their round-trips to the model.
+        """
+        return await asyncio.to_thread(self.extract_with_llm, *args, **kwargs)
+    
+    def extract_with_cascade(self, cheap_models: Sequence[str], pydantic_model: Type[BaseModel],
+                             prompt_template: str, input_variables: list, input_data: dict,
+                             prompt: Optional[PromptTemplate] = None,
+                             validate: Optional[Callable[[Any], Any]] = None,
+                             json_loader: Optional[Callable[[str], Any]] = None) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Extract with the cheapest model first, escalating while the result fails validation.
+        
+        The models in cheap_models are tried in order, followed by the service's own
+        model, whose result is returned whether or not it validates.
+        
+        Args:
+            cheap_models: Cheaper models to try before the service's model.
+            pydantic_model: The Pydantic model to use for parsing the output.
+            prompt_template: The prompt template to use.
+            input_variables: The list of input variables for the prompt template.
+            input_data: The input data to pass to the prompt template.
+            prompt: Optional pre-built prompt (see build_prompt); skips rebuilding it.
+            validate: Callable that raises if a result is unacceptable.
+                Defaults to pydantic_model.model_validate.
+            json_loader: Optional function decoding the JSON response text (see extract_with_llm).
+            
+        Returns:
+            A tuple containing:
+            - The extracted information as a dictionary
+            - Token usage summed over all attempts, with the model that answered
+              ("cascade_model"), its position ("cascade_tier") and the number of attempts
+        """
+        models = list(dict.fromkeys([*cheap_models, self.model_name]))
+        validate = validate or pydantic_model.model_validate
+        totals = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        
+        for tier, model_name in enumerate(models):
+            result, token_usage = self.extract_with_llm(
+                pydantic_model, prompt_template, input_variables, input_data,
+                prompt=prompt, model_name=model_name, json_loader=json_loader
+            )
+            for key in totals:
+                totals[key] += token_usage.get(key, 0)
+            
+            is_last = tier == len(models) - 1
+            if not is_last:
+                if token_usage.get("source") == "error":
+                    continue
+                try:
+                    validate(result)
+                except Exception as e:
+                    logging.info(f"{model_name} result for {pydantic_model.__name__} failed validation, escalating: {e}")
+                    continue
+            
+            token_usage.update(totals)
+            token_usage["cascade_model"] = model_name
+            token_usage["cascade_tier"] = tier
+            token_usage["cascade_attempts"] = tier + 1
+            return result, token_usage
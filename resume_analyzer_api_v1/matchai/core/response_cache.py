@@ -0,0 +1,82 @@
+"""Response cache for LLM extraction calls."""
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from . import config
+
+
+class ResponseCache:
+    """
+    Thread-safe in-process LRU cache of parsed LLM responses, with a TTL.
+
+    Keys are SHA-256 digests built by make_key(); values are deep-copied on the way
+    in and out so callers can post-process results without corrupting the cache.
+    """
+
+    def __init__(self, max_size: int = None, ttl_seconds: int = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries. Defaults to config.RESPONSE_CACHE_MAX_SIZE.
+            ttl_seconds: Entry lifetime in seconds. Defaults to config.RESPONSE_CACHE_TTL_SECONDS.
+        """
+        self.max_size = config.RESPONSE_CACHE_MAX_SIZE if max_size is None else max_size
+        self.ttl_seconds = config.RESPONSE_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Collapse whitespace so re-extracted copies of the same resume share a key."""
+        return " ".join(text.split())
+
+    @classmethod
+    def make_key(cls, *parts: Any) -> str:
+        """
+        Build a cache key from the given parts.
+
+        String parts are whitespace-normalized; other parts are hashed by their repr.
+        Each part is prefixed with its 8-byte length, so no choice of part contents
+        (e.g. resume text containing a separator) can make two part lists collide.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            value = cls.normalize_text(part) if isinstance(part, str) else repr(part)
+            data = value.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a copy of value under key, evicting the least recently used entries."""
+        if self.max_size <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
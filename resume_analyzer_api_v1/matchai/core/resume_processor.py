@@ -1,13 +1,36 @@
 import os
+import asyncio
+import hashlib
+import functools
 import logging
 import concurrent.futures
-import json
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 from ..models.resume_models import Resume
-from ..plugins.base import PluginMetadata, PluginCategory
+from ..plugins.base import PluginMetadata, PluginCategory, build_extraction_context
 from . import config
 from . import constants
+from .llm_cache import ExtractionCache
+from .response_cache import ResponseCache
+from .utils.json_utils import write_json, write_json_background
+
+# Resume file suffixes, as a tuple for str.endswith
+RESUME_SUFFIXES = tuple(config.ALLOWED_FILE_EXTENSIONS)
+
+# Token counts summed across extractors into a resume's token usage
+_TOKEN_COUNT_KEYS = ("total_tokens", "prompt_tokens", "completion_tokens")
+
+class _PluginLookup(NamedTuple):
+    """The plugins process_resume uses, as of one PluginManager revision."""
+    revision: int
+    profile: Any
+    skills: Any
+    education: Any
+    experience: Any
+    yoe: Any
+    extractor_names: Tuple[str, ...]
+    custom: Tuple[Any, ...]  # custom plugins implementing process_resume
+    fingerprint: str  # digest of the models, plugins and prompts that shape a result
 
 class PluginResumeProcessor:
     """
@@ -29,192 +52,511 @@ class PluginResumeProcessor:
         self.output_dir = output_dir
         self.log_dir = log_dir
         self.plugin_manager = plugin_manager
+        self._plugin_lookup: Optional[_PluginLookup] = None
         
         # Ensure output directories exist
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(self.log_dir, exist_ok=True)
+        
+        # Text extracted from resume files, keyed by their content hash. It sits next to
+        # the LLM extraction cache, which already serves repeat extractor calls.
+        cache_dir = config.EXTRACTION_CACHE_DIR
+        self.text_cache = ExtractionCache(os.path.join(cache_dir, "text"), suffix=".txt") if cache_dir else None
+        
+        # Output file of each resume saved by process_all_resumes, keyed by the resume's
+        # content hash, output file and plugin fingerprint, so a restarted batch skips
+        # resumes it has already finished with the same models, plugins and prompts
+        self.processed_index = (
+            ExtractionCache(os.path.join(self.output_dir, ".processed"), suffix=".txt")
+            if config.SKIP_PROCESSED_RESUMES else None
+        )
     
     def get_resume_files(self) -> List[str]:
         """
         Get all resume files in the resume directory.
         
         Returns:
-            A list of resume file names
+            A list of resume file paths
         """
         if not os.path.exists(self.resume_dir):
             logging.error(f"Error: Directory not found at {self.resume_dir}")
             return []
         
-        # Get all PDF files in the directory
-        return [f for f in os.listdir(self.resume_dir) 
-                if os.path.splitext(f)[1].lower() in config.ALLOWED_FILE_EXTENSIONS]
+        # One scandir pass: entry types come with the listing, so no per-file stat
+        with os.scandir(self.resume_dir) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.lower().endswith(RESUME_SUFFIXES) and entry.is_file()]
+    
+    def _get_plugins(self) -> _PluginLookup:
+        """Resolve the plugins used per resume, again only after the loaded plugins change."""
+        manager = self.plugin_manager
+        lookup = self._plugin_lookup
+        if lookup is None or lookup.revision != manager.revision:
+            lookup = _PluginLookup(
+                revision=manager.revision,
+                profile=manager.get_plugin("profile_extractor"),
+                skills=manager.get_plugin("skills_extractor"),
+                education=manager.get_plugin("education_extractor"),
+                experience=manager.get_plugin("experience_extractor"),
+                yoe=manager.get_plugin("yoe_extractor"),
+                extractor_names=tuple(manager.get_extractor_plugins()),
+                # Only custom plugins that hook into process_resume are kept
+                custom=tuple(
+                    plugin for plugin in manager.get_plugins_by_category(PluginCategory.CUSTOM.name)
+                    if callable(getattr(plugin, 'process_resume', None))
+                ),
+                fingerprint=self._fingerprint(manager)
+            )
+            self._plugin_lookup = lookup
+        return lookup
+    
+    @staticmethod
+    def _fingerprint(manager: Any) -> str:
+        """Digest of everything besides the resume itself that a saved result depends on."""
+        llm_service = getattr(manager, "llm_service", None)
+        parts = [
+            getattr(llm_service, "model_name", None) or config.DEFAULT_LLM_MODEL,
+            config.CASCADE_LLM_MODEL,
+            config.FUSED_EXTRACTION
+        ]
+        for name, plugin in sorted(manager.plugins.items()):
+            get_prompt_template = getattr(plugin, "get_prompt_template", None)
+            parts.extend((
+                name,
+                plugin.metadata.version,
+                getattr(plugin, "CASCADE_MODELS", ()),
+                get_prompt_template() if callable(get_prompt_template) else ""
+            ))
+        return ResponseCache.make_key(*parts)
     
-    def process_resume(self, pdf_file_path: str) -> Optional[Resume]:
+    def _extract_separately(self, extracted_text: str, context: Dict[str, Any]) -> Tuple[
+            Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], List[Tuple[str, Dict[str, Any]]]]:
         """
-        Process a single resume file using plugins.
+        Run each extractor with its own LLM call.
         
         Args:
-            pdf_file_path: Path to the PDF resume file.
+            extracted_text: The resume text.
+            context: Run-wide values from build_extraction_context().
             
         Returns:
-            A Resume object with extracted information or None if processing failed.
+            The profile, skills, education, experience and YoE results, followed by
+            a list of (extractor label, token usage) pairs.
         """
-        from .utils.file_utils import read_file, validate_file
+        # Specifically get the plugins we need
+        plugins = self._get_plugins()
+        profile_plugin = plugins.profile
+        skills_plugin = plugins.skills
+        education_plugin = plugins.education
+        experience_plugin = plugins.experience
+        yoe_plugin = plugins.yoe
         
-        file_basename = os.path.basename(pdf_file_path)
+        safe_extract = self.plugin_manager.safe_extract
         
-        # Validate the file
-        is_valid, message = validate_file(pdf_file_path)
-        if not is_valid:
-            logging.error(f"Validation failed for {file_basename}: {message}")
-            return None
+        def extract_experience_and_yoe():
+            # YoE only needs the experience result, so it runs right after it on the same worker
+            experience_result = safe_extract(experience_plugin, extracted_text, context) if experience_plugin else ({}, {})
+            yoe_result = safe_extract(yoe_plugin, experience_result[0], context) if yoe_plugin else ({}, {})
+            return experience_result, yoe_result
         
-        try:
-            logging.info(f"Extracting text from {file_basename}")
-            # Extract text from the resume
-            extracted_text = read_file(pdf_file_path)
-            
-            logging.info(f"Extracting information using plugins from {file_basename}")
-            
-            # Initialize token usage dictionary
-            total_token_usage = {
-                "total_tokens": 0,
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "by_extractor": {},
-                "source": "plugins"
-            }
+        # Every LLM call is I/O-bound, so all four extractors run concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            future_profile = executor.submit(safe_extract, profile_plugin, extracted_text, context) if profile_plugin else None
+            future_skills = executor.submit(safe_extract, skills_plugin, extracted_text, context) if skills_plugin else None
+            future_education = executor.submit(safe_extract, education_plugin, extracted_text, context) if education_plugin else None
+            future_experience = executor.submit(extract_experience_and_yoe)
             
-            # Get all extractor plugins
-            extractor_plugins = self.plugin_manager.get_extractor_plugins()
-            
-            # Log which plugins we're using
-            logging.info(f"Using {len(extractor_plugins)} extractor plugins: {', '.join(extractor_plugins.keys())}")
-            
-            # Specifically get the plugins we need
-            profile_plugin = self.plugin_manager.get_plugin("profile_extractor")
-            skills_plugin = self.plugin_manager.get_plugin("skills_extractor")
-            education_plugin = self.plugin_manager.get_plugin("education_extractor")
-            experience_plugin = self.plugin_manager.get_plugin("experience_extractor")
-            yoe_plugin = self.plugin_manager.get_plugin("yoe_extractor")
-            
-            # Extract information concurrently using plugins (except for experience and YoE)
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future_profile = executor.submit(profile_plugin.extract, extracted_text) if profile_plugin else None
-                future_skills = executor.submit(skills_plugin.extract, extracted_text) if skills_plugin else None
-                future_education = executor.submit(education_plugin.extract, extracted_text) if education_plugin else None
-                
-                # Get results and token usage for profile, skills, and education
-                profile, profile_token_usage = future_profile.result() if future_profile else ({}, {})
-                skills, skills_token_usage = future_skills.result() if future_skills else ({}, {})
-                education, education_token_usage = future_education.result() if future_education else ({}, {})
-            
-            # Run experience extractor first
-            # logging.debug(f"ExtractedText {extracted_text}");
-            experience, experience_token_usage = experience_plugin.extract(extracted_text) if experience_plugin else ({}, {})
+            # Get results and token usage for each extractor
+            profile, profile_token_usage = future_profile.result() if future_profile else ({}, {})
+            skills, skills_token_usage = future_skills.result() if future_skills else ({}, {})
+            education, education_token_usage = future_education.result() if future_education else ({}, {})
+            (experience, experience_token_usage), (yoe, yoe_token_usage) = future_experience.result()
+        
+        return profile, skills, education, experience, yoe, [
+            ("profile", profile_token_usage),
+            ("skills", skills_token_usage),
+            ("education", education_token_usage),
+            ("experience", experience_token_usage),
+            ("yoe", yoe_token_usage)
+        ]
+    
+    async def _aextract_separately(self, extracted_text: str, context: Dict[str, Any]) -> Tuple[
+            Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Async counterpart of _extract_separately, gathering the extractors on the running event loop.
+        
+        Args:
+            extracted_text: The resume text.
+            context: Run-wide values from build_extraction_context().
             
-            # Then run YoE extractor with experience data
-            yoe, yoe_token_usage = yoe_plugin.extract(experience) if yoe_plugin else ({}, {})
+        Returns:
+            The profile, skills, education, experience and YoE results, followed by
+            a list of (extractor label, token usage) pairs.
+        """
+        plugins = self._get_plugins()
+        safe_extract_async = self.plugin_manager.safe_extract_async
+        
+        async def extract(plugin, data):
+            return await safe_extract_async(plugin, data, context) if plugin else ({}, {})
+        
+        async def extract_experience_and_yoe():
+            # YoE only needs the experience result, so it is awaited right after it
+            experience_result = await extract(plugins.experience, extracted_text)
+            return experience_result, await extract(plugins.yoe, experience_result[0])
+        
+        (profile, profile_token_usage), (skills, skills_token_usage), (education, education_token_usage), \
+            ((experience, experience_token_usage), (yoe, yoe_token_usage)) = await asyncio.gather(
+                extract(plugins.profile, extracted_text),
+                extract(plugins.skills, extracted_text),
+                extract(plugins.education, extracted_text),
+                extract_experience_and_yoe()
+            )
+        
+        return profile, skills, education, experience, yoe, [
+            ("profile", profile_token_usage),
+            ("skills", skills_token_usage),
+            ("education", education_token_usage),
+            ("experience", experience_token_usage),
+            ("yoe", yoe_token_usage)
+        ]
+    
+    def _extract_fused(self, extracted_text: str, context: Dict[str, Any]) -> Tuple[
+            Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Run every text-based extractor as one LLM call (see PluginManager.extract_batched).
+        
+        Returns:
+            The same shape as _extract_separately, with a single "batched" token usage entry.
+        """
+        # Each plugin's result is a projection of its section, and YoE runs on the experience section
+        fused, fused_token_usage = self.plugin_manager.extract_batched(extracted_text, context)
+        return (
+            fused.get("profile_extractor", {}),
+            fused.get("skills_extractor", {}),
+            fused.get("education_extractor", {}),
+            fused.get("experience_extractor", {}),
+            fused.get("yoe_extractor", {}),
+            [("batched", fused_token_usage)]
+        )
+    
+    def process_resume(self, pdf_file_path: str, fused: Optional[bool] = None,
+                       data: Optional[bytes] = None) -> Optional[Resume]:
+        """
+        Process a single resume file using plugins.
+        
+        Args:
+            pdf_file_path: Path to the PDF resume file.
+            fused: Whether to run all text-based extractors as one LLM call
+                (see PluginManager.extract_batched). Defaults to config.FUSED_EXTRACTION.
+            data: The file content, if the caller has already read it.
             
-            logging.debug(f"Extraction completed for {file_basename}")
+        Returns:
+            A Resume object with extracted information or None if processing failed.
+        """
+        file_basename = os.path.basename(pdf_file_path)
+        try:
+            extracted_text = self._load_text(pdf_file_path, file_basename, data)
+            if extracted_text is None:
+                return None
             
-            # Aggregate token usage
-            for extractor_name, extractor_usage in [
-                ("profile", profile_token_usage),
-                ("skills", skills_token_usage),
-                ("education", education_token_usage),
-                ("experience", experience_token_usage),
-                ("yoe", yoe_token_usage)
-            ]:
-                if extractor_usage:
-                    total_token_usage["total_tokens"] += extractor_usage.get("total_tokens", 0)
-                    total_token_usage["prompt_tokens"] += extractor_usage.get("prompt_tokens", 0)
-                    total_token_usage["completion_tokens"] += extractor_usage.get("completion_tokens", 0)
-                    
-                    # Store by extractor for detailed breakdown
-                    total_token_usage["by_extractor"][extractor_name] = {
-                        "total_tokens": extractor_usage.get("total_tokens", 0),
-                        "prompt_tokens": extractor_usage.get("prompt_tokens", 0),
-                        "completion_tokens": extractor_usage.get("completion_tokens", 0),
-                        "source": extractor_usage.get("source", "plugin")
-                    }
+            plugins, context, fused = self._start_extraction(file_basename, fused)
+            if fused:
+                extraction = self._extract_fused(extracted_text, context)
+            else:
+                extraction = self._extract_separately(extracted_text, context)
             
-            logging.info(f"Total tokens used for {file_basename}: {total_token_usage['total_tokens']}")
+            return self._build_resume(pdf_file_path, file_basename, extracted_text, plugins, *extraction)
             
-            # Create a Resume object from the extracted information
-            resume = Resume.from_extractors_output(
-                profile, skills, education, experience, yoe, pdf_file_path, total_token_usage
-            )
+        except Exception as e:
+            logging.exception(f"Error processing resume {file_basename}: {e}")
+            return None
+    
+    async def process_resume_async(self, pdf_file_path: str, fused: Optional[bool] = None,
+                                   data: Optional[bytes] = None) -> Optional[Resume]:
+        """
+        Async counterpart of process_resume.
+        
+        The separate extractors are gathered on the running event loop instead of a
+        per-resume thread pool, so many resumes can be processed from one loop.
+        File reading and the fused LLM call run in worker threads.
+        
+        Args:
+            pdf_file_path: Path to the PDF resume file.
+            fused: Whether to run all text-based extractors as one LLM call.
+                Defaults to config.FUSED_EXTRACTION.
+            data: The file content, if the caller has already read it.
             
-            # Process any custom plugins
-            custom_plugins = [p for p in self.plugin_manager.plugins.values() 
-                             if p.metadata.category == PluginCategory.CUSTOM]
+        Returns:
+            A Resume object with extracted information or None if processing failed.
+        """
+        file_basename = os.path.basename(pdf_file_path)
+        try:
+            extracted_text = await asyncio.to_thread(self._load_text, pdf_file_path, file_basename, data)
+            if extracted_text is None:
+                return None
             
-            for plugin in custom_plugins:
-                try:
-                    if hasattr(plugin, 'process_resume'):
-                        logging.debug('CCCCCUSTOM');
-                        plugin_data = plugin.process_resume(resume, extracted_text)
-                        if plugin_data:
-                            resume.add_plugin_data(plugin.metadata.name, plugin_data)
-                except Exception as e:
-                    logging.error(f"Error processing custom plugin {plugin.metadata.name}: {e}")
+            plugins, context, fused = self._start_extraction(file_basename, fused)
+            if fused:
+                extraction = await asyncio.to_thread(self._extract_fused, extracted_text, context)
+            else:
+                extraction = await self._aextract_separately(extracted_text, context)
             
-            return resume
+            return self._build_resume(pdf_file_path, file_basename, extracted_text, plugins, *extraction)
             
         except Exception as e:
             logging.exception(f"Error processing resume {file_basename}: {e}")
             return None
     
+    def _load_text(self, file_path: str, file_basename: str, data: Optional[bytes]) -> Optional[str]:
+        """Read the resume file once (unless data is given) and return its validated text, or None."""
+        from .utils.file_utils import read_bytes
+        
+        # Read the file once; validation and text extraction both work on these bytes
+        if data is None and os.path.exists(file_path):
+            try:
+                data = read_bytes(file_path)
+            except OSError as e:
+                logging.error(f"Could not read {file_basename}: {e}")
+                return None
+        
+        logging.info(f"Extracting text from {file_basename}")
+        return self._read_text(file_path, data)
+    
+    def _start_extraction(self, file_basename: str, fused: Optional[bool]) -> Tuple[_PluginLookup, Dict[str, Any], bool]:
+        """Return the current plugins, the run-wide extraction context and whether to run fused."""
+        logging.info(f"Extracting information using plugins from {file_basename}")
+        
+        # Get all extractor plugins
+        plugins = self._get_plugins()
+        
+        # Log which plugins we're using
+        logging.info("Using %d extractor plugins: %s", len(plugins.extractor_names), ", ".join(plugins.extractor_names))
+        
+        # Values shared by all extractors in this run (e.g. today's date)
+        context = build_extraction_context()
+        
+        return plugins, context, config.FUSED_EXTRACTION if fused is None else fused
+    
+    def _build_resume(self, pdf_file_path: str, file_basename: str, extracted_text: str, plugins: _PluginLookup,
+                      profile: Dict[str, Any], skills: Dict[str, Any], education: Dict[str, Any],
+                      experience: Dict[str, Any], yoe: Dict[str, Any],
+                      extractor_token_usages: List[Tuple[str, Dict[str, Any]]]) -> Resume:
+        """Aggregate token usage, build the Resume and run the custom plugins on it."""
+        logging.debug(f"Extraction completed for {file_basename}")
+        
+        # Initialize token usage dictionary
+        total_token_usage = {
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "by_extractor": {},
+            "source": "plugins"
+        }
+        
+        # Aggregate token usage
+        for extractor_name, extractor_usage in extractor_token_usages:
+            if extractor_usage:
+                # Read each count once and use it for both the totals and the breakdown
+                extractor_summary = {key: extractor_usage.get(key, 0) for key in _TOKEN_COUNT_KEYS}
+                for key, count in extractor_summary.items():
+                    total_token_usage[key] += count
+                
+                # Store by extractor for detailed breakdown
+                extractor_summary["source"] = extractor_usage.get("source", "plugin")
+                extractor_summary["cache_hit"] = extractor_usage.get("cache_hit", False)
+                if "cascade_model" in extractor_usage:
+                    extractor_summary["cascade_model"] = extractor_usage["cascade_model"]
+                    extractor_summary["cascade_tier"] = extractor_usage["cascade_tier"]
+                total_token_usage["by_extractor"][extractor_name] = extractor_summary
+        
+        logging.info(f"Total tokens used for {file_basename}: {total_token_usage['total_tokens']}")
+        
+        # Create a Resume object from the extracted information
+        resume = Resume.from_extractors_output(
+            profile, skills, education, experience, yoe, pdf_file_path, total_token_usage,
+            file_name=file_basename
+        )
+        
+        # Process any custom plugins
+        for plugin in plugins.custom:
+            try:
+                logging.debug("Running custom plugin %s", plugin.metadata.name)
+                plugin_data = plugin.process_resume(resume, extracted_text)
+                if plugin_data:
+                    resume.add_plugin_data(plugin.metadata.name, plugin_data)
+            except Exception as e:
+                logging.error(f"Error processing custom plugin {plugin.metadata.name}: {e}")
+        
+        return resume
+    
+    def _read_text(self, file_path: str, data: Optional[bytes]) -> Optional[str]:
+        """
+        Validate a resume file and extract its text, reusing text cached for identical content.
+        
+        The file is validated by the same parse that extracts its text (see read_file),
+        and only files that passed are cached, so a hit skips parsing altogether.
+        
+        Args:
+            file_path: Path to the resume file.
+            data: The file content, or None if it could not be read.
+            
+        Returns:
+            The extracted text, or None if the file is invalid.
+        """
+        from .utils.file_utils import read_file
+        
+        cache_key = None
+        if self.text_cache is not None and data is not None:
+            extension = os.path.splitext(file_path)[1].lower()
+            cache_key = ResponseCache.make_key("resume_text", extension, hashlib.sha256(data).hexdigest())
+            cached = self.text_cache.get(cache_key)
+            if cached is not None:
+                logging.info(f"Text cache hit for {os.path.basename(file_path)}")
+                return cached.decode("utf-8")
+        
+        try:
+            text = read_file(file_path, data)
+        except (ValueError, IOError) as e:
+            logging.error(f"Validation failed for {os.path.basename(file_path)}: {e}")
+            return None
+        if cache_key is not None:
+            self.text_cache.put(cache_key, text.encode("utf-8"))
+        return text
+    
     def process_all_resumes(self) -> Tuple[int, int]:
         """
         Process all resumes in the resume directory.
         
+        Resumes are independent and their processing is dominated by LLM calls, so up to
+        config.RESUME_BATCH_WORKERS of them run at once on threads sharing this
+        processor's plugin manager. With config.SKIP_PROCESSED_RESUMES, resumes that
+        already have a saved result (from this or an earlier run, with the same content,
+        output file, models, plugins and prompts) are skipped and counted as processed.
+        
         Returns:
             A tuple of (number of processed resumes, number of errors)
         """
         resume_files = self.get_resume_files()
         processed_count = 0
         error_count = 0
+        skipped_count = 0
+        if not resume_files:
+            return processed_count, error_count
         
-        for resume_file in resume_files:
-            try:
-                file_path = os.path.join(self.resume_dir, resume_file)
+        # Result files are written by the background JSON writer while later resumes are
+        # still being processed; all writes are awaited before returning
+        pending_writes = []
+        max_workers = max(1, min(config.RESUME_BATCH_WORKERS, len(resume_files)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for file_path in resume_files:
+                resume_file = os.path.basename(file_path)
                 logging.info(f"Processing {resume_file}")
-                
-                resume = self.process_resume(file_path)
-                
-                if resume:
-                    self.save_resume(resume)
-                    processed_count += 1
-                else:
+                futures[executor.submit(self._process_batch_resume, file_path)] = resume_file
+            
+            for future in concurrent.futures.as_completed(futures):
+                resume_file = futures[future]
+                try:
+                    resume, index_key, skipped = future.result()
+                    
+                    if skipped:
+                        skipped_count += 1
+                        processed_count += 1
+                    elif resume:
+                        writes = self.save_resume(resume, background=True)
+                        if writes and index_key is not None:
+                            # Record the resume once its result file is on disk
+                            writes[0].add_done_callback(
+                                functools.partial(self._mark_processed, index_key, self._output_path(resume))
+                            )
+                        pending_writes.extend(writes)
+                        processed_count += 1
+                    else:
+                        error_count += 1
+                except Exception as e:
+                    logging.exception(f"Error processing {resume_file}: {e}")
                     error_count += 1
-            except Exception as e:
-                logging.exception(f"Error processing {resume_file}: {e}")
-                error_count += 1
         
+        concurrent.futures.wait(pending_writes)
+        if skipped_count:
+            logging.info(f"Skipped {skipped_count} resumes with results from an earlier run")
         return processed_count, error_count
     
-    def save_resume(self, resume: Resume) -> None:
+    def _process_batch_resume(self, file_path: str) -> Tuple[Optional[Resume], Optional[str], bool]:
+        """
+        Process one resume of process_all_resumes, unless it was already processed.
+        
+        Args:
+            file_path: Path to the resume file.
+            
+        Returns:
+            A tuple of (resume or None if processing failed, key of the resume in
+            processed_index or None, whether the resume was skipped).
+        """
+        if self.processed_index is None:
+            return self.process_resume(file_path), None, False
+        
+        from .utils.file_utils import read_bytes
+        
+        try:
+            data = read_bytes(file_path)
+        except OSError:
+            # process_resume reports the error
+            return self.process_resume(file_path), None, False
+        
+        # A copy under another name has its own output file, so it is processed on its own
+        output_file = self._output_file(os.path.basename(file_path))
+        index_key = ResponseCache.make_key(
+            "processed_resume", self._get_plugins().fingerprint, output_file, hashlib.sha256(data).hexdigest()
+        )
+        recorded = self.processed_index.get(index_key)
+        if recorded is not None and recorded.decode("utf-8") == output_file and os.path.exists(output_file):
+            logging.info(f"Skipping {os.path.basename(file_path)}: already processed into {output_file}")
+            return None, index_key, True
+        
+        return self.process_resume(file_path, data=data), index_key, False
+    
+    def _mark_processed(self, index_key: str, output_file: str, write: concurrent.futures.Future) -> None:
+        """Record output_file as the result for index_key once its write has succeeded."""
+        if write.exception() is None:
+            self.processed_index.put(index_key, output_file.encode("utf-8"))
+        else:
+            # The file may be left truncated; an entry from an earlier run must not skip it
+            self.processed_index.delete(index_key)
+    
+    def _output_path(self, resume: Resume) -> str:
+        """Path of the JSON result file for resume."""
+        # file_name is the basename set at processing time
+        return self._output_file(resume.file_name or os.path.basename(resume.file_path))
+    
+    def _output_file(self, file_basename: str) -> str:
+        """Path of the JSON result file for the resume file named file_basename."""
+        base_name = os.path.splitext(file_basename)[0]
+        return os.path.join(self.output_dir, f"{base_name}.json")
+    
+    def save_resume(self, resume: Resume, background: bool = False) -> List[concurrent.futures.Future]:
         """
         Save a processed resume to the output directory.
         
         Args:
             resume: The processed Resume object.
+            background: Whether to hand the file writes to the background JSON writer
+                instead of writing before returning.
+            
+        Returns:
+            Futures for the background writes (empty when writing in the foreground).
         """
+        save = write_json_background if background else write_json
+        writes = []
         try:
-            # Get the base name without extension
-            base_name = os.path.splitext(os.path.basename(resume.file_path))[0]
-            
             # Create the output file path
-            output_file = os.path.join(self.output_dir, f"{base_name}.json")
+            output_file = self._output_path(resume)
+            base_name = os.path.splitext(os.path.basename(output_file))[0]
             
             # Convert Resume object to dictionary, excluding file_path and token_usage
-            resume_dict = resume.model_dump(exclude={'file_path', 'token_usage'})
+            resume_dict = resume.to_dict()
             
             # Save to JSON file
-            with open(output_file, 'w') as f:
-                json.dump(resume_dict, f, indent=2)
+            writes.append(save(output_file, resume_dict))
             
             # Log token usage if available
             if resume.token_usage:
@@ -225,14 +567,14 @@ class PluginResumeProcessor:
                 )
                 log_file_path = os.path.join(self.log_dir, log_file_name)
                 
-                with open(log_file_path, 'w') as f:
-                    json.dump({"token_usage": resume.token_usage}, f, indent=2)
+                writes.append(save(log_file_path, {"token_usage": resume.token_usage}))
                 
                 logging.info(f"Token usage logged to {log_file_path}")
             
             logging.info(f"Saved processed resume to {output_file}")
         except Exception as e:
             logging.exception(f"Error saving resume: {e}")
+        return writes if background else []
     
     def print_token_usage_report(self, resume: Resume, log_file: str = None) -> None:
         """
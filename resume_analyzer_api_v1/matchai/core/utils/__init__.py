@@ -3,9 +3,12 @@
 
 # Re-export utility functions
 from .file_utils import read_file, validate_file
-from .date_utils import parse_date, calculate_experience
+from .date_utils import parse_date, calculate_experience, format_experience_years
 from .logging_utils import setup_logging
 from .log_utils import cleanup_token_usage_logs
 from .cleanup import cleanup_pycache
+from .section_splitter import extract_section
+from .token_budget import clip_text
+from .json_utils import dumps_indented, write_json, write_json_background
 
 # Do not import ResumeProcessor here to avoid circular imports 
\ No newline at end of file
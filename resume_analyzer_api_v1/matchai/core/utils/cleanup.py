@@ -15,31 +15,35 @@ def cleanup_pycache(root_dir="."):
     dir_count = 0
     file_count = 0
     
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        # Skip .git directory
-        if ".git" in dirpath:
+    # Walk with os.scandir: entry types come with each listing, __pycache__ directories
+    # are removed without descending into them, and .git is never entered
+    pending = [root_dir]
+    while pending:
+        try:
+            entries = list(os.scandir(pending.pop()))
+        except OSError as e:
+            logging.error(f"Error scanning directory: {e}")
             continue
-            
-        # Remove __pycache__ directories
-        if "__pycache__" in dirnames:
-            pycache_path = os.path.join(dirpath, "__pycache__")
-            try:
-                shutil.rmtree(pycache_path)
-                dir_count += 1
-                logging.info(f"Removed __pycache__ directory: {pycache_path}")
-            except Exception as e:
-                logging.error(f"Error removing {pycache_path}: {e}")
         
-        # Remove .pyc, .pyo files
-        for filename in filenames:
-            if filename.endswith((".pyc", ".pyo")):
-                file_path = os.path.join(dirpath, filename)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == "__pycache__":
+                    try:
+                        shutil.rmtree(entry.path)
+                        dir_count += 1
+                        logging.info(f"Removed __pycache__ directory: {entry.path}")
+                    except Exception as e:
+                        logging.error(f"Error removing {entry.path}: {e}")
+                elif entry.name != ".git":
+                    pending.append(entry.path)
+            # Compiled files outside __pycache__ (legacy layout)
+            elif entry.name.endswith((".pyc", ".pyo")):
                 try:
-                    os.remove(file_path)
+                    os.remove(entry.path)
                     file_count += 1
-                    logging.debug(f"Removed compiled Python file: {file_path}")
+                    logging.debug(f"Removed compiled Python file: {entry.path}")
                 except Exception as e:
-                    logging.error(f"Error removing {file_path}: {e}")
+                    logging.error(f"Error removing {entry.path}: {e}")
     
     logging.info(f"Cleanup complete. Removed {dir_count} __pycache__ directories and {file_count} compiled files.")
     return dir_count, file_count
@@ -2,6 +2,27 @@ from datetime import datetime
 from .. import config
 from .. import constants
 
+def _parse_configured_date(date_str):
+    """
+    Parse a date in config.DATE_FORMAT.
+    
+    Well-formed dates in the default "%d/%m/%Y" (1-2 digit day and month, 4 digit
+    year) are split and converted directly, without strptime's per-call format
+    parsing; anything else, and other formats, go through strptime.
+    
+    Raises:
+        ValueError: If the string is not a valid date in that format.
+    """
+    if config.DATE_FORMAT == constants.DEFAULT_DATE_FORMAT and date_str.isascii():
+        parts = date_str.split("/")
+        if len(parts) == 3:
+            day, month, year = parts
+            if (0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4
+                    and day.isdigit() and month.isdigit() and year.isdigit()):
+                # datetime() rejects out-of-range values such as 31/02/2020, like strptime
+                return datetime(int(year), int(month), int(day))
+    return datetime.strptime(date_str, config.DATE_FORMAT)
+
 def parse_date(date_str, default_day="01", default_month="01"):
     """
     Parse a date string into a datetime object.
@@ -18,13 +39,26 @@ def parse_date(date_str, default_day="01", default_month="01"):
         return None
         
     try:
-        return datetime.strptime(date_str, config.DATE_FORMAT)
+        return _parse_configured_date(date_str)
     except ValueError:
         # Attempt to handle various date formats
         pass
     
     return None
 
+def format_experience_years(years):
+    """
+    Format a number of years of experience like calculate_experience does.
+    
+    Args:
+        years: Years of experience, possibly fractional (e.g. 7.5).
+        
+    Returns:
+        A string representing the experience in "X Years Y Months" format.
+    """
+    total_months = int(round(years * 12))
+    return f"{total_months // 12} Years {total_months % 12} Months"
+
 def calculate_experience(oldest_date_str, newest_date_str):
     """
     Calculate total years of experience between oldest_working_date and newest_working_date.
@@ -40,8 +74,8 @@ def calculate_experience(oldest_date_str, newest_date_str):
         return "0 Years 0 Months"
     
     try:
-        oldest_date = datetime.strptime(oldest_date_str, config.DATE_FORMAT)
-        newest_date = datetime.strptime(newest_date_str, config.DATE_FORMAT)
+        oldest_date = _parse_configured_date(oldest_date_str)
+        newest_date = _parse_configured_date(newest_date_str)
     except ValueError:
         # If the date format is invalid, return default experience.
         return "0 Years 0 Months"
@@ -5,97 +5,206 @@ from .. import config
 # Import docx2txt for DOCX processing
 import docx2txt
 import io
+import threading
+import zipfile
 import logging
+
+# Optional: PDFium-based text extraction, much faster than pure-Python PyPDF2
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# PDFium is not thread-safe and pypdfium2 adds no locking of its own; every call into it goes through this lock
+_PDFIUM_LOCK = threading.Lock()
 #     from document_processor import DocumentProcessor
 from services.document_processor import DocumentProcessor
 
-def validate_file(file_path):
+# Read buffer size: resumes are read in one or a few large reads instead of many small ones
+READ_BUFFER_SIZE = 1 << 20
+
+# Format markers checked by validate_file
+PDF_HEADER = b'%PDF-'
+DOCX_CONTENT_TYPES = '[Content_Types].xml'
+
+def read_bytes(file_path):
     """
-    Validates a file to ensure it meets requirements.
+    Reads a whole file into memory.
     
     Args:
-        file_path: Path to the file to validate.
+        file_path: The path to the file.
         
     Returns:
-        A tuple (is_valid, message) where is_valid is a boolean and message is an error message if invalid.
+        The file content as bytes.
+    """
+    with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as file:
+        return file.read()
+
+def _check_file(file_path, ext, data=None):
+    """
+    Runs the checks that do not parse the file: existence, extension and size.
+    
+    Returns:
+        A tuple (is_valid, message), as for validate_file.
     """
     # Check if file exists
-    if not os.path.exists(file_path):
+    if data is None and not os.path.exists(file_path):
         return False, f"File not found: {file_path}"
     
     # Check file extension
-    _, ext = os.path.splitext(file_path)
-    if ext.lower() not in config.ALLOWED_FILE_EXTENSIONS:
+    if ext not in config.ALLOWED_FILE_EXTENSIONS:
         return False, f"Invalid file type. Expected one of {config.ALLOWED_FILE_EXTENSIONS}, got {ext}"
     
     # Check file size
-    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)  # Convert bytes to MB
+    file_size = len(data) if data is not None else os.path.getsize(file_path)
+    file_size_mb = file_size / (1024 * 1024)  # Convert bytes to MB
     if file_size_mb > config.MAX_PDF_SIZE_MB:
         return False, f"File too large. Maximum size is {config.MAX_PDF_SIZE_MB}MB, got {file_size_mb:.2f}MB"
     
-    # Validation specific to file type
-    if ext.lower() == '.pdf':
-        # Try opening the PDF to verify it's valid
+    return True, "File is valid"
+
+def validate_file(file_path, data=None):
+    """
+    Validates a file to ensure it meets requirements.
+    
+    Only the container format is checked (the PDF header, the DOCX package's content
+    types part), so this stays cheap; a file that passes can still fail to parse.
+    Callers that go on to extract the text should use read_file instead, which
+    validates with the same parse that extracts it.
+    
+    Args:
+        file_path: Path to the file to validate.
+        data: The file content, if already read; the file is then not opened again.
+        
+    Returns:
+        A tuple (is_valid, message) where is_valid is a boolean and message is an error message if invalid.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    is_valid, message = _check_file(file_path, ext, data)
+    if not is_valid:
+        return is_valid, message
+    
+    # Validation specific to file type: probe the container format without parsing the content
+    if ext == '.pdf':
+        # A PDF starts with the %PDF- header
         try:
-            with open(file_path, 'rb') as file:
-                PyPDF2.PdfReader(file)
+            if data is not None:
+                header = data[:len(PDF_HEADER)]
+            else:
+                with open(file_path, 'rb') as file:
+                    header = file.read(len(PDF_HEADER))
         except Exception as e:
             return False, f"Invalid PDF file: {str(e)}"
-    elif ext.lower() == '.docx':
-        # Basic validation for DOCX files
+        if header != PDF_HEADER:
+            return False, "Invalid PDF file: missing %PDF- header"
+    elif ext == '.docx':
+        # A DOCX is a ZIP package whose parts are listed in [Content_Types].xml
         try:
-            # Simple validation attempt
-            docx2txt.process(file_path)
+            with zipfile.ZipFile(io.BytesIO(data) if data is not None else file_path) as package:
+                package.getinfo(DOCX_CONTENT_TYPES)
+        except KeyError:
+            return False, f"Invalid DOCX file: missing {DOCX_CONTENT_TYPES}"
         except Exception as e:
             return False, f"Invalid DOCX file: {str(e)}"
     
     return True, "File is valid"
 
-def read_file(file_path):
+def read_file(file_path, data=None):
     """
-    Reads a file and extracts the text.
+    Validates a file and extracts its text.
+    
+    The cheap checks (existence, extension, size) run first; the file is then parsed
+    once, and a file that cannot be parsed is reported by the reader's IOError.
     
     Args:
         file_path: The path to the file.
+        data: The file content, if already read; the file is then not opened again.
         
     Returns:
         The extracted text.
+        
+    Raises:
+        ValueError: If the file is missing, of the wrong type or too large.
+        IOError: If the file cannot be parsed.
     """
-    is_valid, message = validate_file(file_path)
+    ext = os.path.splitext(file_path)[1].lower()
+    is_valid, message = _check_file(file_path, ext, data)
     if not is_valid:
         raise ValueError(message)
+    return extract_text(file_path, data, ext)
+
+def extract_text(file_path, data=None, ext=None):
+    """
+    Extracts the text of a file that has already been validated.
     
+    Args:
+        file_path: The path to the file; its extension selects the reader.
+        data: The file content, if already read; the file is then not opened again.
+        ext: The lower-cased extension of file_path, if already known.
+        
+    Returns:
+        The extracted text.
+    """
     # Determine file type and call appropriate processor
-    _, ext = os.path.splitext(file_path)
-    if ext.lower() == '.pdf':
-        return read_pdf_file(file_path)
-    elif ext.lower() == '.docx':
-        return read_docx_filev2(file_path)
+    if ext is None:
+        ext = os.path.splitext(file_path)[1].lower()
+    if ext == '.pdf':
+        return read_pdf_file(file_path, data)
+    elif ext == '.docx':
+        return read_docx_filev2(file_path, data)
     else:
         raise ValueError(f"Unsupported file type: {ext}")
 
-def read_pdf_file(file_path):
+def read_pdf_file(file_path, data=None):
     """
     Reads a PDF file and extracts the text.
     
     Args:
         file_path: The path to the PDF file.
+        data: The file content, if already read.
         
     Returns:
         The extracted text.
     """
-    text = ""
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
-        return text
+        if data is None:
+            data = read_bytes(file_path)
+        if pdfium is not None:
+            return _read_pdf_pdfium(data)
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+        # Collect the pages and join once; repeated += can copy the text for every page
+        page_texts = []
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                page_texts.append(page_text)
+        return "".join(page_texts)
     except Exception as e:
         raise IOError(f"Error reading PDF file: {e}")
 
+def _read_pdf_pdfium(data):
+    """
+    Extract the text of a PDF with pypdfium2.
+    
+    PDFium is not thread-safe and pypdfium2 does not serialize calls into it, while
+    this runs concurrently from batch workers and request threads. The document is
+    therefore opened, read and closed under _PDFIUM_LOCK, one page after another.
+    """
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            page_texts = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                if page_text:
+                    page_texts.append(page_text)
+            return "".join(page_texts)
+        finally:
+            pdf.close()
+
 def read_docx_file(file_path):
     """
     Reads a DOCX file and extracts the text.
@@ -114,12 +223,13 @@ def read_docx_file(file_path):
         logging.error(f"Error extracting text from DOCX file: {e}")
         raise IOError(f"Error reading DOCX file: {e}") 
     
-def read_docx_filev2(file_path):
+def read_docx_filev2(file_path, data=None):
     """
     Reads a DOCX file and extracts the text.
     
     Args:
         file_path: The path to the DOCX file.
+        data: The file content, if already read.
         
     Returns:
         The extracted text.
@@ -131,27 +241,18 @@ def read_docx_filev2(file_path):
         # CHANGES FOR COMBINED
         # raw_resume_text = resume_parser_service.extract_text_from_docx(docx_content_stream)
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found at: {file_path}")
-
-        # Open the file in binary read mode ('rb')
-        with open(file_path, 'rb') as f:
-            # Read the entire content of the file as bytes
-            file_bytes = f.read()
-            
-            # Wrap the bytes in an io.BytesIO object
-            docx_content_stream = io.BytesIO(file_bytes)
-            
-            # The stream's position is at the end after writing/initializing.
-            # You might want to reset it to the beginning if the consumer
-            # function expects to read from the start.
-            docx_content_stream.seek(0)
-            
+        if data is None:
+            # Read the entire content of the file as bytes; a missing file raises FileNotFoundError
+            data = read_bytes(file_path)
+        
+        # Wrap the bytes in an io.BytesIO object (positioned at the start); BytesIO shares
+        # the bytes' buffer until written to, so this does not copy the file
+        docx_content_stream = io.BytesIO(data)
 
         # docx_content_stream = io.BytesIO(file_path.read())
         document_processor = DocumentProcessor(docx_content_stream)
         text = document_processor.get_combined_document_content()
-        logging.debug(f"READING FILE AS- {text}")
+        logging.debug("READING FILE AS- %s", text)
         return text
     except Exception as e:
         logging.error(f"Error extracting text from DOCX file: {e}")
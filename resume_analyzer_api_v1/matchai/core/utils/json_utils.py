@@ -0,0 +1,51 @@
+"""Writing JSON output and log files."""
+import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Single worker, so log files are written in submission order. Its thread is joined
+# at interpreter exit, so queued writes are not lost.
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="matchai-json-writer")
+
+def dumps_indented(value: Any) -> bytes:
+    """Serialize value as indented UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode("utf-8")
+
+def write_json(path: str, value: Any) -> None:
+    """Write value to path as indented JSON."""
+    with open(path, "wb") as f:
+        f.write(dumps_indented(value))
+
+def _write_bytes(path: str, data: bytes) -> None:
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+    except OSError as e:
+        logging.warning("Could not write %s: %s", path, e)
+        raise
+
+def write_json_background(path: str, value: Any) -> Future:
+    """
+    Write value to path as indented JSON without waiting for the disk.
+
+    The value is serialized before returning, so later changes to it do not leak
+    into the file; only the file write runs on the background writer thread.
+    Write errors are logged and set on the returned Future.
+
+    Args:
+        path: Destination file path.
+        value: JSON-serializable value.
+
+    Returns:
+        A Future that completes once the file has been written, or with the
+        OSError if the write failed.
+    """
+    return _writer.submit(_write_bytes, path, dumps_indented(value))
@@ -1,9 +1,28 @@
 import os
 import datetime
+import concurrent.futures
 import logging
 from .. import config
 from .. import constants
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+# Concurrent file removals when clearing old token usage logs
+REMOVE_WORKERS = 8
+
+def _remove_file(entry: os.DirEntry) -> Optional[OSError]:
+    """Remove the file, returning the error instead of raising it."""
+    try:
+        os.remove(entry.path)
+    except OSError as e:
+        return e
+    return None
+
+def _is_timestamp(timestamp_str: str) -> bool:
+    """Whether timestamp_str has the exact YYYYMMDD_HHMMSS shape of TOKEN_USAGE_TIMESTAMP_FORMAT."""
+    return (
+        len(timestamp_str) == 15 and timestamp_str[8] == '_' and timestamp_str.isascii()
+        and timestamp_str[:8].isdigit() and timestamp_str[9:].isdigit()
+    )
 
 def cleanup_token_usage_logs(log_dir: str = None) -> Tuple[int, List[str]]:
     """
@@ -29,34 +48,50 @@ def cleanup_token_usage_logs(log_dir: str = None) -> Tuple[int, List[str]]:
     
     # Calculate cutoff date
     cutoff_date = datetime.datetime.now() - datetime.timedelta(days=config.TOKEN_LOG_RETENTION_DAYS)
+    # YYYYMMDD_HHMMSS timestamps sort in time order, so they are compared as strings;
+    # a timestamp in the cutoff second is older, as the cutoff has sub-second precision
+    cutoff_str = cutoff_date.strftime(constants.TOKEN_USAGE_TIMESTAMP_FORMAT)
     
     # Format: resume_name_token_usage_YYYYMMDD_HHMMSS.json
     # We need to parse the timestamp in each filename
-    removed_files = []
+    old_files = []
     
-    for filename in os.listdir(log_dir):
-        if not filename.endswith('.json') or 'token_usage' not in filename:
-            continue
-        
-        try:
-            # Extract the timestamp part (assumes format *_token_usage_YYYYMMDD_HHMMSS.json)
-            parts = filename.split('_token_usage_')
-            if len(parts) != 2:
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            if not filename.endswith('.json') or 'token_usage' not in filename:
                 continue
-                
-            timestamp_str = parts[1].split('.')[0]  # Remove .json extension
-            
-            # Parse the timestamp (format: YYYYMMDD_HHMMSS)
-            file_date = datetime.datetime.strptime(timestamp_str, constants.TOKEN_USAGE_TIMESTAMP_FORMAT)
             
-            # Check if the file is older than the retention period
-            if file_date < cutoff_date:
-                filepath = os.path.join(log_dir, filename)
-                os.remove(filepath)
-                removed_files.append(filename)
-                logging.debug(f"Removed old token usage log: {filename}")
-        except Exception as e:
-            logging.warning(f"Error processing log file {filename}: {e}")
+            try:
+                # Extract the timestamp part (assumes format *_token_usage_YYYYMMDD_HHMMSS.json)
+                parts = filename.split('_token_usage_')
+                if len(parts) != 2:
+                    continue
+                    
+                timestamp_str = parts[1].split('.')[0]  # Remove .json extension
+                
+                # Check if the file is older than the retention period
+                if _is_timestamp(timestamp_str):
+                    is_old = timestamp_str <= cutoff_str
+                else:
+                    # Anything else goes through strptime, which reports malformed timestamps
+                    is_old = datetime.datetime.strptime(timestamp_str, constants.TOKEN_USAGE_TIMESTAMP_FORMAT) < cutoff_date
+                if is_old:
+                    old_files.append(entry)
+            except Exception as e:
+                logging.warning(f"Error processing log file {filename}: {e}")
+    
+    # Unlinking blocks in the OS without holding the GIL, so large directories are cleared
+    # with several removals in flight
+    removed_files = []
+    if old_files:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(REMOVE_WORKERS, len(old_files))) as executor:
+            for entry, error in zip(old_files, executor.map(_remove_file, old_files)):
+                if error is None:
+                    removed_files.append(entry.name)
+                    logging.debug(f"Removed old token usage log: {entry.name}")
+                else:
+                    logging.warning(f"Error processing log file {entry.name}: {error}")
     
     if removed_files:
         logging.info(f"Removed {len(removed_files)} old token usage log files")
@@ -1,11 +1,20 @@
 import os
+import atexit
 import logging
+import queue
 import sys
 from .. import config
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Listener started by the first setup_logging() call; later calls are no-ops
+_listener = None
 
 def setup_logging():
-    """Set up logging configuration."""
+    """Set up logging configuration, once per process."""
+    global _listener
+    if _listener is not None:
+        return
+    
     log_level = getattr(logging, config.LOG_LEVEL)
     
     # Create logs directory if it doesn't exist
@@ -17,18 +26,32 @@ def setup_logging():
     max_log_size = config.LOG_MAX_SIZE_MB * 1024 * 1024  # Convert MB to bytes
     backup_count = config.LOG_BACKUP_COUNT
     
+    formatter = logging.Formatter(config.LOG_FORMAT)
+    handlers = [
+        RotatingFileHandler(
+            config.LOG_FILE,
+            maxBytes=max_log_size,
+            backupCount=backup_count,
+            delay=True  # open the file on the first record, not at setup
+        ),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # QueueHandler.prepare merges the message and its arguments in the calling thread and
+    # enqueues the record; a listener thread applies the handlers' formatter and does the
+    # file and stdout I/O, so extraction workers never block on it. The listener is
+    # stopped (and the queue flushed) at exit.
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
     # Configure logging
     logging.basicConfig(
         level=log_level,
-        format=config.LOG_FORMAT,
-        handlers=[
-            RotatingFileHandler(
-                config.LOG_FILE,
-                maxBytes=max_log_size,
-                backupCount=backup_count
-            ),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
     
     # Log startup information
@@ -0,0 +1,83 @@
+"""Heuristics for isolating a section of a resume's extracted text."""
+import re
+from typing import Iterable, Optional
+
+# Headings that start a skills section
+SKILL_HEADINGS = (
+    "skills", "technical skills", "key skills", "skill set", "skillset",
+    "technical proficiencies", "technologies", "technical expertise", "core competencies"
+)
+
+# Headings that start a work experience section
+EXPERIENCE_HEADINGS = (
+    "experience", "work experience", "professional experience", "it job experience",
+    "employment history", "work history"
+)
+
+# Headings that start an education section
+EDUCATION_HEADINGS = ("education", "academic qualifications", "qualifications")
+
+# Common top-level resume headings; a line consisting of one of them ends the current section
+SECTION_HEADINGS = SKILL_HEADINGS + EXPERIENCE_HEADINGS + EDUCATION_HEADINGS + (
+    "summary", "professional summary", "profile", "objective", "career objective",
+    "project experience", "projects", "certifications",
+    "achievements", "awards", "publications", "languages", "interests", "hobbies",
+    "personal details", "declaration", "references"
+)
+
+_NON_LETTERS_RE = re.compile(r"[^a-z]+")
+
+def _heading_words(line: str) -> Optional[str]:
+    """
+    Return the line lower-cased with punctuation collapsed, or None if it cannot be a heading.
+
+    A heading may end with a colon but has nothing after it, so "label: values" lines
+    such as "Languages: Python, Java" stay part of the section they appear in.
+    """
+    line = line.strip()
+    if line.endswith(":"):
+        line = line[:-1]
+    if ":" in line:
+        return None
+    words = _NON_LETTERS_RE.sub(" ", line.lower()).split()
+    return " ".join(words) or None
+
+def extract_section(text: str, headings: Iterable[str] = SKILL_HEADINGS, min_length: int = 20) -> Optional[str]:
+    """
+    Extract the section(s) of text that start with one of the given headings.
+
+    A section runs from its heading line up to the next line that is another top-level
+    heading (see SECTION_HEADINGS), alone on its line or followed only by a colon. When
+    several sections match, they are joined in document order.
+
+    Args:
+        text: The resume text.
+        headings: Lower-case headings that start the wanted section.
+        min_length: Sections shorter than this (without headings) are treated as not found.
+
+    Returns:
+        The section text including its heading lines, or None if no section was found.
+    """
+    headings = tuple(headings)
+    other_headings = tuple(h for h in SECTION_HEADINGS if h not in headings)
+
+    section_lines = []
+    body_length = 0
+    in_section = False
+    for line in text.splitlines():
+        words = _heading_words(line)
+        if words is not None:
+            if words in headings:
+                in_section = True
+                section_lines.append(line)
+                continue
+            if words in other_headings:
+                in_section = False
+                continue
+        if in_section:
+            section_lines.append(line)
+            body_length += len(line.strip())
+
+    if body_length < min_length:
+        return None
+    return "\n".join(section_lines)
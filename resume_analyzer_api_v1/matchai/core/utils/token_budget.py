@@ -0,0 +1,37 @@
+"""Bounding the size of resume text sent to the LLM."""
+from typing import Optional
+
+from .. import config
+
+# Same rough ratio LLMService uses to estimate token counts
+CHARS_PER_TOKEN = 4
+
+# Share of the budget kept from the start of the text; the rest comes from the end
+HEAD_RATIO = 0.8
+
+CLIP_MARKER = "\n[...]\n"
+
+def clip_text(text: str, max_tokens: Optional[int] = None) -> str:
+    """
+    Clip text to an approximate token budget, keeping its head and tail.
+
+    Resumes put contact details and recent roles first and education last, so the
+    middle is dropped: HEAD_RATIO of the budget comes from the start of the text and
+    the rest from the end, joined by CLIP_MARKER.
+
+    Args:
+        text: The text to clip.
+        max_tokens: Token budget. Defaults to config.MAX_INPUT_TOKENS; 0 or less disables clipping.
+
+    Returns:
+        The text itself if it fits the budget, otherwise its clipped head and tail.
+    """
+    if max_tokens is None:
+        max_tokens = config.MAX_INPUT_TOKENS
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if max_tokens <= 0 or len(text) <= max_chars:
+        return text
+
+    head_chars = int(max_chars * HEAD_RATIO)
+    tail_chars = max_chars - head_chars
+    return text[:head_chars] + CLIP_MARKER + text[len(text) - tail_chars:]
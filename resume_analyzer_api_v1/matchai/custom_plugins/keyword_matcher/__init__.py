@@ -1,14 +1,22 @@
-from typing import Dict, List, Any, Tuple, Type, Optional, Union
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Tuple, Type, Optional, Union
 from pydantic import BaseModel, Field
 # Assuming .plugins.base imports BasePlugin, PluginMetadata, PluginCategory
 from matchai.plugins.base import BasePlugin, PluginMetadata, PluginCategory
+from matchai.core import config
 import logging
 import spacy # New import
 import rapidfuzz.fuzz # New import
+import rapidfuzz.process
+import numpy as np
 import nltk
 from nltk.corpus import wordnet # New import
 import re # New import for regex patterns
 import os
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
 
 # --- Helper Models for Detailed Results ---
 class MatchedKeywordDetail(BaseModel):
@@ -81,6 +89,157 @@ class KeywordMatchResult(BaseModel):
 # --- Updated KeywordMatcherPlugin Class ---
 logger = logging.getLogger(__name__)
 
+# Runs of word characters; a form made only of word characters matches r'\bform\b'
+# exactly when it is one of these runs, so such forms are looked up in a set of them
+WORD_RE = re.compile(r'\w+')
+
+# spaCy model shared by every KeywordMatcherPlugin instance, loaded on first use
+_NLP = None
+_NLP_LOADED = False
+_NLP_LOCK = threading.Lock()
+
+# _tokenize result: lemma -> (token text, POS) pairs, whole words, distinct token texts
+_TokenizedText = Tuple[Dict[str, Tuple[Tuple[str, str], ...]], FrozenSet[str], Tuple[str, ...]]
+
+# Recent _tokenize results, keyed by whether spaCy was used and a digest of the text, so
+# the cache does not keep whole resumes alive; re-scoring a resume hits one of these
+_TOKENIZE_CACHE_SIZE = 8
+_TOKENIZE_CACHE: "OrderedDict[Tuple[bool, bytes], _TokenizedText]" = OrderedDict()
+_TOKENIZE_LOCK = threading.Lock()
+
+# WordNet synonyms shared by every instance: form -> WordNet POS tag -> synonym lemmas
+_WORDNET_SYNONYM_CACHE: Dict[str, Dict[str, List[str]]] = {}
+_WORDNET_LOCK = threading.Lock()
+
+def _get_nlp() -> Any:
+    """Return the shared spaCy model, loading it on the first call; None if it is not installed."""
+    global _NLP, _NLP_LOADED
+    if not _NLP_LOADED:
+        with _NLP_LOCK:
+            if not _NLP_LOADED:
+                try:
+                    # Only the tagger, attribute ruler and lemmatizer are used (for POS and lemmas)
+                    _NLP = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+                    logging.info("spaCy 'en_core_web_sm' model loaded successfully.")
+                except OSError:
+                    logging.error(
+                        "spaCy model 'en_core_web_sm' not found. "
+                        "Please run: python -m spacy download en_core_web_sm"
+                    )
+                _NLP_LOADED = True
+    return _NLP
+
+# WordNet POS tags the keyword matcher looks synonyms up for (wordnet.NOUN, VERB, ADJ and ADV;
+# spelled out because attribute access on the lazy wordnet corpus loads it)
+WORDNET_POS_TAGS = ('n', 'v', 'a', 'r')
+
+def _wordnet_synonyms(form: str, wordnet_pos_tag: str) -> List[str]:
+    """Query NLTK's WordNet for the lower-cased lemma names of form's synsets with the given POS."""
+    synonyms_for_form_pos = set()
+    for synset in wordnet.synsets(form, pos=wordnet_pos_tag):
+        for lemma in synset.lemmas():
+            synonyms_for_form_pos.add(lemma.name().lower())
+    return list(synonyms_for_form_pos)
+
+@lru_cache(maxsize=None)
+def _get_wordnet_snapshot() -> Dict[Tuple[str, str], Tuple[str, ...]]:
+    """
+    Load the WordNet synonym snapshot at config.WORDNET_SNAPSHOT_PATH, once per process.
+    
+    Returns:
+        (form, WordNet POS tag) -> synonym lemmas, or an empty dict if no snapshot is
+        configured or it cannot be read.
+    """
+    path = config.WORDNET_SNAPSHOT_PATH
+    if not path:
+        return {}
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+        logging.info(f"Loaded WordNet synonym snapshot with {len(snapshot)} entries from {path}")
+        return snapshot
+    except Exception as e:
+        logging.warning(f"Could not load WordNet synonym snapshot {path}: {e}")
+        return {}
+
+def build_wordnet_snapshot(path: str) -> int:
+    """
+    Build the WordNet synonym snapshot read via config.WORDNET_SNAPSHOT_PATH.
+    
+    Every WordNet lemma name is looked up for each POS in WORDNET_POS_TAGS, the same
+    way initialize() queries NLTK, so a snapshot hit returns exactly what NLTK would.
+    Forms not in the snapshot (e.g. inflected words) are still looked up in NLTK.
+    Requires the NLTK WordNet data; run it offline, e.g.:
+        python -c "from matchai.custom_plugins.keyword_matcher import build_wordnet_snapshot; build_wordnet_snapshot('wordnet_syns.pkl')"
+    
+    Args:
+        path: File to write the pickled snapshot to.
+        
+    Returns:
+        The number of entries written.
+    """
+    snapshot = {}
+    for name in wordnet.all_lemma_names():
+        form = name.lower()
+        for wordnet_pos_tag in WORDNET_POS_TAGS:
+            if (form, wordnet_pos_tag) not in snapshot:
+                synonyms = _wordnet_synonyms(form, wordnet_pos_tag)
+                if synonyms:
+                    snapshot[(form, wordnet_pos_tag)] = tuple(synonyms)
+    with open(path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return len(snapshot)
+
+def _tokenize(nlp: Any, text_lower: str) -> _TokenizedText:
+    """
+    Tokenize lower-cased resume text for keyword matching, reusing the result for a recently seen text.
+    
+    nlp is the shared spaCy model from _get_nlp(), or None.
+    """
+    key = (nlp is not None, hashlib.sha256(text_lower.encode("utf-8")).digest())
+    with _TOKENIZE_LOCK:
+        result = _TOKENIZE_CACHE.get(key)
+        if result is not None:
+            _TOKENIZE_CACHE.move_to_end(key)
+            return result
+    
+    result = _tokenize_text(nlp, text_lower)
+    with _TOKENIZE_LOCK:
+        _TOKENIZE_CACHE[key] = result
+        while len(_TOKENIZE_CACHE) > _TOKENIZE_CACHE_SIZE:
+            _TOKENIZE_CACHE.popitem(last=False)
+    return result
+
+def _tokenize_text(nlp: Any, text_lower: str) -> _TokenizedText:
+    """
+    Tokenize lower-cased resume text for keyword matching.
+    
+    Without a spaCy model, the tokens are the text's words, each its own lemma with POS 'UNKNOWN'.
+    
+    Returns:
+        A tuple of (lemma -> (token text, POS) pairs of the alphabetic tokens in text
+        order, the whole words of the text, the distinct token texts in text order).
+    """
+    if nlp:
+        text_tokens_with_pos = [
+            (token.text, token.lemma_, token.pos_) for token in nlp(text_lower) if token.is_alpha
+        ]
+        logging.debug(f"Resume text tokenized into {len(text_tokens_with_pos)} tokens.")
+    else:
+        text_tokens_with_pos = [(w, w, 'UNKNOWN') for w in re.findall(r'\b\w+\b', text_lower)]
+    
+    # Tokens of the text by lemma (in text order), for the lemmatized and WordNet matches
+    lemma_to_tokens = defaultdict(list)
+    for text_token_text, text_token_lemma, text_token_pos in text_tokens_with_pos:
+        lemma_to_tokens[text_token_lemma].append((text_token_text, text_token_pos))
+    
+    return (
+        {lemma: tuple(tokens) for lemma, tokens in lemma_to_tokens.items()},
+        # Whole words of the text, for the exact match of plain single-word forms
+        frozenset(WORD_RE.findall(text_lower)),
+        tuple(dict.fromkeys(token_text for token_text, _, _ in text_tokens_with_pos))
+    )
+
 class KeywordMatcherPlugin(BasePlugin):
     """Plugin for matching job-specific keywords in resumes with advanced NLP."""
     
@@ -103,6 +262,8 @@ class KeywordMatcherPlugin(BasePlugin):
     nlp: Any
     FUZZY_THRESHOLD: int
     wordnet_synonym_cache: Dict[str, List[str]]
+    _fuzzy_forms: List[str] # Every keyword form, one row each in the fuzzy score matrix
+    _form_analysis: Dict[str, Optional[Tuple[str, str]]] # Keyword form -> (lemma, POS) of its first token
     
     keywords: Dict[str, List[Dict[str, Union[str, int, List[str]]]]] # Ensure this property is declared
     # --- End New Properties ---
@@ -123,19 +284,14 @@ class KeywordMatcherPlugin(BasePlugin):
         self.keywords = {} 
         # --- FIX END ---
 
-        self.nlp = None
         self.FUZZY_THRESHOLD = 88 
-        self.wordnet_synonym_cache = {}
+        # The spaCy model and WordNet synonyms are shared with the other instances
+        self.wordnet_synonym_cache = _WORDNET_SYNONYM_CACHE
+        self._fuzzy_forms = []
+        self._form_analysis = {}
         
-        # Load spaCy NLP model during initialization
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logging.info("spaCy 'en_core_web_sm' model loaded successfully.")
-        except OSError:
-            logging.error(
-                "spaCy model 'en_core_web_sm' not found. "
-                "Please run: python -m spacy download en_core_web_sm"
-            )
+        # Load spaCy NLP model (once per process)
+        self.nlp = _get_nlp()
         
         logging.debug(f"{self.metadata.name} called init for llm {self.llm_service}");
 
@@ -173,36 +329,40 @@ class KeywordMatcherPlugin(BasePlugin):
                     })
             logging.info("Using transformed DEFAULT_KEYWORDS.")
         
+        self._prepare_keywords()
+        
         # Pre-process WordNet synonyms for all configured keywords (cached for performance)
+        wordnet_snapshot = _get_wordnet_snapshot()
         try:
-            # Verify WordNet data is available
-            nltk.data.find('corpora/wordnet')
-            nltk.data.find('corpora/omw-1.4')
-
-            for category, keywords_list in self.keywords.items(): # This line should now work
-                for kw_config in keywords_list:
-                    primary_keyword = kw_config["keyword"].lower()
-                    all_forms_for_wordnet = [primary_keyword] + \
-                                            [v.lower() for v in kw_config.get("variations", [])]
-                    
-                    for form in all_forms_for_wordnet:
-                        if " " not in form: # Only pre-compute for single words, as WordNet synsets are primarily word-based
-                            if form not in self.wordnet_synonym_cache: 
-                                self.wordnet_synonym_cache[form] = {} # Initialize nested dict for POS-specific synonyms
-
-                            if self.nlp:
-                                form_doc = self.nlp(form)
-                                if len(form_doc) > 0 and form_doc[0].is_alpha:
-                                    inferred_spacy_pos = form_doc[0].pos_
-                                    wordnet_pos_tag = self._get_wordnet_pos(inferred_spacy_pos)
-                                    
-                                    if wordnet_pos_tag and wordnet_pos_tag not in self.wordnet_synonym_cache[form]:
-                                        synonyms_for_form_pos = set()
-                                        for synset in wordnet.synsets(form, pos=wordnet_pos_tag):
-                                            for lemma in synset.lemmas():
-                                                synonyms_for_form_pos.add(lemma.name().lower())
-                                        
-                                        self.wordnet_synonym_cache[form][wordnet_pos_tag] = list(synonyms_for_form_pos)
+            # Verify WordNet data is available; with a snapshot, NLTK is only queried on a miss
+            if not wordnet_snapshot:
+                nltk.data.find('corpora/wordnet')
+                nltk.data.find('corpora/omw-1.4')
+
+            # Instances may initialize concurrently and share the synonym cache
+            with _WORDNET_LOCK:
+                for keywords_list in self.keywords.values():
+                    for kw_config in keywords_list:
+                        # Only single words are looked up, as WordNet synsets are primarily word-based
+                        wordnet_synonyms = []
+                        for form, inferred_spacy_pos in kw_config["_form_pos"]:
+                            wordnet_pos_tag = self._get_wordnet_pos(inferred_spacy_pos)
+                            if not wordnet_pos_tag:
+                                continue
+                            
+                            form_synonyms = self.wordnet_synonym_cache.setdefault(form, {}) # POS-specific synonyms
+                            if wordnet_pos_tag not in form_synonyms:
+                                snapshot_synonyms = wordnet_snapshot.get((form, wordnet_pos_tag))
+                                if snapshot_synonyms is not None:
+                                    form_synonyms[wordnet_pos_tag] = list(snapshot_synonyms)
+                                else:
+                                    try:
+                                        form_synonyms[wordnet_pos_tag] = _wordnet_synonyms(form, wordnet_pos_tag)
+                                    except LookupError:
+                                        # Only reachable with a snapshot but no NLTK data: the form has no snapshot entry
+                                        form_synonyms[wordnet_pos_tag] = []
+                            wordnet_synonyms.append((form_synonyms[wordnet_pos_tag], inferred_spacy_pos))
+                        kw_config["_wordnet_synonyms"] = wordnet_synonyms
             
             logging.info("WordNet synonyms pre-processed and cached (POS-aware).")
         except LookupError:
@@ -214,6 +374,75 @@ class KeywordMatcherPlugin(BasePlugin):
             logging.error(f"Error during WordNet synonym pre-processing: {e}")
             self.wordnet_synonym_cache = {} 
 
+    def _prepare_keywords(self) -> None:
+        """
+        Precompute the per-keyword data process_resume uses.
+        
+        Every lower-cased keyword form (primary keyword, then variations) gets a row in
+        self._fuzzy_forms, and kw_config["_fuzzy_rows"] holds the range of its rows.
+        The forms, and then their lemmas, are analyzed by spaCy in one batch each, and
+        the results are kept on kw_config:
+        - "_lemma_pos": (lemma, POS of the lemma on its own) for the lemmatized match.
+        - "_form_pos": (single-word form, its POS), from which initialize() builds
+          "_wordnet_synonyms": (WordNet synonym lemmas, expected POS) for the WordNet match.
+        - "_exact_forms": (form, match type, pattern) for the exact match; pattern is the
+          compiled whole-word regex of a single-word form with non-word characters
+          (e.g. "c++"), and None for phrases and plain words.
+        """
+        self._fuzzy_forms = []
+        for keywords_list in self.keywords.values():
+            for kw_config in keywords_list:
+                start = len(self._fuzzy_forms)
+                self._fuzzy_forms.append(kw_config["keyword"].lower())
+                self._fuzzy_forms.extend(v.lower() for v in kw_config.get("variations", []))
+                kw_config["_fuzzy_rows"] = range(start, len(self._fuzzy_forms))
+                
+                exact_forms = []
+                for row in kw_config["_fuzzy_rows"]:
+                    form = self._fuzzy_forms[row]
+                    if " " in form:
+                        exact_forms.append((form, "exact_phrase", None))
+                    elif WORD_RE.fullmatch(form):
+                        exact_forms.append((form, "exact_word", None))
+                    else:
+                        exact_forms.append((form, "exact_word", re.compile(r'\b' + re.escape(form) + r'\b')))
+                kw_config["_exact_forms"] = exact_forms
+        
+        self._form_analysis = self._analyze_forms(self._fuzzy_forms) if self.nlp else {}
+        lemma_analysis = self._analyze_forms([a[0] for a in self._form_analysis.values() if a]) if self.nlp else {}
+        
+        for keywords_list in self.keywords.values():
+            for kw_config in keywords_list:
+                lemma_pos = []
+                form_pos = []
+                for row in kw_config["_fuzzy_rows"]:
+                    form = self._fuzzy_forms[row]
+                    form_analysis = self._form_analysis.get(form)
+                    if not form_analysis:
+                        continue
+                    form_lemma, pos = form_analysis
+                    if lemma_analysis.get(form_lemma):
+                        lemma_pos.append((form_lemma, lemma_analysis[form_lemma][1]))
+                    if " " not in form:
+                        form_pos.append((form, pos))
+                kw_config["_lemma_pos"] = lemma_pos
+                kw_config["_form_pos"] = form_pos
+                kw_config["_wordnet_synonyms"] = []
+
+    def _analyze_forms(self, forms: List[str]) -> Dict[str, Optional[Tuple[str, str]]]:
+        """
+        Run spaCy over short keyword strings in one batch.
+        
+        Returns:
+            Each distinct form mapped to the (lemma, POS) of its first token, or None
+            if it has no alphabetic first token.
+        """
+        forms = list(dict.fromkeys(forms))
+        return {
+            form: (doc[0].lemma_, doc[0].pos_) if len(doc) > 0 and doc[0].is_alpha else None
+            for form, doc in zip(forms, self.nlp.pipe(forms, batch_size=256))
+        }
+
     # --- Add the _get_wordnet_pos helper method here ---
     def _get_wordnet_pos(self, spacy_pos: str) -> Optional[str]:
         """
@@ -251,20 +480,15 @@ class KeywordMatcherPlugin(BasePlugin):
 
         text_lower = text.lower()
         
-        text_tokens_with_pos = [] 
-        text_lemmas_lower_set = set() 
-
-        if self.nlp:
-            doc = self.nlp(text_lower)
-            for token in doc:
-                if token.is_alpha: 
-                    text_tokens_with_pos.append((token.text, token.lemma_, token.pos_))
-                    text_lemmas_lower_set.add(token.lemma_)
-            logging.debug(f"Resume text tokenized into {len(text_tokens_with_pos)} tokens.")
-        else:
+        if not self.nlp:
             logging.warning("spaCy NLP model not loaded. Lemmatization, POS-aware WordNet, and Fuzzy Matching will be disabled.")
-            text_tokens_with_pos = [(w, w, 'UNKNOWN') for w in re.findall(r'\b\w+\b', text_lower)]
-            text_lemmas_lower_set = set(w for w, _, _ in text_tokens_with_pos)
+
+        # Re-scoring the same resume (e.g. against another job's keywords) reuses its tokenization
+        lemma_to_tokens, text_words, unique_tokens = _tokenize(self.nlp, text_lower)
+
+        # Fuzzy scores of every keyword form against every distinct token (in text order),
+        # computed in one vectorized call the first time a keyword falls through to fuzzy matching
+        fuzzy_scores = None
 
         results = KeywordMatchResult() 
 
@@ -278,16 +502,6 @@ class KeywordMatcherPlugin(BasePlugin):
             for kw_config in keywords_list:
                 primary_keyword = kw_config["keyword"]
                 weight = kw_config.get("weight", 1)
-                explicit_variations = [v.lower() for v in kw_config.get("variations", [])]
-                
-                all_forms_to_check = [primary_keyword.lower()] + explicit_variations
-                
-                all_forms_lemmatized = []
-                if self.nlp:
-                    for form in all_forms_to_check:
-                        lemma_doc = self.nlp(form)
-                        if len(lemma_doc) > 0 and lemma_doc[0].is_alpha:
-                            all_forms_lemmatized.append(lemma_doc[0].lemma_)
                 
                 is_matched = False
                 matched_form_in_text = None
@@ -299,62 +513,37 @@ class KeywordMatcherPlugin(BasePlugin):
                 # --- Matching Strategy (Prioritized: Exact > Lemmatized > WordNet > Fuzzy) ---
 
                 # 1. Exact Match (Phrase or Whole-Word) for all forms
-                for form_to_check in all_forms_to_check:
-                    if " " in form_to_check: 
-                        if form_to_check in text_lower:
-                            is_matched = True
-                            matched_form_in_text = form_to_check
-                            match_type = "exact_phrase"
-                            break
-                    else: 
-                        pattern = r'\b' + re.escape(form_to_check) + r'\b'
-                        if re.search(pattern, text_lower):
-                            is_matched = True
-                            matched_form_in_text = form_to_check
-                            match_type = "exact_word"
-                            break
+                for form_to_check, exact_match_type, pattern in kw_config["_exact_forms"]:
+                    if exact_match_type == "exact_phrase":
+                        found = form_to_check in text_lower
+                    elif pattern is None:
+                        found = form_to_check in text_words
+                    else:
+                        found = pattern.search(text_lower) is not None
+                    if found:
+                        is_matched = True
+                        matched_form_in_text = form_to_check
+                        match_type = exact_match_type
+                        break
                 
                 # 2. Lemmatized Whole-Word Match (if not already matched and NLP enabled)
                 if not is_matched and self.nlp:
-                    for form_lemma in all_forms_lemmatized:
-                        if form_lemma in text_lemmas_lower_set:
-                            for text_token_text, text_token_lemma, text_token_pos in text_tokens_with_pos:
-                                if text_token_lemma == form_lemma:
-                                    keyword_doc = self.nlp(form_lemma)
-                                    if len(keyword_doc) > 0 and keyword_doc[0].is_alpha:
-                                        expected_spacy_pos = keyword_doc[0].pos_
-                                        if text_token_pos == expected_spacy_pos:
-                                            is_matched = True
-                                            matched_form_in_text = text_token_text
-                                            match_type = "lemmatized_word_pos_aware"
-                                            break
-                            if is_matched:
+                    for form_lemma, expected_spacy_pos in kw_config["_lemma_pos"]:
+                        for text_token_text, text_token_pos in lemma_to_tokens.get(form_lemma, ()):
+                            if text_token_pos == expected_spacy_pos:
+                                is_matched = True
+                                matched_form_in_text = text_token_text
+                                match_type = "lemmatized_word_pos_aware"
                                 break
+                        if is_matched:
+                            break
 
                 # 3. WordNet Synonyms Match (if not already matched and WordNet is available)
                 if not is_matched and self.wordnet_synonym_cache:
-                    forms_for_wordnet_lookup = [f for f in all_forms_to_check if " " not in f]
-                    
-                    for form_for_lookup in forms_for_wordnet_lookup:
-                        expected_spacy_pos_for_lookup = None
-                        if self.nlp:
-                            lookup_doc = self.nlp(form_for_lookup)
-                            if len(lookup_doc) > 0 and lookup_doc[0].is_alpha:
-                                expected_spacy_pos_for_lookup = lookup_doc[0].pos_
-                        
-                        if not expected_spacy_pos_for_lookup:
-                            continue
-
-                        wordnet_pos_tag = self._get_wordnet_pos(expected_spacy_pos_for_lookup)
-                        if not wordnet_pos_tag:
-                            continue
-                        
-                        synonyms_for_lookup = self.wordnet_synonym_cache.get(form_for_lookup, {}).get(wordnet_pos_tag, [])
-                        
+                    for synonyms_for_lookup, expected_spacy_pos_for_lookup in kw_config["_wordnet_synonyms"]:
                         for wordnet_synonym_lemma in synonyms_for_lookup:
-                            for text_token_text, text_token_lemma, text_token_pos in text_tokens_with_pos:
-                                if (text_token_lemma == wordnet_synonym_lemma and 
-                                    text_token_pos == expected_spacy_pos_for_lookup):
+                            for text_token_text, text_token_pos in lemma_to_tokens.get(wordnet_synonym_lemma, ()):
+                                if text_token_pos == expected_spacy_pos_for_lookup:
                                     is_matched = True
                                     matched_form_in_text = text_token_text
                                     match_type = "wordnet_synonym_pos_aware"
@@ -365,16 +554,22 @@ class KeywordMatcherPlugin(BasePlugin):
                             break
 
                 # 4. Fuzzy Matching (if not already matched, as a last resort)
-                if not is_matched:
-                    for form_to_check in all_forms_to_check:
-                        for text_token_text, _, _ in text_tokens_with_pos: 
-                            similarity_score = rapidfuzz.fuzz.ratio(form_to_check, text_token_text)
-                            if similarity_score >= self.FUZZY_THRESHOLD:
-                                is_matched = True
-                                matched_form_in_text = text_token_text
-                                match_type = "fuzzy_match"
-                                break
-                        if is_matched:
+                if not is_matched and unique_tokens:
+                    if fuzzy_scores is None:
+                        # Scores below the threshold come back as 0
+                        fuzzy_scores = rapidfuzz.process.cdist(
+                            self._fuzzy_forms, unique_tokens,
+                            scorer=rapidfuzz.fuzz.ratio,
+                            score_cutoff=self.FUZZY_THRESHOLD,
+                            workers=-1
+                        )
+                    for row in kw_config["_fuzzy_rows"]:
+                        # The first token (in text order) that is similar enough
+                        token_hits = np.flatnonzero(fuzzy_scores[row])
+                        if token_hits.size:
+                            is_matched = True
+                            matched_form_in_text = unique_tokens[token_hits[0]]
+                            match_type = "fuzzy_match"
                             break
 
                 # --- Record Results ---
@@ -409,4 +604,7 @@ class KeywordMatcherPlugin(BasePlugin):
 
         logging.info(f"Keyword match complete for {resume_name}. Overall score: {results.overall_match_score}%")
 
-        return results
\ No newline at end of file
+        return results
+
+
+PLUGIN_CLASSES = (KeywordMatcherPlugin,)
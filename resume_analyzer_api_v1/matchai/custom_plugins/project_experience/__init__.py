@@ -1,8 +1,7 @@
-from typing import Dict, Any, Type, List, Tuple
+from typing import Dict, Any, Type, List, Tuple, Optional
 from pydantic import BaseModel
-from ...plugins.base import BasePlugin,ExtractorPlugin, PluginMetadata, PluginCategory
+from ...plugins.base import BasePlugin,ExtractorPlugin, PluginMetadata, PluginCategory, get_today
 from ...models import ResumeWorkExperience
-from datetime import date
 import logging
 
 class ProjectExperiencePlugin(BasePlugin):
@@ -106,11 +105,11 @@ Text:
         """Get the input variables for the prompt template."""
         return ["text", "today"]
     
-    def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
+    def prepare_input_data(self, extracted_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         return {
             "text": extracted_text,
-            "today": date.today().strftime("%d/%m/%Y")
+            "today": (context or {}).get("today") or get_today()
         }
     def process_resume(self, resume: Any, text: str) -> Dict[str, Any]:
     # def extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -128,7 +127,7 @@ Text:
         input_data = self.prepare_input_data(text)
         input_variables = self.get_input_variables()
         model = self.get_model()
-        logging.debug(f"ProjectExpereince Called Extract {input_data}")
+        logging.debug("ProjectExpereince Called Extract %s", input_data)
         # Call LLM service
         result, token_usage = self.llm_service.extract_with_llm(
             model,
@@ -136,7 +135,7 @@ Text:
             input_variables,
             input_data
         )
-        logging.debug(f"ProjectExpereince data is {result}")
+        logging.debug("ProjectExpereince data is %s", result)
         # Add extractor name to token usage
         token_usage["extractor"] = self.metadata.name
         
@@ -161,4 +160,7 @@ Text:
                 exp["location"] = exp.get("location")  # Can be None
                 exp["role"] = exp.get("role") or ""
         
-        return processed_result, token_usage 
\ No newline at end of file
+        return processed_result, token_usage
+
+
+PLUGIN_CLASSES = (ProjectExperiencePlugin,)
@@ -1,5 +1,6 @@
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, ClassVar, Iterable, Type
+from pydantic import BaseModel, Field, TypeAdapter
 import os
 
 from pydantic import BaseModel, Field, EmailStr, HttpUrl
@@ -91,6 +92,7 @@ class Experience(BaseModel):
 class ResumeWorkExperience(BaseModel):
     """Model for work experience information"""
     work_experiences: List[Experience]
+    total_experience_years: Optional[float] = None  # Only when the resume states it explicitly
 
 class WorkDates(BaseModel):
     """Model for work dates information"""
@@ -127,11 +129,15 @@ class Resume(BaseModel):
     # Plugin data for custom extractors
     plugin_data: Dict[str, Any] = Field(default_factory=dict)
     
+    # Fields kept out of results returned to callers and saved to disk
+    INTERNAL_FIELDS: ClassVar[frozenset] = frozenset({'file_path', 'token_usage'})
+    
     @classmethod
     def from_extractors_output(cls, profile: Dict[str, Any], skills: Dict[str, Any], 
                              education: Dict[str, Any], experience: Dict[str, Any], 
                              yoe: Dict[str, Any], file_path: str, 
-                             token_usage: Optional[Dict[str, int]] = None) -> 'Resume':
+                             token_usage: Optional[Dict[str, int]] = None,
+                             file_name: Optional[str] = None) -> 'Resume':
         """
         Create a Resume instance from the output of various extractors.
         
@@ -143,11 +149,13 @@ class Resume(BaseModel):
             yoe: Output from the years of experience extractor
             file_path: Path to the resume file
             token_usage: Dictionary containing token usage information
+            file_name: Base name of file_path, if the caller has already computed it
             
         Returns:
             A Resume instance with all the extracted information
         """
-        file_name = os.path.basename(file_path)
+        if file_name is None:
+            file_name = os.path.basename(file_path)
         
         return cls(
             name=profile.get('name'),
@@ -180,4 +188,27 @@ class Resume(BaseModel):
         Returns:
             A dictionary representation of the Resume
         """
-        return self.model_dump(exclude={'file_path', 'token_usage'}) 
\ No newline at end of file
+        return self.model_dump(exclude=self.INTERNAL_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Build (once per model class) a TypeAdapter for a list of that model."""
+    return TypeAdapter(List[model])
+
+def dump_model_list(model: Type[BaseModel], items: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Serialize a list of model instances (or dicts to validate as the model) in one pass.
+
+    The compiled list serializer is cached per model class, so the whole list is
+    validated and dumped by pydantic-core instead of one model_dump() call per entry.
+
+    Args:
+        model: The model class of the entries.
+        items: Model instances or dicts.
+
+    Returns:
+        A list of plain dictionaries.
+    """
+    adapter = _list_adapter(model)
+    return adapter.dump_python(adapter.validate_python(list(items)))
\ No newline at end of file
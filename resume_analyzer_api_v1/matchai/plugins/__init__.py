@@ -2,11 +2,19 @@
 Core plugin base classes and interfaces.
 """
 
-from .base import BasePlugin, ExtractorPlugin, PluginMetadata, PluginCategory
+from .base import (
+    BasePlugin, ExtractorPlugin, PluginMetadata, PluginCategory,
+    EXTRACTION_PROMPT_SUFFIX, DATED_EXTRACTION_PROMPT_SUFFIX,
+    get_today, build_extraction_context
+)
 
 __all__ = [
     'BasePlugin',
     'ExtractorPlugin',
     'PluginMetadata',
-    'PluginCategory'
+    'PluginCategory',
+    'EXTRACTION_PROMPT_SUFFIX',
+    'DATED_EXTRACTION_PROMPT_SUFFIX',
+    'get_today',
+    'build_extraction_context'
 ]
\ No newline at end of file
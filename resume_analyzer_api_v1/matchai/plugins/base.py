@@ -1,8 +1,53 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from datetime import date
 from enum import Enum, auto
-from typing import Dict, Any, Type, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Any, Type, List, Tuple, Optional, Callable, Sequence
 from pydantic import BaseModel
 
+# Prompt sections shared by the extractor templates. Templates are laid out as
+# static instructions (ExtractorPlugin.PROMPT_INSTRUCTIONS) + output schema, followed
+# by the per-call values (today's date, resume text), so the invariant prefix is
+# identical across calls and can be served from the provider's prompt cache.
+OUTPUT_SCHEMA_PROMPT_SECTION = """
+Return your output as a JSON object with the below schema.
+{format_instructions}
+"""
+
+TODAY_PROMPT_SECTION = """
+Today's date: {today}
+"""
+
+TEXT_PROMPT_SECTION = """
+Text:
+{text}
+"""
+
+EXTRACTION_PROMPT_SUFFIX = OUTPUT_SCHEMA_PROMPT_SECTION + TEXT_PROMPT_SECTION
+DATED_EXTRACTION_PROMPT_SUFFIX = OUTPUT_SCHEMA_PROMPT_SECTION + TODAY_PROMPT_SECTION + TEXT_PROMPT_SECTION
+
+# Default cap on concurrent LLM calls made by ExtractorPlugin.extract_batch()
+EXTRACT_BATCH_MAX_INFLIGHT = 32
+
+@lru_cache(maxsize=1)
+def _format_day(day_ordinal: int) -> str:
+    return date.fromordinal(day_ordinal).strftime("%d/%m/%Y")
+
+def get_today() -> str:
+    """Today's date as dd/mm/yyyy, formatted once per day."""
+    return _format_day(date.today().toordinal())
+
+def build_extraction_context() -> Dict[str, Any]:
+    """
+    Build the values shared by every extractor in one extraction run.
+    
+    Computing them once keeps the extractors' prompts consistent within the run,
+    e.g. a batch that crosses midnight still uses a single {today}.
+    """
+    return {"today": get_today()}
+
 class PluginCategory(Enum):
     """Categories of plugins."""
     BASE = auto()      # Core functionality plugins
@@ -20,7 +65,12 @@ class PluginMetadata:
         self.author = author
         
 class BasePlugin(ABC):
-    """Base class for all plugins."""
+    """
+    Base class for all plugins.
+    
+    A plugin module exports its plugin classes in a module-level ``PLUGIN_CLASSES``
+    tuple, read by PluginManager.discover_plugins.
+    """
     
     @property
     @abstractmethod
@@ -36,6 +86,31 @@ class BasePlugin(ABC):
 class ExtractorPlugin(BasePlugin):
     """Base class for extractor plugins."""
     
+    # Name of the extractor whose output this extractor consumes instead of the resume text.
+    # None means the extractor works on the raw text and can run concurrently with the others.
+    depends_on: Optional[str] = None
+    
+    # Task-specific part of the prompt, without the output schema and text sections.
+    # Extractors that do not call the LLM leave this empty.
+    PROMPT_INSTRUCTIONS: str = ""
+    
+    # Output model, full prompt template and template variables. Extractors with a fixed
+    # prompt set these once on the class and return them from the get_* methods.
+    MODEL: Optional[Type[BaseModel]] = None
+    PROMPT_TEMPLATE: str = ""
+    INPUT_VARIABLES: Tuple[str, ...] = ("text",)
+    
+    # Cheaper models to try before the LLM service's own model (see LLMService.extract_with_cascade).
+    # Empty means the extractor always uses the service's model.
+    CASCADE_MODELS: Tuple[str, ...] = ()
+    
+    # Function decoding the LLM's JSON response text, passed to the LLM service.
+    # None uses the service's default (orjson when installed, else pydantic-core's jiter).
+    JSON_LOADER: Optional[Callable[[str], Any]] = None
+    
+    # Prompt with format instructions pre-rendered, built once by build_cached_prompt()
+    _prompt: Any = None
+    
     @abstractmethod
     def get_model(self) -> Type[BaseModel]:
         """Get the Pydantic model for the extractor."""
@@ -52,19 +127,109 @@ class ExtractorPlugin(BasePlugin):
         pass
     
     @abstractmethod
-    def prepare_input_data(self, extracted_text: str) -> Dict[str, Any]:
+    def prepare_input_data(self, extracted_text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare the input data for the LLM."""
         pass
     
     @abstractmethod
-    def extract(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def extract(self, text: str, context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Extract information from text.
         
         Args:
             text: The text to extract information from.
+            context: Run-wide values from build_extraction_context(); built per call if None.
             
         Returns:
             A tuple of (extracted_data, token_usage)
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    async def extract_async(self, text: str, context: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract information from text without blocking the event loop.
+        
+        Runs extract() in a worker thread; plugins backed by an async client can
+        override this to await it directly.
+        
+        Args:
+            text: The text to extract information from.
+            context: Run-wide values from build_extraction_context(); built per call if None.
+            
+        Returns:
+            A tuple of (extracted_data, token_usage)
+        """
+        return await asyncio.to_thread(self.extract, text, context)
+    
+    async def extract_batch(self, texts: Sequence[str], context: Optional[Dict[str, Any]] = None,
+                            max_inflight: int = EXTRACT_BATCH_MAX_INFLIGHT,
+                            on_result: Optional[Callable[[int, Tuple[Dict[str, Any], Dict[str, Any]]], None]] = None
+                            ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Extract information from several texts concurrently.
+        
+        Each text is one extract() call run in a worker thread; at most max_inflight
+        calls are in flight at a time, so their LLM round-trips overlap.
+        
+        Args:
+            texts: The texts to extract information from.
+            context: Run-wide values shared by every call; built once if None.
+            max_inflight: Maximum number of concurrent extract() calls.
+            on_result: Called with (index, result) as each text finishes, in completion order.
+            
+        Returns:
+            A list of (extracted_data, token_usage) tuples in the order of texts.
+            A text whose extraction fails yields ({}, {}).
+        """
+        if context is None:
+            context = build_extraction_context()
+        semaphore = asyncio.Semaphore(max_inflight)
+        
+        async def run(index: int, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    result = await asyncio.to_thread(self.extract, text, context)
+                except Exception:
+                    logging.exception(f"Error in batch extraction {index} of {self.metadata.name}")
+                    result = ({}, {})
+            if on_result is not None:
+                on_result(index, result)
+            return result
+        
+        return list(await asyncio.gather(*(run(i, text) for i, text in enumerate(texts))))
+    
+    def build_cached_prompt(self, prompt_template: Optional[str] = None) -> None:
+        """
+        Build the extractor's prompt once so extract() does not rebuild it per call.
+        
+        Args:
+            prompt_template: Template to use; defaults to get_prompt_template().
+        """
+        llm_service = getattr(self, "llm_service", None)
+        if llm_service is None:
+            return
+        self._prompt = llm_service.build_prompt(
+            self.get_model(),
+            prompt_template if prompt_template is not None else self.get_prompt_template(),
+            self.get_input_variables()
+        )
+    
+    def get_cached_prompt(self) -> Any:
+        """Get the prompt built by build_cached_prompt(), or None if not built."""
+        return self._prompt
+    
+    def get_instructions(self) -> str:
+        """Get the task-specific prompt instructions (used when batching extractors)."""
+        return self.PROMPT_INSTRUCTIONS
+    
+    def postprocess(self, result: Any) -> Dict[str, Any]:
+        """
+        Normalize the raw LLM result into the extractor's output dictionary.
+        
+        Args:
+            result: The parsed LLM output for this extractor.
+            
+        Returns:
+            The processed extraction result.
+        """
+        return result if isinstance(result, dict) else {}
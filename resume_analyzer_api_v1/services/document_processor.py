@@ -206,8 +206,8 @@ class DocumentProcessor:
             else:
                 logger.info("No sections were generated from the extracted tables.")
 
-        logger.debug(f"*******TEXTONLY {full_document_paragraph_text}");
-        logger.debug(f"*******TABLEONLY {formatted_tables_text}");
+        logger.debug("*******TEXTONLY %s", full_document_paragraph_text)
+        logger.debug("*******TABLEONLY %s", formatted_tables_text)
         # --- Step 3: Combine Results ---
         if full_document_paragraph_text:
             # combined_document_content += "##################################################\n"
@@ -224,7 +224,7 @@ class DocumentProcessor:
             combined_document_content += formatted_tables_text
 
         logger.info(f"Debug: Combined content length before return: {len(combined_document_content)}")
-        logger.debug(f"*******COBINED {combined_document_content}");
+        logger.debug("*******COBINED %s", combined_document_content)
         if not combined_document_content.strip():
             logger.warning("Debug: Final combined content is empty or only whitespace before return.")
         # return full_document_paragraph_text
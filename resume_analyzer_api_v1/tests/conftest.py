@@ -0,0 +1,43 @@
+"""Shared pytest setup: make the project root importable, and a stubbed LLM service."""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Extraction results for the stubbed LLM service to return
+EDUCATION = {"institution": "State University", "degree": "B.Sc. Computer Science",
+             "start_date": "01/06/2014", "end_date": "01/06/2018", "location": None}
+EXPERIENCE = {"company": "Acme Corp", "role": "Data Engineer",
+              "start_date": "01/01/2019", "end_date": "01/01/2024", "location": None}
+TOKEN_USAGE = {"total_tokens": 10, "prompt_tokens": 8, "completion_tokens": 2, "source": "usage_metadata"}
+
+
+@pytest.fixture
+def stub_llm_service(monkeypatch):
+    """
+    LLMService whose extract_with_llm makes no model call.
+
+    Each call is recorded in service.calls, with its arguments as attributes, and
+    answered by service.respond(call), which tests set to return (result, token_usage).
+    """
+    pytest.importorskip("langchain_google_genai")
+    from matchai.core import config
+    from matchai.core.llm_service import LLMService
+
+    monkeypatch.setattr(config, "EXTRACTION_CACHE_DIR", None)
+    service = LLMService(api_key="test-key", cache_dir=None)
+    service.calls = []
+
+    def extract_with_llm(pydantic_model, prompt_template, input_variables, input_data,
+                         model_name=None, on_section=None, **kwargs):
+        call = SimpleNamespace(pydantic_model=pydantic_model, prompt_template=prompt_template,
+                               input_data=input_data, model_name=model_name, on_section=on_section, **kwargs)
+        service.calls.append(call)
+        return service.respond(call)
+
+    monkeypatch.setattr(service, "extract_with_llm", extract_with_llm)
+    return service
@@ -0,0 +1,114 @@
+"""Tests for the model cascade's escalation rule (LLMService.extract_with_cascade and its validators)."""
+import pytest
+
+pytest.importorskip("langchain_google_genai")
+pytest.importorskip("PyPDF2")
+pytest.importorskip("docx2txt")
+pytest.importorskip("pandas")
+
+from conftest import EDUCATION, EXPERIENCE, TOKEN_USAGE
+from matchai.base_plugins.education_extractor import EducationExtractorPlugin
+from matchai.base_plugins.experience_extractor import ExperienceExtractorPlugin
+
+LITE_MODEL = "test-lite-model"
+MAIN_MODEL = "test-main-model"
+
+RESUME_TEXT = """Jane Doe
+Data Engineer
+
+Work Experience
+Acme Corp, Data Engineer, 01/2019 - Present, building batch and streaming pipelines
+
+Education
+B.Sc. Computer Science, State University, 2014 - 2018
+"""
+
+SKILLS_ONLY_TEXT = """Jane Doe
+Skills
+Python, SQL, Spark, Airflow and dbt for analytics engineering
+"""
+
+@pytest.fixture
+def service(stub_llm_service):
+    """LLM service whose calls return the canned result of the requested model."""
+    service = stub_llm_service
+    service.model_name = MAIN_MODEL
+    service.results = {}
+
+    def respond(call):
+        result = service.results[call.model_name]
+        if result is None:
+            return {}, {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "source": "error"}
+        return result, dict(TOKEN_USAGE)
+
+    service.respond = respond
+    return service
+
+
+def called_models(service):
+    return [call.model_name for call in service.calls]
+
+
+def make_plugin(plugin_class, service):
+    plugin = plugin_class(service)
+    plugin.CASCADE_MODELS = (LITE_MODEL,)
+    return plugin
+
+
+@pytest.mark.unit
+class TestCascadeEscalation:
+
+    def test_valid_lite_result_is_kept(self, service):
+        service.results = {LITE_MODEL: {"educations": [EDUCATION]}}
+        result, token_usage = make_plugin(EducationExtractorPlugin, service).extract(RESUME_TEXT)
+
+        assert called_models(service) == [LITE_MODEL]
+        assert result["educations"][0]["institution"] == "State University"
+        assert token_usage["cascade_model"] == LITE_MODEL
+        assert token_usage["cascade_tier"] == 0
+
+    def test_empty_education_escalates_when_resume_has_education_section(self, service):
+        service.results = {LITE_MODEL: {"educations": []}, MAIN_MODEL: {"educations": [EDUCATION]}}
+        result, token_usage = make_plugin(EducationExtractorPlugin, service).extract(RESUME_TEXT)
+
+        assert called_models(service) == [LITE_MODEL, MAIN_MODEL]
+        assert result["educations"][0]["degree"] == "B.Sc. Computer Science"
+        assert token_usage["cascade_model"] == MAIN_MODEL
+        assert token_usage["cascade_attempts"] == 2
+        assert token_usage["total_tokens"] == 20
+
+    def test_degenerate_education_entries_escalate(self, service):
+        degenerate = {"institution": "", "degree": "", "start_date": "", "end_date": ""}
+        service.results = {LITE_MODEL: {"educations": [degenerate]}, MAIN_MODEL: {"educations": [EDUCATION]}}
+        make_plugin(EducationExtractorPlugin, service).extract(RESUME_TEXT)
+
+        assert called_models(service) == [LITE_MODEL, MAIN_MODEL]
+
+    def test_empty_education_is_kept_without_education_section(self, service):
+        service.results = {LITE_MODEL: {"educations": []}}
+        result, token_usage = make_plugin(EducationExtractorPlugin, service).extract(SKILLS_ONLY_TEXT)
+
+        assert called_models(service) == [LITE_MODEL]
+        assert result == {"educations": []}
+
+    def test_empty_experience_escalates_when_resume_has_experience_section(self, service):
+        service.results = {LITE_MODEL: {"work_experiences": []},
+                           MAIN_MODEL: {"work_experiences": [EXPERIENCE]}}
+        result, token_usage = make_plugin(ExperienceExtractorPlugin, service).extract(RESUME_TEXT)
+
+        assert called_models(service) == [LITE_MODEL, MAIN_MODEL]
+        assert result["work_experiences"][0]["company"] == "Acme Corp"
+        assert token_usage["cascade_tier"] == 1
+
+    def test_failed_call_escalates(self, service):
+        service.results = {LITE_MODEL: None, MAIN_MODEL: {"work_experiences": [EXPERIENCE]}}
+        make_plugin(ExperienceExtractorPlugin, service).extract(RESUME_TEXT)
+
+        assert called_models(service) == [LITE_MODEL, MAIN_MODEL]
+
+    def test_last_tier_result_is_returned_even_if_invalid(self, service):
+        service.results = {LITE_MODEL: {"educations": []}, MAIN_MODEL: {"educations": []}}
+        result, token_usage = make_plugin(EducationExtractorPlugin, service).extract(RESUME_TEXT)
+
+        assert result == {"educations": []}
+        assert token_usage["cascade_model"] == MAIN_MODEL
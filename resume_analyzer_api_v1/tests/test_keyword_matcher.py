@@ -0,0 +1,120 @@
+"""Tests for the keyword matcher's tokenization cache and fuzzy matching."""
+import random
+import re
+import string
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("spacy")
+pytest.importorskip("nltk")
+pytest.importorskip("rapidfuzz")
+
+import rapidfuzz.fuzz
+
+from matchai.custom_plugins import keyword_matcher
+from matchai.custom_plugins.keyword_matcher import KeywordMatcherPlugin
+
+
+@pytest.fixture
+def tokenize_cache(monkeypatch):
+    """An empty, private tokenization cache."""
+    cache = keyword_matcher.OrderedDict()
+    monkeypatch.setattr(keyword_matcher, "_TOKENIZE_CACHE", cache)
+    return cache
+
+
+@pytest.mark.unit
+class TestTokenizeCache:
+
+    def test_same_text_is_tokenized_once(self, tokenize_cache, monkeypatch):
+        calls = []
+        tokenize_text = keyword_matcher._tokenize_text
+        monkeypatch.setattr(keyword_matcher, "_tokenize_text",
+                            lambda nlp, text: calls.append(text) or tokenize_text(nlp, text))
+
+        first = keyword_matcher._tokenize(None, "python and java developer")
+        second = keyword_matcher._tokenize(None, "python and java developer")
+
+        assert second is first
+        assert calls == ["python and java developer"]
+        assert first[1] == frozenset({"python", "and", "java", "developer"})
+
+    def test_keys_hold_a_digest_not_the_text(self, tokenize_cache):
+        text = "resume text " * 1000
+        keyword_matcher._tokenize(None, text)
+
+        (used_nlp, digest), = tokenize_cache
+        assert used_nlp is False
+        assert isinstance(digest, bytes) and len(digest) == 32
+
+    def test_cache_keeps_only_the_most_recent_texts(self, tokenize_cache):
+        size = keyword_matcher._TOKENIZE_CACHE_SIZE
+        for i in range(size + 3):
+            keyword_matcher._tokenize(None, f"resume number {i}")
+
+        assert len(tokenize_cache) == size
+
+
+def reference_fuzzy_match(forms, text_lower, threshold):
+    """The fuzzy match as scored before cdist: each form against each token in text order."""
+    tokens = re.findall(r'\b\w+\b', text_lower)
+    for form in forms:
+        for token in tokens:
+            if rapidfuzz.fuzz.ratio(form, token) >= threshold:
+                return token
+    return None
+
+
+def misspell(word, rng):
+    """Apply one random deletion, insertion or substitution to word."""
+    i = rng.randrange(len(word))
+    edit = rng.choice(("delete", "insert", "substitute"))
+    if edit == "delete":
+        return word[:i] + word[i + 1:]
+    letter = rng.choice(string.ascii_lowercase)
+    return word[:i] + letter + word[i + (edit == "substitute"):]
+
+
+@pytest.fixture
+def fuzzy_only_matcher():
+    """Matcher with lemmatized and WordNet matching off, so unmatched keywords reach fuzzy matching."""
+    words = ["kubernetes", "terraform", "postgresql", "elasticsearch", "javascript",
+             "typescript", "microservices", "kafka", "airflow", "snowflake"]
+    config = {"technical_skills": [
+        {"keyword": word, "weight": 1, "variations": [word[:-1] + "s", word.upper()]} for word in words
+    ]}
+    matcher = KeywordMatcherPlugin(keywords_config=config)
+    matcher.nlp = None
+    matcher.initialize()
+    matcher.wordnet_synonym_cache = {}
+    return matcher
+
+
+@pytest.mark.unit
+class TestFuzzyMatchEquivalence:
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_cdist_matches_per_token_scoring(self, fuzzy_only_matcher, seed, tokenize_cache):
+        rng = random.Random(seed)
+        keywords = fuzzy_only_matcher.keywords["technical_skills"]
+        # Misspelled keywords and unrelated words, so no keyword matches exactly
+        words = [misspell(kw["keyword"], rng) for kw in keywords if rng.random() < 0.7]
+        words += ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12))) for _ in range(30)]
+        rng.shuffle(words)
+        text = " ".join(words)
+
+        result = fuzzy_only_matcher.process_resume(SimpleNamespace(file_name="resume.pdf"), text)
+
+        matched = {detail.keyword: detail for detail in result.matched_details["technical_skills"]}
+        for kw in keywords:
+            forms = [kw["keyword"].lower(), *(v.lower() for v in kw["variations"])]
+            if any(re.search(r'\b' + re.escape(form) + r'\b', text) for form in forms):
+                continue
+            expected = reference_fuzzy_match(forms, text, fuzzy_only_matcher.FUZZY_THRESHOLD)
+            detail = matched.get(kw["keyword"])
+            if expected is None:
+                assert detail is None, kw["keyword"]
+            else:
+                assert detail.match_type == "fuzzy_match"
+                assert detail.matched_form_in_text == expected
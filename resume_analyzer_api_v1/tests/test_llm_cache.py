@@ -0,0 +1,37 @@
+"""Tests for the persistent extraction cache."""
+import os
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from matchai.core.llm_cache import ExtractionCache
+
+
+@pytest.mark.unit
+class TestExtractionCache:
+
+    def test_round_trip(self, tmp_path):
+        cache = ExtractionCache(str(tmp_path / "cache"))
+        cache.put("abc123", b'{"skills": []}')
+
+        assert cache.get("abc123") == b'{"skills": []}'
+        assert os.listdir(tmp_path / "cache") == ["abc123.json"]
+
+    def test_missing_entry_is_a_miss(self, tmp_path):
+        assert ExtractionCache(str(tmp_path)).get("abc123") is None
+
+    def test_entries_survive_a_new_instance(self, tmp_path):
+        ExtractionCache(str(tmp_path), suffix=".txt").put("abc123", b"resume text")
+        assert ExtractionCache(str(tmp_path), suffix=".txt").get("abc123") == b"resume text"
+
+    def test_put_replaces_and_delete_removes(self, tmp_path):
+        cache = ExtractionCache(str(tmp_path))
+        cache.put("abc123", b"1")
+        cache.put("abc123", b"2")
+        assert cache.get("abc123") == b"2"
+
+        cache.delete("abc123")
+        cache.delete("abc123")
+        assert cache.get("abc123") is None
+        assert os.listdir(tmp_path) == []
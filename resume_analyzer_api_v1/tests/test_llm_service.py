@@ -0,0 +1,168 @@
+"""Tests for LLMService's feedback-correction loop and response cache keys."""
+import time
+
+import pytest
+
+pytest.importorskip("langchain_google_genai")
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from matchai.core import config
+from matchai.core import llm_service
+from matchai.core.llm_cache import ExtractionCache
+from matchai.core.llm_service import LLMService
+from matchai.models import ResumeEducation
+
+PROMPT_TEMPLATE = """Extract the education entries.
+{format_instructions}
+Text:
+{text}
+"""
+
+VALID_RESPONSE = '{"educations": []}'
+
+
+class FakeLLM:
+    """Chat model returning the given responses in turn and recording the messages it was sent."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def invoke(self, messages, config=None):
+        self.calls.append(list(messages))
+        return AIMessage(content=self.responses.pop(0))
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(config, "STREAM_LLM_RESPONSES", False)
+    monkeypatch.setattr(config, "STRICT_OUTPUT_VALIDATION", False)
+    monkeypatch.setattr(config, "LLM_FEEDBACK_RETRIES", 2)
+    monkeypatch.setattr(config, "EXTRACTION_CACHE_DIR", None)
+
+    def no_sleep(seconds):
+        raise AssertionError("corrections must be requested without sleeping")
+
+    monkeypatch.setattr(time, "sleep", no_sleep)
+    return LLMService(api_key="test-key", cache_dir=None)
+
+
+def invoke(service, llm, monkeypatch):
+    monkeypatch.setattr(service, "_llm_for", lambda model_name=None: llm)
+    return service._invoke_with_feedback(ResumeEducation, PROMPT_TEMPLATE, ["text", "format_instructions"],
+                                         {"text": "B.Sc. Physics"}, {})
+
+
+@pytest.mark.unit
+class TestFeedbackCorrection:
+
+    def test_valid_response_needs_one_call(self, service, monkeypatch):
+        llm = FakeLLM([VALID_RESPONSE])
+        assert invoke(service, llm, monkeypatch) == {"educations": []}
+        assert len(llm.calls) == 1
+
+    def test_unusable_response_is_corrected_in_the_same_conversation(self, service, monkeypatch):
+        llm = FakeLLM(["not json at all", VALID_RESPONSE])
+        assert invoke(service, llm, monkeypatch) == {"educations": []}
+
+        first, second = llm.calls
+        assert second[:len(first)] == first
+        assert second[len(first)].content == "not json at all"
+        assert isinstance(second[-1], HumanMessage)
+        assert second[-1].content.startswith("Your previous response could not be used:")
+
+    def test_non_object_response_is_corrected(self, service, monkeypatch):
+        llm = FakeLLM(["[1, 2, 3]", VALID_RESPONSE])
+        assert invoke(service, llm, monkeypatch) == {"educations": []}
+        assert "expected a JSON object, got list" in llm.calls[1][-1].content
+
+    def test_invalid_output_is_corrected_with_strict_validation(self, service, monkeypatch):
+        monkeypatch.setattr(config, "STRICT_OUTPUT_VALIDATION", True)
+        llm = FakeLLM(['{"educations": [{"degree": "B.Sc."}]}', VALID_RESPONSE])
+        assert invoke(service, llm, monkeypatch) == {"educations": []}
+        assert len(llm.calls) == 2
+
+    def test_gives_up_after_the_configured_retries(self, service, monkeypatch):
+        llm = FakeLLM(["bad"] * 3)
+        with pytest.raises(ValueError):
+            invoke(service, llm, monkeypatch)
+        assert len(llm.calls) == 3
+
+
+@pytest.fixture
+def cached_service(service, monkeypatch):
+    """Service whose chat model answers every call with a valid response, counting the calls."""
+    llm = FakeLLM([])
+    llm.invoke = lambda messages, config=None: llm.calls.append(messages) or AIMessage(content=VALID_RESPONSE)
+    monkeypatch.setattr(service, "_llm_for", lambda model_name=None: llm)
+    service.fake_llm = llm
+    return service
+
+
+def extract(service, text="B.Sc. Physics", template=PROMPT_TEMPLATE, model_name=None):
+    return service.extract_with_llm(ResumeEducation, template, ["text", "format_instructions"],
+                                    {"text": text}, model_name=model_name)
+
+
+@pytest.mark.unit
+class TestResponseCacheKeys:
+
+    def test_repeat_extraction_is_served_from_the_cache(self, cached_service):
+        result, token_usage = extract(cached_service)
+        cached_result, cached_usage = extract(cached_service, text="B.Sc.   Physics\n")
+
+        assert cached_result == result
+        assert cached_usage["cache_hit"] and cached_usage["total_tokens"] == 0
+        assert len(cached_service.fake_llm.calls) == 1
+
+    @pytest.mark.parametrize("change", [
+        {"text": "M.Sc. Physics"},
+        {"template": PROMPT_TEMPLATE + "Use the original spelling.\n"},
+        {"model_name": "other-model"},
+    ])
+    def test_changed_input_template_or_model_is_a_miss(self, cached_service, change):
+        extract(cached_service)
+        _, token_usage = extract(cached_service, **change)
+
+        assert not token_usage["cache_hit"]
+        assert len(cached_service.fake_llm.calls) == 2
+
+
+@pytest.mark.unit
+class TestExtractionCacheKeys:
+
+    def test_result_is_served_from_disk_by_a_new_service(self, cached_service, tmp_path, monkeypatch):
+        cached_service.extraction_cache = ExtractionCache(str(tmp_path))
+        result, _ = extract(cached_service)
+
+        restarted = LLMService(api_key="test-key", cache_dir=str(tmp_path))
+        monkeypatch.setattr(restarted, "_llm_for", lambda model_name=None: pytest.fail("the model must not be called"))
+        cached_result, token_usage = extract(restarted)
+
+        assert cached_result == result
+        assert token_usage["cache_hit"]
+
+    def test_schema_change_is_a_miss(self, cached_service, monkeypatch):
+        extract(cached_service)
+        format_instructions = llm_service._get_format_instructions
+        monkeypatch.setattr(llm_service, "_get_format_instructions",
+                            lambda model: format_instructions(model) + " Dates are ISO 8601.")
+        _, token_usage = extract(cached_service)
+
+        assert not token_usage["cache_hit"]
+        assert len(cached_service.fake_llm.calls) == 2
+
+    @pytest.mark.parametrize("entry", [b"not json", b"[1, 2]", b'{"educations": "none"}'])
+    def test_invalid_disk_entry_is_removed_and_refetched(self, cached_service, tmp_path, entry):
+        cached_service.extraction_cache = ExtractionCache(str(tmp_path))
+        extract(cached_service)
+        (entry_file,) = tmp_path.iterdir()
+        entry_file.write_bytes(entry)
+        cached_service.response_cache.clear()
+
+        result, token_usage = extract(cached_service)
+
+        assert result == {"educations": []}
+        assert not token_usage["cache_hit"]
+        assert entry_file.read_bytes() != entry
@@ -0,0 +1,58 @@
+"""Tests for setup_logging's queue listener and lazily opened log file."""
+import atexit
+import logging
+import threading
+
+import pytest
+
+pytest.importorskip("PyPDF2")
+pytest.importorskip("docx2txt")
+pytest.importorskip("pandas")
+
+from matchai.core import config
+from matchai.core.utils import logging_utils
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Point setup_logging at a temporary log file and restore the root logger afterwards."""
+    monkeypatch.setattr(config, "LOG_FILE", str(tmp_path / "logs" / "app.log"))
+    monkeypatch.setattr(logging_utils, "_listener", None)
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield tmp_path / "logs" / "app.log"
+    listener = logging_utils._listener
+    if listener is not None:
+        listener.stop()
+        atexit.unregister(listener.stop)
+    root.handlers, root.level = saved_handlers, saved_level
+
+
+def setup_logging():
+    # pytest's own capture handlers would make logging.basicConfig a no-op
+    logging.getLogger().handlers = []
+    logging_utils.setup_logging()
+
+
+@pytest.mark.unit
+class TestSetupLogging:
+
+    def test_repeated_setup_starts_one_listener(self, log_file):
+        threads_before = threading.active_count()
+        setup_logging()
+        listener = logging_utils._listener
+        logging_utils.setup_logging()
+        logging_utils.setup_logging()
+
+        assert logging_utils._listener is listener
+        assert threading.active_count() == threads_before + 1
+
+    def test_log_file_is_opened_on_first_record(self, log_file):
+        setup_logging()
+        # The listener opens the file when it writes a record, not setup_logging itself
+        assert logging_utils._listener.handlers[0].delay
+
+        logging.warning("first record")
+        logging_utils._listener.stop()
+        logging_utils._listener.start()
+        assert "first record" in log_file.read_text()
@@ -0,0 +1,85 @@
+"""Tests for PluginManager.extract_batched, the single-call extraction across extractor plugins."""
+import pytest
+
+pytest.importorskip("langchain_google_genai")
+pytest.importorskip("PyPDF2")
+pytest.importorskip("docx2txt")
+pytest.importorskip("pandas")
+
+from conftest import EDUCATION, EXPERIENCE, TOKEN_USAGE
+from matchai.base_plugins.plugin_manager import PluginManager
+from matchai.base_plugins.education_extractor import EducationExtractorPlugin
+from matchai.base_plugins.experience_extractor import ExperienceExtractorPlugin
+from matchai.base_plugins.yoe_extractor import YoeExtractorPlugin
+
+@pytest.fixture
+def manager(stub_llm_service):
+    """Manager with the education, experience and YoE extractors over a stubbed LLM call."""
+    service = stub_llm_service
+    service.sections = {}
+
+    def respond(call):
+        for name, value in service.sections.items():
+            call.on_section(name, value)
+        return dict(service.sections), dict(TOKEN_USAGE)
+
+    service.respond = respond
+
+    manager = PluginManager(llm_service=service)
+    plugins = [EducationExtractorPlugin(service), ExperienceExtractorPlugin(service), YoeExtractorPlugin(service)]
+    for plugin in plugins:
+        plugin.initialize()
+    manager.plugins = {plugin.metadata.name: plugin for plugin in plugins}
+    return manager
+
+
+@pytest.mark.unit
+class TestExtractBatched:
+
+    def test_one_call_covers_every_text_extractor(self, manager):
+        service = manager.llm_service
+        service.sections = {
+            "education_extractor": {"educations": [EDUCATION]},
+            "experience_extractor": {"work_experiences": [EXPERIENCE], "total_experience_years": 5},
+        }
+
+        results, token_usage = manager.extract_batched("resume text", {"today": "01/01/2025"})
+
+        assert len(service.calls) == 1
+        call = service.calls[0]
+        assert set(call.pydantic_model.model_fields) == {"education_extractor", "experience_extractor"}
+        assert EducationExtractorPlugin.PROMPT_INSTRUCTIONS in call.prompt_template
+        assert ExperienceExtractorPlugin.PROMPT_INSTRUCTIONS in call.prompt_template
+        assert call.input_data["today"] == "01/01/2025"
+
+        assert results["education_extractor"]["educations"][0]["institution"] == "State University"
+        assert results["experience_extractor"]["work_experiences"][0]["company"] == "Acme Corp"
+        # YoE runs on the experience section as soon as it is processed
+        assert results["yoe_extractor"]["YoE"] != "Unknown"
+        assert token_usage["extractor"] == "batched"
+
+    def test_missing_sections_get_empty_results(self, manager):
+        manager.llm_service.sections = {"education_extractor": {"educations": [EDUCATION]}}
+
+        results, _ = manager.extract_batched("resume text")
+
+        assert results["experience_extractor"] == {"work_experiences": []}
+        assert results["yoe_extractor"]["YoE"] == "Unknown"
+
+    def test_changing_the_plugins_rebuilds_the_batched_prompt(self, manager):
+        manager.extract_batched("resume text")
+        education = manager.get_plugin("education_extractor")
+        manager.plugins = {"education_extractor": education}
+
+        manager.extract_batched("resume text")
+
+        call = manager.llm_service.calls[-1]
+        assert set(call.pydantic_model.model_fields) == {"education_extractor"}
+        assert ExperienceExtractorPlugin.PROMPT_INSTRUCTIONS not in call.prompt_template
+
+    def test_clearing_the_plugins_clears_the_listing(self, manager):
+        assert len(manager.list_plugins()) == 3
+        manager.plugins = {}
+
+        assert manager.list_plugins() == []
+        assert manager.extract_batched("resume text") == ({}, {})
@@ -0,0 +1,69 @@
+"""Tests for the in-process LLM response cache and its keys."""
+import pytest
+
+pytest.importorskip("dotenv")
+
+from matchai.core import response_cache
+from matchai.core.response_cache import ResponseCache
+
+
+@pytest.mark.unit
+class TestMakeKey:
+
+    def test_same_parts_give_same_key(self):
+        assert ResponseCache.make_key("model", "Schema", "text") == ResponseCache.make_key("model", "Schema", "text")
+
+    def test_whitespace_differences_share_a_key(self):
+        assert ResponseCache.make_key("John  Doe\n\nPython") == ResponseCache.make_key("John Doe Python")
+
+    @pytest.mark.parametrize("other", [
+        ("other-model", "Schema", "text"),
+        ("model", "OtherSchema", "text"),
+        ("model", "Schema", "other text"),
+        ("model", "Schema"),
+    ])
+    def test_any_changed_part_changes_the_key(self, other):
+        assert ResponseCache.make_key("model", "Schema", "text") != ResponseCache.make_key(*other)
+
+    def test_part_boundaries_are_part_of_the_key(self):
+        # Resume text must not be able to spill into the neighbouring part
+        assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+        assert ResponseCache.make_key("a\x1fb") != ResponseCache.make_key("a", "b")
+
+
+@pytest.mark.unit
+class TestResponseCache:
+
+    def test_values_are_copied_in_and_out(self):
+        cache = ResponseCache(max_size=4, ttl_seconds=60)
+        value = {"skills": ["python"]}
+        cache.put("key", value)
+        value["skills"].append("java")
+        cache.get("key")["skills"].append("go")
+
+        assert cache.get("key") == {"skills": ["python"]}
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(max_size=2, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expired_entry_is_a_miss(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+        cache = ResponseCache(max_size=4, ttl_seconds=60)
+        cache.put("key", 1)
+        now[0] += 61
+
+        assert cache.get("key") is None
+
+    def test_zero_size_disables_the_cache(self):
+        cache = ResponseCache(max_size=0, ttl_seconds=60)
+        cache.put("key", 1)
+        assert cache.get("key") is None
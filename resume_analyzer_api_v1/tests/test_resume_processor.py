@@ -0,0 +1,161 @@
+"""Tests for PluginResumeProcessor's resume text cache and its skipping of processed resumes."""
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("PyPDF2")
+pytest.importorskip("docx2txt")
+pytest.importorskip("pandas")
+
+from matchai.core import config
+from matchai.core.resume_processor import PluginResumeProcessor
+from matchai.core.utils import file_utils
+
+
+class FakePlugin:
+    """Plugin exposing only what the processor's fingerprint reads."""
+
+    def __init__(self, template):
+        self.metadata = SimpleNamespace(version="1.0.0")
+        self.template = template
+
+    def get_prompt_template(self):
+        return self.template
+
+
+class FakeManager:
+    """Plugin manager without extractors; the tests stub process_resume."""
+
+    def __init__(self, template="Extract the profile.\n{text}"):
+        self.revision = 0
+        self.llm_service = SimpleNamespace(model_name="test-model")
+        self.plugins = {"profile_extractor": FakePlugin(template)}
+
+    def get_plugin(self, name):
+        return None
+
+    def get_extractor_plugins(self):
+        return {}
+
+    def get_plugins_by_category(self, category):
+        return []
+
+
+class FakeResume:
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.file_name = os.path.basename(file_path)
+        self.token_usage = None
+
+    def to_dict(self):
+        return {"file_name": self.file_name}
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "SKIP_PROCESSED_RESUMES", True)
+    resume_dir = tmp_path / "resumes"
+    resume_dir.mkdir()
+    (resume_dir / "alice.pdf").write_bytes(b"%PDF alice")
+
+    processor = PluginResumeProcessor(
+        resume_dir=str(resume_dir), output_dir=str(tmp_path / "results"),
+        log_dir=str(tmp_path / "logs"), plugin_manager=FakeManager()
+    )
+    processor.calls = []
+
+    def process_resume(file_path, fused=None, data=None):
+        processor.calls.append(os.path.basename(file_path))
+        return FakeResume(file_path)
+
+    monkeypatch.setattr(processor, "process_resume", process_resume)
+    return processor
+
+
+@pytest.mark.unit
+class TestSkipProcessedResumes:
+
+    def test_second_run_skips_processed_resume(self, processor):
+        assert processor.process_all_resumes() == (1, 0)
+        assert processor.process_all_resumes() == (1, 0)
+        assert processor.calls == ["alice.pdf"]
+
+    def test_missing_output_is_reprocessed(self, processor):
+        processor.process_all_resumes()
+        os.remove(os.path.join(processor.output_dir, "alice.json"))
+        processor.process_all_resumes()
+        assert processor.calls == ["alice.pdf", "alice.pdf"]
+
+    def test_failed_write_is_not_recorded(self, processor):
+        output_file = os.path.join(processor.output_dir, "alice.json")
+        os.mkdir(output_file)  # opening a directory for writing fails
+        processor.process_all_resumes()
+        os.rmdir(output_file)
+        with open(output_file, "w") as f:
+            f.write('{"file_name": "stale"}')
+
+        processor.process_all_resumes()
+        assert processor.calls == ["alice.pdf", "alice.pdf"]
+
+    def test_copy_under_another_name_gets_its_own_output(self, processor):
+        processor.process_all_resumes()
+        os.link(os.path.join(processor.resume_dir, "alice.pdf"), os.path.join(processor.resume_dir, "copy.pdf"))
+        processor.process_all_resumes()
+        assert processor.calls == ["alice.pdf", "copy.pdf"]
+        assert os.path.exists(os.path.join(processor.output_dir, "copy.json"))
+
+    def test_changed_prompt_reprocesses(self, processor):
+        processor.process_all_resumes()
+        manager = processor.plugin_manager
+        manager.plugins["profile_extractor"].template = "Extract the candidate's profile.\n{text}"
+        manager.revision += 1
+        processor.process_all_resumes()
+        assert processor.calls == ["alice.pdf", "alice.pdf"]
+
+    def test_changed_model_reprocesses(self, processor, monkeypatch):
+        processor.process_all_resumes()
+        monkeypatch.setattr(config, "CASCADE_LLM_MODEL", "another-cheap-model")
+        processor.plugin_manager.revision += 1
+        processor.process_all_resumes()
+        assert processor.calls == ["alice.pdf", "alice.pdf"]
+
+
+@pytest.fixture
+def text_processor(tmp_path, monkeypatch):
+    """Processor with a text cache whose file parser records the files it parses."""
+    monkeypatch.setattr(config, "EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    processor = PluginResumeProcessor(
+        resume_dir=str(tmp_path), output_dir=str(tmp_path / "results"),
+        log_dir=str(tmp_path / "logs"), plugin_manager=FakeManager()
+    )
+    processor.parsed = []
+
+    def read_file(file_path, data=None):
+        processor.parsed.append(os.path.basename(file_path))
+        if data.startswith(b"invalid"):
+            raise ValueError("not a resume")
+        return data.decode("utf-8")
+
+    monkeypatch.setattr(file_utils, "read_file", read_file)
+    return processor
+
+
+@pytest.mark.unit
+class TestResumeTextCache:
+
+    def test_identical_content_is_parsed_once(self, text_processor):
+        assert text_processor._read_text("/in/alice.pdf", b"Alice, Python") == "Alice, Python"
+        assert text_processor._read_text("/other/alice-copy.pdf", b"Alice, Python") == "Alice, Python"
+        assert text_processor.parsed == ["alice.pdf"]
+
+    def test_key_includes_the_file_type(self, text_processor):
+        text_processor._read_text("/in/alice.pdf", b"Alice, Python")
+        text_processor._read_text("/in/alice.docx", b"Alice, Python")
+        assert text_processor.parsed == ["alice.pdf", "alice.docx"]
+
+    def test_invalid_files_are_not_cached(self, text_processor):
+        assert text_processor._read_text("/in/bad.pdf", b"invalid") is None
+        assert text_processor._read_text("/in/bad.pdf", b"invalid") is None
+        assert text_processor.parsed == ["bad.pdf", "bad.pdf"]
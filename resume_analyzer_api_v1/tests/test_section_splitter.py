@@ -0,0 +1,31 @@
+"""Tests for isolating a resume section by its heading."""
+import pytest
+
+pytest.importorskip("PyPDF2")
+pytest.importorskip("docx2txt")
+pytest.importorskip("pandas")
+
+from matchai.core.utils.section_splitter import extract_section, EDUCATION_HEADINGS, SKILL_HEADINGS
+
+SKILLS_BLOCK = """Technical Skills
+Cloud: AWS, Azure, GCP, Kubernetes, Docker
+Languages: Python, Java, Go
+Frameworks: Django, Flask, Spring Boot"""
+
+
+@pytest.mark.unit
+class TestExtractSection:
+
+    def test_label_value_lines_stay_in_the_section(self):
+        text = "John Doe\nSummary\nBackend engineer.\n" + SKILLS_BLOCK + "\nEducation\nB.Sc. Computer Science"
+
+        assert extract_section(text, SKILL_HEADINGS) == SKILLS_BLOCK
+
+    def test_heading_with_trailing_colon_ends_the_section(self):
+        text = SKILLS_BLOCK + "\nEDUCATION:\nB.Sc. Computer Science, State University"
+
+        assert extract_section(text, SKILL_HEADINGS) == SKILLS_BLOCK
+        assert extract_section(text, EDUCATION_HEADINGS) == "EDUCATION:\nB.Sc. Computer Science, State University"
+
+    def test_missing_section_is_none(self):
+        assert extract_section("John Doe\nPython developer with ten years of experience") is None
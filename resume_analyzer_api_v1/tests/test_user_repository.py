@@ -0,0 +1,55 @@
+"""Tests for the Firebase UID short-circuit in UserRepository.get_user_by_firebase_uid."""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from database import user_repository
+from database.user_repository import UserRepository
+
+
+class FakeSession:
+    """Session whose queries return the given rows in turn."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.queries = 0
+
+    def execute(self, query, params):
+        self.queries += 1
+        row = self.rows.pop(0)
+        return SimpleNamespace(fetchone=lambda: row)
+
+    def close(self):
+        pass
+
+
+@pytest.mark.unit
+class TestFirebaseUidShortCircuit:
+
+    @pytest.mark.parametrize("uid", ["a", "custom-uid-1", "Kx9aQ2mN7pR4sT1vW3yZ5bC8dE0f", "x" * 128])
+    def test_accepts_any_non_empty_ascii_uid_up_to_128_chars(self, uid):
+        assert UserRepository._is_plausible_firebase_uid(uid)
+
+    @pytest.mark.parametrize("uid", ["", "x" * 129, "üid", None, 123])
+    def test_rejects_malformed_uid(self, uid):
+        assert not UserRepository._is_plausible_firebase_uid(uid)
+
+    def test_malformed_uid_does_not_query_database(self, monkeypatch):
+        def no_session():
+            raise AssertionError("the database must not be queried")
+
+        monkeypatch.setattr(user_repository, "get_db_session", no_session)
+        assert UserRepository().get_user_by_firebase_uid("") is None
+
+    def test_missing_uid_is_looked_up_again(self, monkeypatch):
+        # A user registered by another worker after a failed login must be found right away
+        row = SimpleNamespace(id=1, firebase_uid="uid-1", email="a@b.c", organization_id="org", is_active=True)
+        session = FakeSession([None, row])
+        monkeypatch.setattr(user_repository, "get_db_session", lambda: session)
+
+        repository = UserRepository()
+        assert repository.get_user_by_firebase_uid("uid-1") is None
+        assert repository.get_user_by_firebase_uid("uid-1")["id"] == 1
+        assert session.queries == 2